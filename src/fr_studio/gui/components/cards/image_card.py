@@ -7,9 +7,8 @@
 from datetime import datetime
 from pathlib import Path
 
-from PIL import Image
 from PySide6.QtCore import QEvent, Qt, Signal
-from PySide6.QtGui import QCursor, QEnterEvent, QMouseEvent, QPixmap
+from PySide6.QtGui import QCursor, QEnterEvent, QImage, QMouseEvent, QPixmap
 from PySide6.QtWidgets import (
     QFrame,
     QHBoxLayout,
@@ -19,6 +18,8 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from ...services.thumbnail_cache import get_cached_thumbnail
+
 
 def _format_time_ago(dt: datetime) -> str:
     """日時を「X ago」形式にフォーマット."""
@@ -59,6 +60,7 @@ class ImageCard(QFrame):
 
     CARD_WIDTH = 220
     CARD_HEIGHT = 280  # サムネイル(220x180) + 情報エリア
+    THUMBNAIL_HEIGHT = 180
 
     def __init__(
         self,
@@ -67,6 +69,7 @@ class ImageCard(QFrame):
         filepath: str,
         updated_time: datetime,
         parent: QWidget | None = None,
+        load_thumbnail: bool = True,
     ) -> None:
         """初期化.
 
@@ -76,18 +79,21 @@ class ImageCard(QFrame):
             filepath: 画像ファイルパス
             updated_time: 更新日時
             parent: 親ウィジェット
+            load_thumbnail: Falseならサムネイルを読み込まずプレースホルダーで表示
+                （set_thumbnail_imageで後から設定する）
         """
         super().__init__(parent)
         self._image_id = image_id
         self._filepath = filepath
         self._selected = False
-        self._setup_ui(name, filepath, updated_time)
+        self._setup_ui(name, filepath, updated_time, load_thumbnail)
 
     def _setup_ui(
         self,
         name: str,
         filepath: str,
         updated_time: datetime,
+        load_thumbnail: bool,
     ) -> None:
         self.setFrameShape(QFrame.Shape.StyledPanel)
         self.setFixedSize(self.CARD_WIDTH, self.CARD_HEIGHT)
@@ -119,16 +125,8 @@ class ImageCard(QFrame):
         self._thumbnail.setScaledContents(False)
 
         # 画像読み込み
-        if filepath and Path(filepath).exists():
-            pixmap = QPixmap(filepath)
-            if not pixmap.isNull():
-                scaled = pixmap.scaled(
-                    self.CARD_WIDTH,
-                    180,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
-                self._thumbnail.setPixmap(scaled)
+        if load_thumbnail:
+            self._load_thumbnail(filepath)
 
         thumb_layout.addWidget(self._thumbnail)
 
@@ -220,8 +218,8 @@ class ImageCard(QFrame):
         info_layout.setSpacing(4)
 
         # ファイル名
-        name_label = QLabel(name)
-        name_label.setStyleSheet(
+        self._name_label = QLabel(name)
+        self._name_label.setStyleSheet(
             """
             font-size: 12px;
             font-weight: bold;
@@ -229,16 +227,16 @@ class ImageCard(QFrame):
             background: transparent;
         """
         )
-        name_label.setWordWrap(True)
-        name_label.setMaximumHeight(32)
-        info_layout.addWidget(name_label)
+        self._name_label.setWordWrap(True)
+        self._name_label.setMaximumHeight(32)
+        info_layout.addWidget(self._name_label)
 
         # 更新日時
-        time_label = QLabel(_format_time_ago(updated_time))
-        time_label.setStyleSheet(
+        self._time_label = QLabel(_format_time_ago(updated_time))
+        self._time_label.setStyleSheet(
             "color: #666; font-size: 10px; background: transparent;"
         )
-        info_layout.addWidget(time_label)
+        info_layout.addWidget(self._time_label)
 
         layout.addWidget(info_container)
 
@@ -312,19 +310,42 @@ class ImageCard(QFrame):
         """画像IDを取得."""
         return self._image_id
 
+    def update_info(self, name: str, updated_time: datetime) -> None:
+        """ファイル名と更新日時の表示を更新（ウィジェットを作り直さずに再利用する）."""
+        self._name_label.setText(name)
+        self._time_label.setText(_format_time_ago(updated_time))
+
     def update_thumbnail(self, filepath: str) -> None:
         """サムネイル画像を更新."""
         if filepath and Path(filepath).exists():
             self._filepath = filepath
-            pixmap = QPixmap(filepath)
-            if not pixmap.isNull():
-                scaled = pixmap.scaled(
-                    self.CARD_WIDTH,
-                    180,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
-                self._thumbnail.setPixmap(scaled)
+            self._load_thumbnail(filepath)
+
+    def thumbnail_size(self) -> tuple[int, int]:
+        """サムネイルの表示サイズ（物理ピクセル）を取得.
+
+        HiDPIでQtが描画時に拡大しないよう、物理ピクセルのサイズで作成する。
+        """
+        device_pixel_ratio = self.devicePixelRatioF()
+        return (
+            round(self.CARD_WIDTH * device_pixel_ratio),
+            round(self.THUMBNAIL_HEIGHT * device_pixel_ratio),
+        )
+
+    def set_thumbnail_image(self, image: QImage) -> None:
+        """読み込み済みのサムネイル（thumbnail_sizeで作成したもの）を表示する."""
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(self.devicePixelRatioF())
+        self._thumbnail.setPixmap(pixmap)
+
+    def _load_thumbnail(self, filepath: str) -> None:
+        """ディスクキャッシュ済みの縮小サムネイルを読み込んで表示する."""
+        thumb_path = get_cached_thumbnail(filepath, self.thumbnail_size())
+        if thumb_path is None:
+            return
+        image = QImage(str(thumb_path))
+        if not image.isNull():
+            self.set_thumbnail_image(image)
 
 
 class AddMoreAssetsCard(QFrame):
@@ -72,14 +72,14 @@ class ProductListItem(QFrame):
         text_layout.addWidget(self._id_label)
 
         # キャプション（商品名）
-        caption_label = QLabel(caption if caption else "")
-        caption_label.setStyleSheet("""
+        self._caption_label = QLabel(caption if caption else "")
+        self._caption_label.setStyleSheet("""
             font-size: 11px;
             color: #888;
             background: transparent;
         """)
-        caption_label.setMaximumWidth(180)
-        text_layout.addWidget(caption_label)
+        self._caption_label.setMaximumWidth(180)
+        text_layout.addWidget(self._caption_label)
 
         layout.addWidget(text_container, 1)
 
@@ -159,3 +159,15 @@ class ProductListItem(QFrame):
     def update_image_count(self, count: int) -> None:
         """画像数を更新."""
         self._count_badge.setText(str(count).zfill(2))
+
+    def update_info(self, item_id: int, caption: str, image_count: int) -> None:
+        """表示内容を更新（ウィジェットを作り直さずに再利用する）.
+
+        Args:
+            item_id: 商品アイテムID（表示用）
+            caption: 商品キャプション/説明
+            image_count: 画像数
+        """
+        self._id_label.setText(str(item_id))
+        self._caption_label.setText(caption if caption else "")
+        self.update_image_count(image_count)
@@ -38,7 +38,7 @@ class ProductImageModel(BaseModel):
         original_filepath: 元画像パス（リサイズ済みsource画像）
         filepath: 編集後画像パス
         product_mask_filepath: 商品マスク画像パス（Lモード、白=商品）
-        background_mask_filepath: 背景マスク画像パス（Lモード、白=背景）
+        background_mask_filepath: 背景マスク画像パス（旧形式のみ。現在は商品マスクの反転で代用）
         thumbnail_filepath: サムネイル画像パス（処理済みプレビュー用）
     """
 
@@ -137,6 +137,7 @@ def register_image_processing_services() -> None:
     MLモデルはバックグラウンドでロードを開始する。
     """
     from fr_studio.infrastructure.birefnet_remover import BiRefNetRemover
+    from fr_studio.infrastructure.numba_preview_composer import NumbaPreviewComposer
     from fr_studio.infrastructure.numpy_tone_adjuster import NumpyToneAdjuster
     from fr_studio.infrastructure.pillow_centerer import PillowCenterer
     from fr_studio.infrastructure.pillow_edge_refiner import PillowEdgeRefiner
@@ -154,11 +155,19 @@ def register_image_processing_services() -> None:
     edge_refiner = PillowEdgeRefiner()
     shadow_adder = PillowShadowAdder()
     tone_adjuster = NumpyToneAdjuster()
+    preview_composer = NumbaPreviewComposer(
+        tone_adjuster,
+        offset_ratio=shadow_adder.offset_ratio,
+        blur_ratio=shadow_adder.blur_ratio,
+        shadow_color=shadow_adder.shadow_color,
+        background_color=shadow_adder.background_color,
+    )
 
     container.register_instance(PillowCenterer, centerer)
     container.register_instance(PillowEdgeRefiner, edge_refiner)
     container.register_instance(PillowShadowAdder, shadow_adder)
     container.register_instance(NumpyToneAdjuster, tone_adjuster)
+    container.register_instance(NumbaPreviewComposer, preview_composer)
 
     # ProductImageService（他のサービスを依存性として注入）
     from fr_studio.gui.services.product_image_service import ProductImageService
@@ -174,7 +183,10 @@ def register_image_processing_services() -> None:
 
     # Google関連サービス
     from fr_studio.gui.services.image_downloader import GoogleDriveDownloader
+    from fr_studio.infrastructure.google_drive_client import GoogleDriveClient
     from fr_studio.infrastructure.google_sheets_client import GoogleSheetsClient
 
+    # 認証・API初期化は初回利用時に1回だけ行い、ダウンロードとアップロードで共有する
+    container.register_singleton(GoogleDriveClient, GoogleDriveClient)
     container.register_instance(GoogleDriveDownloader, GoogleDriveDownloader())
     container.register_instance(GoogleSheetsClient, GoogleSheetsClient())
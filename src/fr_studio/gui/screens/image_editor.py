@@ -6,22 +6,46 @@
 from __future__ import annotations
 
 import subprocess
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass, replace
+from functools import partial
 from pathlib import Path
 from typing import Any
 
-from PIL import Image, ImageOps
-from PySide6.QtCore import QMimeData, QPoint, QSize, Qt, QTimer, Signal
+import numpy as np
+import numpy.typing as npt
+from PIL import Image
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QMimeData,
+    QModelIndex,
+    QObject,
+    QPoint,
+    QRect,
+    QRectF,
+    QSize,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+)
 from PySide6.QtGui import (
+    QColor,
     QCursor,
     QDrag,
     QDragEnterEvent,
+    QDragLeaveEvent,
+    QDragMoveEvent,
     QDropEvent,
+    QFont,
     QIcon,
     QImage,
     QKeySequence,
     QMouseEvent,
     QNativeGestureEvent,
     QPainter,
+    QPen,
     QPixmap,
     QResizeEvent,
     QShortcut,
@@ -30,15 +54,18 @@ from PySide6.QtGui import (
 from PySide6.QtWidgets import (
     QApplication,
     QCheckBox,
-    QFrame,
     QGraphicsPixmapItem,
     QGraphicsScene,
     QGraphicsView,
     QHBoxLayout,
     QLabel,
+    QListView,
     QPushButton,
     QScrollArea,
     QSlider,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
     QVBoxLayout,
     QWidget,
 )
@@ -51,151 +78,582 @@ from fr_studio.application.transform import (
     slider_to_translate,
     translate_to_slider,
 )
-from fr_studio.infrastructure.birefnet_remover import BiRefNetRemover
+from fr_studio.infrastructure.numba_preview_composer import NumbaPreviewComposer
 from fr_studio.infrastructure.numpy_tone_adjuster import NumpyToneAdjuster
 from fr_studio.infrastructure.pillow_centerer import PillowCenterer
 from fr_studio.infrastructure.pillow_edge_refiner import PillowEdgeRefiner
 from fr_studio.infrastructure.pillow_shadow_adder import PillowShadowAdder
 
+from ..db import get_database
 from ..db.models import ProductImageModel
 from ..di.container import inject
+from ..services.image_preloader import (
+    EditorImageData,
+    EditorImageFiles,
+    ImagePreloader,
+    load_editor_image,
+    resize_preview_mask,
+)
 from ..services.product_image_service import ProductImageService
+from ..workers.mask_generation import MaskGenerationWorker
+from ..workers.preview_render import PreviewRenderWorker
+from ..workers.thumbnail_loader import ThumbnailLoader, ThumbnailLoaderSignals
 from .base import BaseScreen
 
+# サムネイルストリップの画像サイズ
+THUMBNAIL_SIZE = (160, 80)
+
+# 画像編集画面のスタイルシート（画面全体に1回だけ適用し、各ウィジェットはobjectNameで指定）
+EDITOR_QSS = """
+/* メインコンテンツ（プレビュー・サムネイルストリップ） */
+#editorContent, #editorContent QWidget {
+    background: #0a0a0f;
+}
+QPushButton#editorBackBtn {
+    background: transparent;
+    border: 1px solid #3a3a4a;
+    border-radius: 4px;
+    color: #888;
+    padding: 6px 12px;
+    font-size: 12px;
+}
+QPushButton#editorBackBtn:hover {
+    border-color: #00c2a8;
+    color: #fff;
+}
+QLabel#editorProductLabel {
+    font-size: 14px;
+    font-weight: bold;
+    color: #fff;
+}
+QLabel#editorNavHint {
+    color: #555;
+    font-size: 10px;
+}
+#editorThumbnailStrip, #editorThumbnailStrip QWidget {
+    background: rgba(22, 22, 30, 0.4);
+    border-top: 1px solid #2a2a35;
+}
+QPushButton#editorArrowBtn {
+    background: rgba(13, 13, 18, 0.8);
+    border: 1px solid rgba(255, 255, 255, 0.1);
+    border-radius: 16px;
+}
+QPushButton#editorArrowBtn:hover {
+    background: #0d0d12;
+    border-color: rgba(255, 255, 255, 0.2);
+}
+
+/* サイドバー */
+#editorSidebar, #editorSidebar QWidget {
+    background: #16161e;
+    border-left: 1px solid #2a2a35;
+}
+QScrollArea#editorSidebarScroll {
+    background: transparent;
+    border: none;
+}
+#editorSidebarContent, #editorSidebarContent QWidget {
+    background: transparent;
+    border: none;
+}
+#editorSection, #editorSection QWidget {
+    background: transparent;
+    border: none;
+    border-bottom: 1px solid #2a2a35;
+}
+#editorSection QLabel {
+    background: transparent;
+    border: none;
+}
+QLabel#editorSectionIcon {
+    font-size: 12px;
+    color: #00c2a8;
+}
+QLabel#editorSectionTitle {
+    font-size: 10px;
+    font-weight: bold;
+    letter-spacing: 2px;
+    color: #888;
+}
+QLabel#editorHint {
+    color: #555;
+    font-size: 9px;
+}
+QLabel#editorFieldLabel {
+    font-size: 11px;
+    color: #aaa;
+}
+QLabel#editorValueLabel {
+    font-size: 11px;
+    color: #00c2a8;
+}
+QCheckBox#editorToggle {
+    spacing: 0px;
+}
+QCheckBox#editorToggle::indicator {
+    width: 36px;
+    height: 20px;
+    border-radius: 10px;
+    background: #2a2a35;
+}
+QCheckBox#editorToggle::indicator:checked {
+    background: #00c2a8;
+}
+QSlider#editorSlider {
+    padding: 2px;
+}
+QSlider#editorSlider::groove:horizontal {
+    background: #2a2a35;
+    height: 4px;
+    border-radius: 2px;
+}
+QSlider#editorSlider::handle:horizontal {
+    background: #00c2a8;
+    width: 12px;
+    height: 12px;
+    margin: -4px 0;
+    border-radius: 6px;
+}
+QSlider#editorSlider::handle:horizontal:hover {
+    background: #00d4b8;
+}
+QSlider#editorSlider:focus {
+    border: 2px solid #00c2a8;
+    border-radius: 4px;
+}
+#editorPhotoshopContainer, #editorPhotoshopContainer QWidget {
+    background: transparent;
+    border: none;
+}
+QPushButton#editorPhotoshopBtn {
+    background: rgba(0, 122, 255, 0.15);
+    border: 1px solid rgba(0, 122, 255, 0.3);
+    border-radius: 8px;
+    padding: 12px;
+    color: #5ac8fa;
+    font-weight: 500;
+}
+QPushButton#editorPhotoshopBtn:hover {
+    background: rgba(0, 122, 255, 0.25);
+    border-color: rgba(0, 122, 255, 0.5);
+}
+QPushButton#editorPhotoshopBtn:pressed {
+    background: rgba(0, 122, 255, 0.35);
+}
+#editorFooter, #editorFooter QWidget {
+    background: rgba(22, 22, 30, 0.8);
+    border-top: 1px solid #2a2a35;
+}
+QPushButton#editorPrevProductBtn {
+    background: rgba(255, 255, 255, 0.05);
+    border: 1px solid #2a2a35;
+    border-radius: 8px;
+    color: #aaa;
+    font-size: 11px;
+    font-weight: bold;
+    letter-spacing: 1px;
+}
+QPushButton#editorPrevProductBtn:hover {
+    background: rgba(255, 255, 255, 0.1);
+    border-color: rgba(255, 255, 255, 0.2);
+    color: #fff;
+}
+QPushButton#editorNextProductBtn {
+    background: rgba(0, 194, 168, 0.05);
+    border: 1px solid rgba(0, 194, 168, 0.3);
+    border-radius: 8px;
+    color: #00c2a8;
+    font-size: 11px;
+    font-weight: bold;
+    letter-spacing: 1px;
+}
+QPushButton#editorNextProductBtn:hover {
+    background: rgba(0, 194, 168, 0.1);
+    border-color: #00c2a8;
+}
+
+/* ローディングオーバーレイ */
+#editorLoadingOverlay {
+    background: rgba(0, 0, 0, 0.7);
+}
+QLabel#editorLoadingLabel {
+    color: #fff;
+    font-size: 18px;
+    font-weight: bold;
+    background: transparent;
+}
+"""
 
-class ThumbnailItem(QFrame):
-    """サムネイルアイテム."""
 
-    clicked = Signal(int)  # image_id
-    reordered = Signal(int, int)  # source_id, target_id
+def _pil_to_qimage(image: Image.Image) -> QImage:
+    """PIL画像をQImageに変換する.
 
-    def __init__(
-        self,
-        image_id: int,
-        filepath: str,
-        name: str,
-        parent: QWidget | None = None,
-    ) -> None:
-        super().__init__(parent)
-        self._image_id = image_id
-        self._selected = False
-        self._drag_start_pos: QPoint | None = None
-        self._drag_over = False
-        self.setAcceptDrops(True)
-        self._setup_ui(filepath, name)
+    PNGなどへのエンコードを挟まず、RGBAの生バイト列から直接QImageを構築する。
+    QImageはGUIスレッド以外でも扱えるため、ワーカーからの受け渡しに使う。
 
-    def _setup_ui(self, filepath: str, name: str) -> None:
-        self.setFixedSize(160, 110)
-        self.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
-        self._update_style()
+    Args:
+        image: 変換元の画像
 
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(4)
+    Returns:
+        変換後のQImage
+    """
+    if image.mode != "RGBA":
+        image = image.convert("RGBA")
 
-        # サムネイル画像
-        self._thumbnail = QLabel()
-        self._thumbnail.setFixedSize(160, 80)
-        self._thumbnail.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self._thumbnail.setStyleSheet(
-            """
-            background: #1a1a24;
-            border-radius: 6px;
+    qimg = QImage(
+        image.tobytes("raw", "RGBA"),
+        image.width,
+        image.height,
+        image.width * 4,
+        QImage.Format.Format_RGBA8888,
+    )
+    # copy()でPython側のバッファから切り離す
+    return qimg.copy()
+
+
+def _array_to_qimage(array: npt.NDArray[np.uint8]) -> QImage:
+    """RGBA配列 (H, W, 4) をQImageに変換する.
+
+    配列のバッファを直接参照してQImageを構築し、切り離しのコピー1回だけで済ませる。
+
+    Args:
+        array: 変換元のRGBA配列
+
+    Returns:
+        変換後のQImage
+    """
+    height, width = array.shape[:2]
+    qimg = QImage(
+        array.data, width, height, array.strides[0], QImage.Format.Format_RGBA8888
+    )
+    # copy()でPython側のバッファから切り離す
+    return qimg.copy()
+
+
+def _pil_to_qpixmap(image: Image.Image) -> QPixmap:
+    """PIL画像をQPixmapに変換する（GUIスレッド専用）.
+
+    Args:
+        image: 変換元の画像
+
+    Returns:
+        変換後のQPixmap
+    """
+    return QPixmap.fromImage(_pil_to_qimage(image))
+
+
+@dataclass
+class ThumbnailEntry:
+    """サムネイルストリップの1項目.
+
+    Attributes:
+        image_id: 画像ID
+        filepath: サムネイル画像パス
+        name: 表示名
+        pixmap: 読み込み済みのサムネイル（初回描画時にバックグラウンドで読み込む）
+    """
+
+    image_id: int
+    filepath: str
+    name: str
+    pixmap: QPixmap | None = None
+
+
+class ThumbnailListModel(QAbstractListModel):
+    """サムネイルストリップのモデル.
+
+    選択状態とドロップ先はモデルで保持し、変更のあった行だけ再描画させる。
+    サムネイルは描画時にGUIスレッドで作成せず、ThumbnailLoaderで読み込んでから再描画させる。
+    """
+
+    ImageIdRole = Qt.ItemDataRole.UserRole + 1
+    SelectedRole = Qt.ItemDataRole.UserRole + 2
+    DropTargetRole = Qt.ItemDataRole.UserRole + 3
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._entries: list[ThumbnailEntry] = []
+        self._selected_id: int | None = None
+        self._drop_target_id: int | None = None
+
+        self._thumbnail_pool = QThreadPool(self)
+        self._thumbnail_signals = ThumbnailLoaderSignals(self)
+        self._thumbnail_signals.loaded.connect(self._on_thumbnail_loaded)
+        # 画像IDごとの読み込み中のリクエスト番号（読み込めなかった画像も残し、再試行しない）
+        self._pending_requests: dict[int, int] = {}
+        self._request_counter = 0
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: B008
+        return 0 if parent.isValid() else len(self._entries)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        entry = self._entries[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return entry.name
+        if role == Qt.ItemDataRole.DecorationRole:
+            if entry.pixmap is None and entry.filepath:
+                self._request_thumbnail(entry)
+            return entry.pixmap
+        if role == self.ImageIdRole:
+            return entry.image_id
+        if role == self.SelectedRole:
+            return entry.image_id == self._selected_id
+        if role == self.DropTargetRole:
+            return entry.image_id == self._drop_target_id
+        return None
+
+    def set_images(self, images: list[ProductImageModel], selected_id: int | None) -> None:
+        """表示する画像一覧を設定.
+
+        既存の項目は読み込み済みのサムネイルごと再利用し、並びが同じなら
+        モデルをリセットせず、変更のあった行だけ再描画させる。
         """
+        existing = {entry.image_id: entry for entry in self._entries}
+        entries = []
+        changed_rows = []
+        for row, model in enumerate(images):
+            filepath = model.thumbnail_filepath or ""
+            entry = existing.get(model.id)
+            if entry is None:
+                entry = ThumbnailEntry(image_id=model.id, filepath=filepath, name=model.name)
+            elif entry.name != model.name or (entry.filepath != filepath and filepath):
+                entry.name = model.name
+                entry.filepath = filepath
+                entry.pixmap = None
+                self._pending_requests.pop(entry.image_id, None)
+                changed_rows.append(row)
+            entries.append(entry)
+
+        if [e.image_id for e in entries] != [e.image_id for e in self._entries]:
+            kept_ids = {entry.image_id for entry in entries}
+            for image_id in self._pending_requests.keys() - kept_ids:
+                del self._pending_requests[image_id]
+            self.beginResetModel()
+            self._entries = entries
+            self._selected_id = selected_id
+            self._drop_target_id = None
+            self.endResetModel()
+            return
+
+        self._entries = entries
+        for row in changed_rows:
+            self.dataChanged.emit(self.index(row), self.index(row))
+        self.set_drop_target(None)
+        self.set_selected(selected_id)
+
+    def index_of(self, image_id: int) -> QModelIndex:
+        """画像IDの行インデックスを取得（見つからない場合は無効なインデックス）."""
+        for row, entry in enumerate(self._entries):
+            if entry.image_id == image_id:
+                return self.index(row)
+        return QModelIndex()
+
+    def set_selected(self, image_id: int | None) -> None:
+        """選択中の画像を設定."""
+        previous = self._selected_id
+        self._selected_id = image_id
+        self._emit_changed(previous, image_id)
+
+    def set_drop_target(self, image_id: int | None) -> None:
+        """ドラッグ中のドロップ先を設定."""
+        previous = self._drop_target_id
+        self._drop_target_id = image_id
+        self._emit_changed(previous, image_id)
+
+    def update_thumbnail(self, image_id: int, filepath: str) -> None:
+        """サムネイル画像を更新."""
+        index = self.index_of(image_id)
+        if not index.isValid():
+            return
+        entry = self._entries[index.row()]
+        entry.filepath = filepath
+        entry.pixmap = None
+        self._pending_requests.pop(image_id, None)
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+
+    def _request_thumbnail(self, entry: ThumbnailEntry) -> None:
+        """サムネイルの読み込みをスレッドプールで開始（読み込み中なら何もしない）."""
+        if entry.image_id in self._pending_requests:
+            return
+        self._request_counter += 1
+        self._pending_requests[entry.image_id] = self._request_counter
+
+        # HiDPIでQtが描画時に拡大しないよう、物理ピクセルのサイズで作成する
+        device_pixel_ratio = QApplication.instance().devicePixelRatio()
+        size = (
+            round(THUMBNAIL_SIZE[0] * device_pixel_ratio),
+            round(THUMBNAIL_SIZE[1] * device_pixel_ratio),
+        )
+        self._thumbnail_pool.start(
+            ThumbnailLoader(
+                self._thumbnail_signals,
+                self._request_counter,
+                entry.image_id,
+                entry.filepath,
+                size,
+            )
         )
 
-        if filepath and Path(filepath).exists():
-            pixmap = QPixmap(filepath)
-            if not pixmap.isNull():
-                scaled = pixmap.scaled(
-                    160,
-                    80,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
-                self._thumbnail.setPixmap(scaled)
+    def _on_thumbnail_loaded(self, request: int, image_id: int, image: QImage) -> None:
+        """サムネイル読み込み完了時の処理.
 
-        layout.addWidget(self._thumbnail)
+        画像が差し替えられた後に届いた古いリクエストの結果は破棄する。
+        """
+        if self._pending_requests.get(image_id) != request:
+            return
+        del self._pending_requests[image_id]
+
+        index = self.index_of(image_id)
+        if not index.isValid():
+            return
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(QApplication.instance().devicePixelRatio())
+        self._entries[index.row()].pixmap = pixmap
+        self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+
+    def _emit_changed(self, *image_ids: int | None) -> None:
+        """指定した画像の行の再描画を通知."""
+        for image_id in set(image_ids):
+            if image_id is None:
+                continue
+            index = self.index_of(image_id)
+            if index.isValid():
+                self.dataChanged.emit(index, index)
+
+
+class ThumbnailDelegate(QStyledItemDelegate):
+    """サムネイル項目の描画.
+
+    子ウィジェットやスタイルシートを使わず、枠・画像・ラベルをQPainterで直接描く。
+    """
+
+    ITEM_SIZE = QSize(160, 110)
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+        return self.ITEM_SIZE
+
+    def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        selected = bool(index.data(ThumbnailListModel.SelectedRole))
+        drop_target = bool(index.data(ThumbnailListModel.DropTargetRole))
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        rect = option.rect
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # 枠
+        if drop_target:
+            painter.setPen(QPen(QColor("#ff9800"), 2, Qt.PenStyle.DashLine))
+            painter.setBrush(QColor(255, 152, 0, 25))
+        elif selected:
+            painter.setPen(QPen(QColor("#00c2a8"), 2))
+            painter.setBrush(QColor(0, 194, 168, 25))
+        else:
+            painter.setPen(QPen(QColor(0, 194, 168, 128) if hovered else QColor("#24242e"), 1))
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawRoundedRect(QRectF(rect).adjusted(1, 1, -1, -1), 8, 8)
+
+        # サムネイル画像
+        thumb_rect = QRect(rect.x(), rect.y(), *THUMBNAIL_SIZE)
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor("#1a1a24"))
+        painter.drawRoundedRect(QRectF(thumb_rect), 6, 6)
+
+        pixmap = index.data(Qt.ItemDataRole.DecorationRole)
+        if pixmap is not None:
+            # 論理サイズで中央寄せし、等倍で描画（拡大縮小なし）
+            size = pixmap.deviceIndependentSize().toSize()
+            x = thumb_rect.x() + (thumb_rect.width() - size.width()) // 2
+            y = thumb_rect.y() + (thumb_rect.height() - size.height()) // 2
+            painter.drawPixmap(x, y, pixmap)
 
         # ラベル
-        self._label = QLabel(name)
-        self._label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self._label.setStyleSheet(
+        font = QFont(option.font)
+        font.setPixelSize(10)
+        font.setBold(selected)
+        painter.setFont(font)
+        painter.setPen(QColor("#00c2a8") if selected else QColor("#666"))
+        label_top = thumb_rect.y() + thumb_rect.height() + 4
+        label_rect = QRect(rect.x(), label_top, rect.width(), rect.y() + rect.height() - label_top)
+        painter.drawText(
+            label_rect,
+            Qt.AlignmentFlag.AlignHCenter | Qt.AlignmentFlag.AlignTop,
+            index.data(Qt.ItemDataRole.DisplayRole),
+        )
+
+        painter.restore()
+
+
+class ThumbnailListView(QListView):
+    """サムネイルストリップ.
+
+    項目ごとのウィジェットを作らず、1つのビューとデリゲートで全サムネイルを描画する。
+    """
+
+    image_clicked = Signal(int)  # image_id
+    reordered = Signal(int, int)  # source_id, target_id
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._drag_start_pos: QPoint | None = None
+        self._drag_image_id: int | None = None
+
+        self.setViewMode(QListView.ViewMode.IconMode)
+        self.setFlow(QListView.Flow.LeftToRight)
+        self.setWrapping(False)
+        self.setUniformItemSizes(True)
+        self.setMovement(QListView.Movement.Static)
+        self.setSpacing(8)
+        self.setSelectionMode(QListView.SelectionMode.NoSelection)
+        self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self.setHorizontalScrollMode(QListView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setMouseTracking(True)
+        self.viewport().setAttribute(Qt.WidgetAttribute.WA_Hover)
+        self.viewport().setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
+        self.setAcceptDrops(True)
+        self.viewport().setAcceptDrops(True)
+        self.setStyleSheet(
             """
-            font-size: 10px;
-            color: #666;
-            background: transparent;
+            QListView {
+                background: transparent;
+                border: none;
+            }
         """
         )
-        layout.addWidget(self._label)
-
-    def _update_style(self) -> None:
-        if self._drag_over:
-            self.setStyleSheet(
-                """
-                ThumbnailItem {
-                    border: 2px dashed #ff9800;
-                    border-radius: 8px;
-                    background: rgba(255, 152, 0, 0.1);
-                }
-            """
-            )
-        elif self._selected:
-            self.setStyleSheet(
-                """
-                ThumbnailItem {
-                    border: 2px solid #00c2a8;
-                    border-radius: 8px;
-                    background: rgba(0, 194, 168, 0.1);
-                }
-            """
-            )
-            if hasattr(self, "_label"):
-                self._label.setStyleSheet(
-                    """
-                    font-size: 10px;
-                    font-weight: bold;
-                    color: #00c2a8;
-                    background: transparent;
-                """
-                )
-        else:
-            self.setStyleSheet(
-                """
-                ThumbnailItem {
-                    border: 1px solid #24242e;
-                    border-radius: 8px;
-                    background: transparent;
-                }
-                ThumbnailItem:hover {
-                    border-color: rgba(0, 194, 168, 0.5);
-                }
-            """
-            )
-            if hasattr(self, "_label"):
-                self._label.setStyleSheet(
-                    """
-                    font-size: 10px;
-                    color: #666;
-                    background: transparent;
-                """
-                )
+
+    def _image_id_at(self, pos: QPoint) -> int | None:
+        """指定位置の画像IDを取得."""
+        index = self.indexAt(pos)
+        if not index.isValid():
+            return None
+        return index.data(ThumbnailListModel.ImageIdRole)
+
+    def _set_drop_target(self, image_id: int | None) -> None:
+        model = self.model()
+        if isinstance(model, ThumbnailListModel):
+            model.set_drop_target(image_id)
 
     def mousePressEvent(self, event: QMouseEvent) -> None:
         if event.button() == Qt.MouseButton.LeftButton:
             self._drag_start_pos = event.pos()
-        # clickedは発火しない（mouseReleaseEventで判定）
-        super().mousePressEvent(event)
+            self._drag_image_id = self._image_id_at(event.pos())
 
     def mouseReleaseEvent(self, event: QMouseEvent) -> None:
-        # ドラッグしなかった場合のみclickedを発火
-        if self._drag_start_pos is not None:
-            self.clicked.emit(self._image_id)
+        # ドラッグしなかった場合のみクリックとして扱う
+        if self._drag_start_pos is not None and self._drag_image_id is not None:
+            self.image_clicked.emit(self._drag_image_id)
         self._drag_start_pos = None
-        super().mouseReleaseEvent(event)
+        self._drag_image_id = None
 
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
-        if not self._drag_start_pos:
+        if not self._drag_start_pos or self._drag_image_id is None:
+            super().mouseMoveEvent(event)  # ホバー表示の更新
             return
         # ドラッグ開始判定（10px以上移動）
         if (event.pos() - self._drag_start_pos).manhattanLength() < 10:
@@ -203,55 +661,184 @@ class ThumbnailItem(QFrame):
         # ドラッグ開始
         drag = QDrag(self)
         mime = QMimeData()
-        mime.setText(str(self._image_id))
+        mime.setText(str(self._drag_image_id))
         drag.setMimeData(mime)
+        self._drag_start_pos = None  # ドラッグ後はNoneにしてクリックを発火させない
         drag.exec(Qt.DropAction.MoveAction)
-        self._drag_start_pos = None  # ドラッグ後はNoneにしてclickedを発火させない
 
     def dragEnterEvent(self, event: QDragEnterEvent) -> None:
         if event.mimeData().hasText():
-            source_id = int(event.mimeData().text())
-            if source_id != self._image_id:
-                self._drag_over = True
-                self._update_style()
-                event.acceptProposedAction()
-                return
+            event.acceptProposedAction()
+            return
         event.ignore()
 
-    def dragLeaveEvent(self, event) -> None:
-        self._drag_over = False
-        self._update_style()
+    def dragMoveEvent(self, event: QDragMoveEvent) -> None:
+        if not event.mimeData().hasText():
+            event.ignore()
+            return
+        source_id = int(event.mimeData().text())
+        target_id = self._image_id_at(event.position().toPoint())
+        if target_id is not None and target_id != source_id:
+            self._set_drop_target(target_id)
+            event.acceptProposedAction()
+        else:
+            self._set_drop_target(None)
+            event.ignore()
+
+    def dragLeaveEvent(self, event: QDragLeaveEvent) -> None:
+        self._set_drop_target(None)
 
     def dropEvent(self, event: QDropEvent) -> None:
-        self._drag_over = False
-        self._update_style()
+        self._set_drop_target(None)
         if event.mimeData().hasText():
             source_id = int(event.mimeData().text())
-            if source_id != self._image_id:
-                self.reordered.emit(source_id, self._image_id)
+            target_id = self._image_id_at(event.position().toPoint())
+            if target_id is not None and source_id != target_id:
+                self.reordered.emit(source_id, target_id)
         event.acceptProposedAction()
 
-    def set_selected(self, selected: bool) -> None:
-        if self._selected != selected:
-            self._selected = selected
-            self._update_style()
 
-    @property
-    def image_id(self) -> int:
-        return self._image_id
+def _mask_bbox(mask: npt.NDArray[np.uint8]) -> tuple[int, int, int, int] | None:
+    """マスクの非ゼロ領域のbboxを取得（Image.getbboxと同じ形式）.
 
-    def update_thumbnail(self, filepath: str) -> None:
-        """サムネイル画像を更新."""
-        if filepath and Path(filepath).exists():
-            pixmap = QPixmap(filepath)
-            if not pixmap.isNull():
-                scaled = pixmap.scaled(
-                    160,
-                    80,
-                    Qt.AspectRatioMode.KeepAspectRatio,
-                    Qt.TransformationMode.SmoothTransformation,
-                )
-                self._thumbnail.setPixmap(scaled)
+    Args:
+        mask: マスク配列 (H, W)
+
+    Returns:
+        (left, top, right, bottom)、非ゼロ画素がない場合はNone
+    """
+    rows = np.flatnonzero(mask.any(axis=1))
+    if rows.size == 0:
+        return None
+    cols = np.flatnonzero(mask.any(axis=0))
+    return (int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1)
+
+
+@dataclass
+class EditorParams:
+    """画像編集パラメータ（UIスライダー・トグルの値）.
+
+    Attributes:
+        bg_removal_enabled: 背景除去するか
+        centering_enabled: 中央寄せするか
+        edge: エッジ加工 (0-100)
+        shadow: 影濃度 (0-100)
+        contrast_whole: 全体コントラスト (-100 to +100)
+        contrast_product: 商品コントラスト (-100 to +100)
+        zoom: ズーム (0-100, 50=scale 1.0)
+        pos_x: X位置 (0-100, 50=中央)
+        pos_y: Y位置 (0-100, 50=中央)
+    """
+
+    bg_removal_enabled: bool = True
+    centering_enabled: bool = True
+    edge: int = 12
+    shadow: int = 45
+    contrast_whole: int = 0
+    contrast_product: int = 0
+    zoom: int = 50
+    pos_x: int = 50
+    pos_y: int = 50
+
+
+class PreviewStageCache:
+    """プレビュー描画の中間結果（段階ごと）のLRUキャッシュ.
+
+    コントラストだけを変えた場合などに、入力が変わっていない前段の処理を再利用する。
+    キーには段階名とその段階の入力パラメータを含める。
+    """
+
+    def __init__(self, max_entries: int = 8) -> None:
+        """初期化.
+
+        Args:
+            max_entries: 保持する中間結果の最大数
+        """
+        self._max_entries = max_entries
+        self._entries: OrderedDict[Hashable, Any] = OrderedDict()
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """キャッシュから取得し、なければ作成して追加.
+
+        Args:
+            key: 段階名と入力パラメータのタプル
+            factory: 中間結果を作成する関数
+
+        Returns:
+            中間結果
+        """
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+        value = factory()
+        self._entries[key] = value
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        return value
+
+
+@dataclass(frozen=True)
+class PreviewSource:
+    """プレビュー描画の入力（ワーカーに渡すスナップショット）.
+
+    Attributes:
+        image_id: 画像ID
+        image: プレビュー用の縮小画像
+        product_mask: プレビュー用の商品マスク
+        product_mask_array: product_maskのuint8配列 (H, W)（トーン調整カーネル用）
+        scale: 縮小率（縮小版 / 編集用画像）
+        bbox: センタリング用bbox（編集用画像の座標）
+        params: 描画時点の編集パラメータ
+        refined_mask_cache: エッジ調整済みマスクのキャッシュ（キーはエッジスライダー値）
+        stage_cache: 中間結果のキャッシュ
+    """
+
+    image_id: int
+    image: Image.Image
+    product_mask: Image.Image | None
+    product_mask_array: npt.NDArray[np.uint8] | None
+    scale: float
+    bbox: tuple[int, int, int, int] | None
+    params: EditorParams
+    refined_mask_cache: dict[int, Image.Image]
+    stage_cache: PreviewStageCache
+
+    def renders_same_as(self, other: PreviewSource | None) -> bool:
+        """同じ描画結果になる入力かを判定.
+
+        画像・マスクは内容ではなく同一オブジェクトかで比較する（読み込み時に差し替わるため）。
+        """
+        return (
+            other is not None
+            and self.image_id == other.image_id
+            and self.image is other.image
+            and self.product_mask is other.product_mask
+            and self.refined_mask_cache is other.refined_mask_cache
+            and self.scale == other.scale
+            and self.bbox == other.bbox
+            and self.params == other.params
+        )
+
+
+def _format_signed(value: int) -> str:
+    """符号付きで表示（コントラスト用）."""
+    return f"+{value}" if value >= 0 else str(value)
+
+
+def _format_percent(value: int) -> str:
+    """パーセント表示（影濃度用）."""
+    return f"{value}%"
+
+
+def _format_offset(value: int) -> str:
+    """中央(50)からのオフセット表示（位置用）."""
+    return str(value - 50)
+
+
+def _format_zoom(value: int) -> str:
+    """倍率表示（ズーム用）."""
+    return f"{slider_to_scale(value):.2f}x"
 
 
 class ImageCanvas(QGraphicsView):
@@ -262,6 +849,8 @@ class ImageCanvas(QGraphicsView):
         self._scene = QGraphicsScene(self)
         self.setScene(self._scene)
         self._pixmap_item: QGraphicsPixmapItem | None = None
+        self._fit_pending = True  # 次のset_imageでビューにフィットするか
+        self._fitted = False  # フィット後にズーム・パンされていないか
         self._zoom = 1.0
         self._panning = False
         self._pan_start = QPoint()
@@ -273,6 +862,12 @@ class ImageCanvas(QGraphicsView):
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
 
+        # リサイズ中は再フィットせず、サイズが落ち着いてから1回だけ実行（デバウンス）
+        self._fit_timer = QTimer(self)
+        self._fit_timer.setSingleShot(True)
+        self._fit_timer.setInterval(50)
+        self._fit_timer.timeout.connect(self.fit_in_view)
+
         # スタイル
         self.setStyleSheet(
             """
@@ -285,20 +880,36 @@ class ImageCanvas(QGraphicsView):
         )
 
     def set_image(self, pixmap: QPixmap) -> None:
-        """画像を設定."""
-        self._scene.clear()
-        self._pixmap_item = self._scene.addPixmap(pixmap)
-        self._pixmap_item.setTransformationMode(
-            Qt.TransformationMode.SmoothTransformation
-        )
-        self.setSceneRect(self._pixmap_item.boundingRect())
-        self.fit_in_view()
+        """画像を設定.
+
+        アイテムは初回のみ作成し、以降はピクスマップだけ差し替えてズーム・パンを維持する。
+        """
+        if self._pixmap_item is None:
+            self._pixmap_item = self._scene.addPixmap(pixmap)
+            self._pixmap_item.setTransformationMode(
+                Qt.TransformationMode.SmoothTransformation
+            )
+            self.setSceneRect(self._pixmap_item.boundingRect())
+        else:
+            size_changed = pixmap.size() != self._pixmap_item.pixmap().size()
+            self._pixmap_item.setPixmap(pixmap)
+            if size_changed:
+                self.setSceneRect(self._pixmap_item.boundingRect())
+
+        if self._fit_pending:
+            self._fit_pending = False
+            self.fit_in_view()
+
+    def request_fit(self) -> None:
+        """次に画像を設定した時にビューへフィットさせる（画像切り替え時に使用）."""
+        self._fit_pending = True
 
     def fit_in_view(self) -> None:
         """画像をビューにフィット."""
         if self._pixmap_item:
             self.fitInView(self._pixmap_item, Qt.AspectRatioMode.KeepAspectRatio)
             self._zoom = self.transform().m11()
+            self._fitted = True
 
     def wheelEvent(self, event: QWheelEvent) -> None:
         """マウスホイールでズーム."""
@@ -311,6 +922,7 @@ class ImageCanvas(QGraphicsView):
 
         if 0.1 <= new_zoom <= 10.0:
             self._zoom = new_zoom
+            self._fitted = False
             self.scale(factor, factor)
 
     def viewportEvent(self, event) -> bool:
@@ -322,6 +934,7 @@ class ImageCanvas(QGraphicsView):
                 new_zoom = self._zoom * factor
                 if 0.1 <= new_zoom <= 10.0:
                     self._zoom = new_zoom
+                    self._fitted = False
                     self.scale(factor, factor)
                 return True
         return super().viewportEvent(event)
@@ -330,6 +943,7 @@ class ImageCanvas(QGraphicsView):
         """パン開始."""
         if event.button() == Qt.MouseButton.LeftButton:
             self._panning = True
+            self._fitted = False
             self._pan_start = event.position().toPoint()
             self.setCursor(Qt.CursorShape.ClosedHandCursor)
         super().mousePressEvent(event)
@@ -357,7 +971,10 @@ class ImageCanvas(QGraphicsView):
     def resizeEvent(self, event: QResizeEvent) -> None:
         """リサイズ時の処理."""
         super().resizeEvent(event)
-        # ズームを維持するため、fit_in_viewを呼ばない
+        # ズーム・パン済みなら維持する。フィット表示のままなら、ドラッグ中は毎回計算せず
+        # リサイズが落ち着いてから1回だけフィットし直す
+        if self._fitted:
+            self._fit_timer.start()
 
 
 class ImageEditorScreen(BaseScreen):
@@ -373,6 +990,12 @@ class ImageEditorScreen(BaseScreen):
     next_product_requested = Signal()
     prev_product_requested = Signal()
 
+    # プレビュー処理の最大解像度（最終出力はフル解像度で生成）
+    PREVIEW_MAX_SIZE = 1024
+
+    # エッジ調整済みマスクを事前計算するエッジスライダーの刻み（間の値は補間）
+    EDGE_MASK_STEP = 4
+
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
 
@@ -383,70 +1006,73 @@ class ImageEditorScreen(BaseScreen):
         self._image_model: ProductImageModel | None = None
 
         # 処理パラメータ（UIスライダー値）
-        self._bg_removal_enabled: bool = True
-        self._centering_enabled: bool = True
-        self._edge_value: int = 12  # 0-100
-        self._shadow_value: int = 45  # 0-100
-        self._contrast_whole: int = 0  # -100 to +100
-        self._contrast_product: int = 0  # -100 to +100
-
-        # Transform パラメータ（ズーム・位置）
-        self._zoom_value: int = 50  # 0-100 (50=scale 1.0)
-        self._pos_x_value: int = 50  # 0-100 (50=中央)
-        self._pos_y_value: int = 50  # 0-100 (50=中央)
+        self._params = EditorParams()
 
         # 画像データ（新設計）
-        self._original_image: Image.Image | None = None  # 元画像（不変）
-        self._product_mask: Image.Image | None = None  # 商品マスク
-        self._bg_mask: Image.Image | None = None  # 背景マスク
+        self._original_image: Image.Image | None = None  # 元画像（不変、必要時に読み込む）
+        self._original_size: tuple[int, int] | None = None  # 元画像のサイズ
+        self._product_mask: npt.NDArray[np.uint8] | None = None  # 商品マスク (H, W)
         self._cached_bbox: tuple[int, int, int, int] | None = None  # センタリング用bbox
 
+        # プレビュー用の縮小版（スライダー操作時はこちらで処理する）
+        self._preview_image: Image.Image | None = None
+        self._preview_product_mask: Image.Image | None = None
+        # カーネルに渡す商品マスクの配列（スライダー操作のたびに変換しないよう事前に作成）
+        self._preview_product_mask_array: npt.NDArray[np.uint8] | None = None
+        self._preview_scale: float = 1.0  # 縮小版 / 編集用画像
+
         # パラメータ別キャッシュ（パフォーマンス対策）
-        self._refined_mask_cache: dict[tuple[int, float], Image.Image] = {}
-        self._shadow_layer_cache: dict[int, Image.Image] = {}
+        self._refined_mask_cache: dict[int, Image.Image] = {}
+        self._stage_cache = PreviewStageCache()
+
+        # マスク生成ワーカー（画像IDごと、実行中のみ保持）
+        self._mask_workers: dict[int, MaskGenerationWorker] = {}
+
+        # プレビュー描画ワーカー（世代番号ごと、実行中のみ保持）
+        self._preview_workers: dict[int, PreviewRenderWorker] = {}
+        self._preview_generation = 0
+        self._last_preview_source: PreviewSource | None = None  # 最後に描画を要求した入力
+        self._pending_preview_source: PreviewSource | None = None  # 描画中に届いた最新の入力
+
+        # 前後の画像の先読みキャッシュ
+        self._preloader = ImagePreloader(self.PREVIEW_MAX_SIZE)
 
         # サービス
-        self._bg_remover = inject(BiRefNetRemover)
         self._centerer = inject(PillowCenterer)
         self._edge_refiner = inject(PillowEdgeRefiner)
-        self._shadow_adder = inject(PillowShadowAdder)
         self._tone_adjuster = inject(NumpyToneAdjuster)
+        self._preview_composer = inject(NumbaPreviewComposer)
         self._product_image_service = inject(ProductImageService)
 
+        # 初回のスライダー操作でJITコンパイル待ちが発生しないよう事前にコンパイル
+        # （画面はアプリ起動時に作成されるため、起動をブロックしないようバックグラウンドで行う）
+        QThreadPool.globalInstance().start(self._warmup_kernels)
+
         # デバウンスタイマー
         self._preview_timer = QTimer()
         self._preview_timer.setSingleShot(True)
         self._preview_timer.timeout.connect(self._update_preview)
 
-        # サムネイルウィジェット参照
-        self._thumbnail_items: dict[int, ThumbnailItem] = {}
-
         self._setup_ui()
 
         # ローディングオーバーレイ
         self._loading_overlay = QWidget(self)
-        self._loading_overlay.setStyleSheet(
-            """
-            background: rgba(0, 0, 0, 0.7);
-        """
-        )
+        self._loading_overlay.setObjectName("editorLoadingOverlay")
         self._loading_overlay.hide()
 
         loading_layout = QVBoxLayout(self._loading_overlay)
         loading_layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
         loading_label = QLabel("処理中...")
-        loading_label.setStyleSheet(
-            """
-            color: #fff;
-            font-size: 18px;
-            font-weight: bold;
-            background: transparent;
-        """
-        )
+        loading_label.setObjectName("editorLoadingLabel")
         loading_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         loading_layout.addWidget(loading_label)
 
+    def _warmup_kernels(self) -> None:
+        """トーン調整・プレビュー合成のJITカーネルをコンパイルする."""
+        self._tone_adjuster.warmup()
+        self._preview_composer.warmup()
+
     def _setup_ui(self) -> None:
         """UIを構築."""
         # キーボードフォーカスを受け取れるようにする
@@ -458,7 +1084,7 @@ class ImageEditorScreen(BaseScreen):
 
         # 左側: メインコンテンツ
         content_area = QWidget()
-        content_area.setStyleSheet("background: #0a0a0f;")
+        content_area.setObjectName("editorContent")
         content_layout = QVBoxLayout(content_area)
         content_layout.setContentsMargins(0, 0, 0, 0)
         content_layout.setSpacing(0)
@@ -480,6 +1106,9 @@ class ImageEditorScreen(BaseScreen):
         # キーボードショートカットを設定
         self._setup_shortcuts()
 
+        # スタイルは画面全体で1回だけ解析させる
+        self.setStyleSheet(EDITOR_QSS)
+
     def _setup_shortcuts(self) -> None:
         """キーボードショートカットを設定."""
         # ⌥⌘R: 背景除去トグル
@@ -513,7 +1142,6 @@ class ImageEditorScreen(BaseScreen):
     def _create_preview_area(self) -> QWidget:
         """プレビューエリアを作成."""
         preview_container = QWidget()
-        preview_container.setStyleSheet("background: #0a0a0f;")
 
         layout = QVBoxLayout(preview_container)
         layout.setContentsMargins(48, 24, 48, 24)
@@ -527,41 +1155,20 @@ class ImageEditorScreen(BaseScreen):
 
         # 戻るボタン
         self._back_btn = QPushButton("← 戻る")
-        self._back_btn.setStyleSheet(
-            """
-            QPushButton {
-                background: transparent;
-                border: 1px solid #3a3a4a;
-                border-radius: 4px;
-                color: #888;
-                padding: 6px 12px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                border-color: #00c2a8;
-                color: #fff;
-            }
-        """
-        )
+        self._back_btn.setObjectName("editorBackBtn")
         self._back_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         self._back_btn.clicked.connect(self._on_back_clicked)
         header_layout.addWidget(self._back_btn)
 
         # 商品ID・商品名表示（小さめ）
         self._product_id_label = QLabel("")
-        self._product_id_label.setStyleSheet(
-            """
-            font-size: 14px;
-            font-weight: bold;
-            color: #fff;
-        """
-        )
+        self._product_id_label.setObjectName("editorProductLabel")
         header_layout.addWidget(self._product_id_label)
         header_layout.addStretch()
 
         # 画像切り替えショートカットヒント
         image_nav_hint = QLabel("画像: ⌥←/→")
-        image_nav_hint.setStyleSheet("color: #555; font-size: 10px;")
+        image_nav_hint.setObjectName("editorNavHint")
         header_layout.addWidget(image_nav_hint)
 
         layout.addWidget(header_row)
@@ -577,12 +1184,7 @@ class ImageEditorScreen(BaseScreen):
         """サムネイルストリップを作成."""
         strip_container = QWidget()
         strip_container.setFixedHeight(140)
-        strip_container.setStyleSheet(
-            """
-            background: rgba(22, 22, 30, 0.4);
-            border-top: 1px solid #2a2a35;
-        """
-        )
+        strip_container.setObjectName("editorThumbnailStrip")
 
         layout = QHBoxLayout(strip_container)
         layout.setContentsMargins(16, 16, 16, 16)
@@ -596,50 +1198,19 @@ class ImageEditorScreen(BaseScreen):
         left_btn.setIcon(prev_icon)
         left_btn.setIconSize(QSize(20, 20))
         left_btn.setFixedSize(32, 32)
-        left_btn.setStyleSheet(
-            """
-            QPushButton {
-                background: rgba(13, 13, 18, 0.8);
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                border-radius: 16px;
-            }
-            QPushButton:hover {
-                background: #0d0d12;
-                border-color: rgba(255, 255, 255, 0.2);
-            }
-        """
-        )
+        left_btn.setObjectName("editorArrowBtn")
         left_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         left_btn.clicked.connect(self._on_prev_image)
         layout.addWidget(left_btn)
 
-        # スクロールエリア
-        self._thumbnail_scroll = QScrollArea()
-        self._thumbnail_scroll.setWidgetResizable(True)
-        self._thumbnail_scroll.setHorizontalScrollBarPolicy(
-            Qt.ScrollBarPolicy.ScrollBarAlwaysOff
-        )
-        self._thumbnail_scroll.setVerticalScrollBarPolicy(
-            Qt.ScrollBarPolicy.ScrollBarAlwaysOff
-        )
-        self._thumbnail_scroll.setStyleSheet(
-            """
-            QScrollArea {
-                background: transparent;
-                border: none;
-            }
-        """
-        )
-
-        self._thumbnail_container = QWidget()
-        self._thumbnail_container.setStyleSheet("background: transparent;")
-        self._thumbnail_layout = QHBoxLayout(self._thumbnail_container)
-        self._thumbnail_layout.setContentsMargins(0, 0, 0, 0)
-        self._thumbnail_layout.setSpacing(16)
-        self._thumbnail_layout.setAlignment(Qt.AlignmentFlag.AlignLeft)
-
-        self._thumbnail_scroll.setWidget(self._thumbnail_container)
-        layout.addWidget(self._thumbnail_scroll, 1)
+        # サムネイル一覧（1つのビューとデリゲートで描画）
+        self._thumbnail_model = ThumbnailListModel(self)
+        self._thumbnail_view = ThumbnailListView()
+        self._thumbnail_view.setModel(self._thumbnail_model)
+        self._thumbnail_view.setItemDelegate(ThumbnailDelegate(self._thumbnail_view))
+        self._thumbnail_view.image_clicked.connect(self._on_thumbnail_clicked)
+        self._thumbnail_view.reordered.connect(self._on_thumbnail_reordered)
+        layout.addWidget(self._thumbnail_view, 1)
 
         # 右矢印（次の画像へ）
         next_icon = QIcon(str(assets_dir / "next.png"))
@@ -648,19 +1219,7 @@ class ImageEditorScreen(BaseScreen):
         right_btn.setIcon(next_icon)
         right_btn.setIconSize(QSize(20, 20))
         right_btn.setFixedSize(32, 32)
-        right_btn.setStyleSheet(
-            """
-            QPushButton {
-                background: rgba(13, 13, 18, 0.8);
-                border: 1px solid rgba(255, 255, 255, 0.1);
-                border-radius: 16px;
-            }
-            QPushButton:hover {
-                background: #0d0d12;
-                border-color: rgba(255, 255, 255, 0.2);
-            }
-        """
-        )
+        right_btn.setObjectName("editorArrowBtn")
         right_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         right_btn.clicked.connect(self._on_next_image)
         layout.addWidget(right_btn)
@@ -671,12 +1230,7 @@ class ImageEditorScreen(BaseScreen):
         """サイドバーを作成."""
         sidebar = QWidget()
         sidebar.setFixedWidth(320)
-        sidebar.setStyleSheet(
-            """
-            background: #16161e;
-            border-left: 1px solid #2a2a35;
-        """
-        )
+        sidebar.setObjectName("editorSidebar")
 
         sidebar_layout = QVBoxLayout(sidebar)
         sidebar_layout.setContentsMargins(0, 0, 0, 0)
@@ -686,28 +1240,10 @@ class ImageEditorScreen(BaseScreen):
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll.setStyleSheet(
-            """
-            QScrollArea {
-                background: transparent;
-                border: none;
-            }
-        """
-        )
+        scroll.setObjectName("editorSidebarScroll")
 
         scroll_content = QWidget()
-        scroll_content.setStyleSheet(
-            """
-            QWidget {
-                background: transparent;
-                border: none;
-            }
-            QLabel {
-                background: transparent;
-                border: none;
-            }
-        """
-        )
+        scroll_content.setObjectName("editorSidebarContent")
         scroll_layout = QVBoxLayout(scroll_content)
         scroll_layout.setContentsMargins(0, 0, 0, 0)
         scroll_layout.setSpacing(0)
@@ -726,28 +1262,12 @@ class ImageEditorScreen(BaseScreen):
 
         # Photoshopで開くボタン
         photoshop_container = QWidget()
-        photoshop_container.setStyleSheet("background: transparent; border: none;")
+        photoshop_container.setObjectName("editorPhotoshopContainer")
         photoshop_layout = QVBoxLayout(photoshop_container)
         photoshop_layout.setContentsMargins(16, 8, 16, 8)
 
         photoshop_btn = QPushButton("🎨 Photoshopで開く")
-        photoshop_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(0, 122, 255, 0.15);
-                border: 1px solid rgba(0, 122, 255, 0.3);
-                border-radius: 8px;
-                padding: 12px;
-                color: #5ac8fa;
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background: rgba(0, 122, 255, 0.25);
-                border-color: rgba(0, 122, 255, 0.5);
-            }
-            QPushButton:pressed {
-                background: rgba(0, 122, 255, 0.35);
-            }
-        """)
+        photoshop_btn.setObjectName("editorPhotoshopBtn")
         photoshop_btn.clicked.connect(self._on_open_in_photoshop)
         photoshop_layout.addWidget(photoshop_btn)
         sidebar_layout.addWidget(photoshop_container)
@@ -761,19 +1281,7 @@ class ImageEditorScreen(BaseScreen):
     def _create_background_section(self) -> QWidget:
         """Backgroundセクションを作成."""
         section = QWidget()
-        section.setStyleSheet(
-            """
-            QWidget {
-                background: transparent;
-                border: none;
-                border-bottom: 1px solid #2a2a35;
-            }
-            QLabel {
-                background: transparent;
-                border: none;
-            }
-        """
-        )
+        section.setObjectName("editorSection")
 
         layout = QVBoxLayout(section)
         layout.setContentsMargins(24, 24, 24, 24)
@@ -782,24 +1290,17 @@ class ImageEditorScreen(BaseScreen):
         # セクションヘッダー
         header = QHBoxLayout()
         icon = QLabel("🖼")
-        icon.setStyleSheet("font-size: 12px; color: #00c2a8;")
+        icon.setObjectName("editorSectionIcon")
         header.addWidget(icon)
 
         title = QLabel("BACKGROUND")
-        title.setStyleSheet(
-            """
-            font-size: 10px;
-            font-weight: bold;
-            letter-spacing: 2px;
-            color: #888;
-        """
-        )
+        title.setObjectName("editorSectionTitle")
         header.addWidget(title)
         header.addStretch()
 
         # スライダー操作ヒント
         slider_hint = QLabel("Tab: 移動 / ←→: 調整")
-        slider_hint.setStyleSheet("color: #555; font-size: 9px;")
+        slider_hint.setObjectName("editorHint")
         header.addWidget(slider_hint)
 
         layout.addLayout(header)
@@ -807,34 +1308,19 @@ class ImageEditorScreen(BaseScreen):
         # 背景除去トグル
         toggle_row = QHBoxLayout()
         toggle_label = QLabel("背景除去")
-        toggle_label.setStyleSheet("font-size: 11px; color: #aaa;")
+        toggle_label.setObjectName("editorFieldLabel")
         toggle_row.addWidget(toggle_label)
         toggle_row.addStretch()
 
         self._bg_toggle = QCheckBox()
         self._bg_toggle.setChecked(True)
-        self._bg_toggle.setStyleSheet(
-            """
-            QCheckBox {
-                spacing: 0px;
-            }
-            QCheckBox::indicator {
-                width: 36px;
-                height: 20px;
-                border-radius: 10px;
-                background: #2a2a35;
-            }
-            QCheckBox::indicator:checked {
-                background: #00c2a8;
-            }
-        """
-        )
+        self._bg_toggle.setObjectName("editorToggle")
         self._bg_toggle.stateChanged.connect(self._on_bg_toggle_changed)
         toggle_row.addWidget(self._bg_toggle)
 
         # ショートカットヒント
         bg_hint = QLabel("⌥⌘R")
-        bg_hint.setStyleSheet("color: #555; font-size: 9px;")
+        bg_hint.setObjectName("editorHint")
         toggle_row.addWidget(bg_hint)
 
         layout.addLayout(toggle_row)
@@ -842,68 +1328,50 @@ class ImageEditorScreen(BaseScreen):
         # 中央寄せトグル
         center_row = QHBoxLayout()
         center_label = QLabel("中央寄せ")
-        center_label.setStyleSheet("font-size: 11px; color: #aaa;")
+        center_label.setObjectName("editorFieldLabel")
         center_row.addWidget(center_label)
         center_row.addStretch()
 
         self._center_toggle = QCheckBox()
         self._center_toggle.setChecked(True)
-        self._center_toggle.setStyleSheet(
-            """
-            QCheckBox {
-                spacing: 0px;
-            }
-            QCheckBox::indicator {
-                width: 36px;
-                height: 20px;
-                border-radius: 10px;
-                background: #2a2a35;
-            }
-            QCheckBox::indicator:checked {
-                background: #00c2a8;
-            }
-        """
-        )
+        self._center_toggle.setObjectName("editorToggle")
         self._center_toggle.stateChanged.connect(self._on_center_toggle_changed)
         center_row.addWidget(self._center_toggle)
 
         # ショートカットヒント
         center_hint = QLabel("⌥⌘C")
-        center_hint.setStyleSheet("color: #555; font-size: 9px;")
+        center_hint.setObjectName("editorHint")
         center_row.addWidget(center_hint)
 
         layout.addLayout(center_row)
 
         # ズームスライダー
         zoom_slider = self._create_slider_row(
-            "拡大/縮小", 0, 100, 50, self._on_zoom_changed, suffix="x"
+            "拡大/縮小", 0, 100, 50, _format_zoom
         )
         self._zoom_slider = zoom_slider["slider"]
         self._zoom_value_label = zoom_slider["value_label"]
-        self._zoom_value_label.setText("1.00x")  # 初期値
         layout.addLayout(zoom_slider["layout"])
 
         # X位置スライダー
         pos_x_slider = self._create_slider_row(
-            "左右", 0, 100, 50, self._on_pos_x_changed
+            "左右", 0, 100, 50, _format_offset
         )
         self._pos_x_slider = pos_x_slider["slider"]
         self._pos_x_value_label = pos_x_slider["value_label"]
-        self._pos_x_value_label.setText("0")  # 中央からのオフセット
         layout.addLayout(pos_x_slider["layout"])
 
         # Y位置スライダー
         pos_y_slider = self._create_slider_row(
-            "上下", 0, 100, 50, self._on_pos_y_changed
+            "上下", 0, 100, 50, _format_offset
         )
         self._pos_y_slider = pos_y_slider["slider"]
         self._pos_y_value_label = pos_y_slider["value_label"]
-        self._pos_y_value_label.setText("0")  # 中央からのオフセット
         layout.addLayout(pos_y_slider["layout"])
 
         # エッジ加工スライダー
         edge_slider = self._create_slider_row(
-            "エッジ加工", 0, 100, 12, self._on_edge_changed
+            "エッジ加工", 0, 100, 12, str
         )
         self._edge_slider = edge_slider["slider"]
         self._edge_value_label = edge_slider["value_label"]
@@ -911,7 +1379,7 @@ class ImageEditorScreen(BaseScreen):
 
         # 影濃度スライダー
         shadow_slider = self._create_slider_row(
-            "影濃度", 0, 100, 45, self._on_shadow_changed, suffix="%"
+            "影濃度", 0, 100, 45, _format_percent
         )
         self._shadow_slider = shadow_slider["slider"]
         self._shadow_value_label = shadow_slider["value_label"]
@@ -922,19 +1390,7 @@ class ImageEditorScreen(BaseScreen):
     def _create_contrast_section(self) -> QWidget:
         """Contrastセクションを作成."""
         section = QWidget()
-        section.setStyleSheet(
-            """
-            QWidget {
-                background: transparent;
-                border: none;
-                border-bottom: 1px solid #2a2a35;
-            }
-            QLabel {
-                background: transparent;
-                border: none;
-            }
-        """
-        )
+        section.setObjectName("editorSection")
 
         layout = QVBoxLayout(section)
         layout.setContentsMargins(24, 24, 24, 24)
@@ -943,25 +1399,18 @@ class ImageEditorScreen(BaseScreen):
         # セクションヘッダー
         header = QHBoxLayout()
         icon = QLabel("◐")
-        icon.setStyleSheet("font-size: 12px; color: #00c2a8;")
+        icon.setObjectName("editorSectionIcon")
         header.addWidget(icon)
 
         title = QLabel("CONTRAST")
-        title.setStyleSheet(
-            """
-            font-size: 10px;
-            font-weight: bold;
-            letter-spacing: 2px;
-            color: #888;
-        """
-        )
+        title.setObjectName("editorSectionTitle")
         header.addWidget(title)
         header.addStretch()
         layout.addLayout(header)
 
         # 全体コントラストスライダー
         whole_slider = self._create_slider_row(
-            "全体", -100, 100, 0, self._on_contrast_whole_changed, show_sign=True
+            "全体", -100, 100, 0, _format_signed
         )
         self._contrast_whole_slider = whole_slider["slider"]
         self._contrast_whole_label = whole_slider["value_label"]
@@ -969,7 +1418,7 @@ class ImageEditorScreen(BaseScreen):
 
         # 商品コントラストスライダー
         product_slider = self._create_slider_row(
-            "商品", -100, 100, 0, self._on_contrast_product_changed, show_sign=True
+            "商品", -100, 100, 0, _format_signed
         )
         self._contrast_product_slider = product_slider["slider"]
         self._contrast_product_label = product_slider["value_label"]
@@ -983,28 +1432,25 @@ class ImageEditorScreen(BaseScreen):
         min_val: int,
         max_val: int,
         default: int,
-        callback: Any,
-        suffix: str = "",
-        show_sign: bool = False,
+        formatter: Callable[[int], str],
     ) -> dict[str, Any]:
-        """スライダー行を作成."""
+        """スライダー行を作成.
+
+        ドラッグ中はsliderMovedで値ラベルだけを更新し、
+        パラメータ反映（valueChanged）はハンドルを離した時のみ行う。
+        """
         container = QVBoxLayout()
         container.setSpacing(8)
 
         # ラベル行
         label_row = QHBoxLayout()
         name_label = QLabel(label)
-        name_label.setStyleSheet("font-size: 11px; color: #aaa;")
+        name_label.setObjectName("editorFieldLabel")
         label_row.addWidget(name_label)
         label_row.addStretch()
 
-        value_text = (
-            f"+{default}{suffix}"
-            if show_sign and default >= 0
-            else f"{default}{suffix}"
-        )
-        value_label = QLabel(value_text)
-        value_label.setStyleSheet("font-size: 11px; color: #00c2a8;")
+        value_label = QLabel(formatter(default))
+        value_label.setObjectName("editorValueLabel")
         label_row.addWidget(value_label)
         container.addLayout(label_row)
 
@@ -1014,33 +1460,10 @@ class ImageEditorScreen(BaseScreen):
         slider.setMaximum(max_val)
         slider.setValue(default)
         slider.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
-        slider.setStyleSheet(
-            """
-            QSlider {
-                padding: 2px;
-            }
-            QSlider::groove:horizontal {
-                background: #2a2a35;
-                height: 4px;
-                border-radius: 2px;
-            }
-            QSlider::handle:horizontal {
-                background: #00c2a8;
-                width: 12px;
-                height: 12px;
-                margin: -4px 0;
-                border-radius: 6px;
-            }
-            QSlider::handle:horizontal:hover {
-                background: #00d4b8;
-            }
-            QSlider:focus {
-                border: 2px solid #00c2a8;
-                border-radius: 4px;
-            }
-        """
-        )
-        slider.valueChanged.connect(callback)
+        slider.setObjectName("editorSlider")
+        slider.setTracking(False)
+        slider.sliderMoved.connect(lambda v: value_label.setText(formatter(v)))
+        slider.valueChanged.connect(self._on_params_changed)
         container.addWidget(slider)
 
         return {
@@ -1052,12 +1475,7 @@ class ImageEditorScreen(BaseScreen):
     def _create_sidebar_footer(self) -> QWidget:
         """サイドバーフッターを作成."""
         footer = QWidget()
-        footer.setStyleSheet(
-            """
-            background: rgba(22, 22, 30, 0.8);
-            border-top: 1px solid #2a2a35;
-        """
-        )
+        footer.setObjectName("editorFooter")
 
         layout = QVBoxLayout(footer)
         layout.setContentsMargins(24, 24, 24, 24)
@@ -1066,24 +1484,7 @@ class ImageEditorScreen(BaseScreen):
         # 前の商品ボタン
         prev_btn = QPushButton("< 前の商品へ (⌥⌘←)")
         prev_btn.setFixedHeight(40)
-        prev_btn.setStyleSheet(
-            """
-            QPushButton {
-                background: rgba(255, 255, 255, 0.05);
-                border: 1px solid #2a2a35;
-                border-radius: 8px;
-                color: #aaa;
-                font-size: 11px;
-                font-weight: bold;
-                letter-spacing: 1px;
-            }
-            QPushButton:hover {
-                background: rgba(255, 255, 255, 0.1);
-                border-color: rgba(255, 255, 255, 0.2);
-                color: #fff;
-            }
-        """
-        )
+        prev_btn.setObjectName("editorPrevProductBtn")
         prev_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         prev_btn.clicked.connect(self.prev_product_requested.emit)
         layout.addWidget(prev_btn)
@@ -1091,23 +1492,7 @@ class ImageEditorScreen(BaseScreen):
         # 次の商品ボタン
         next_btn = QPushButton("次の商品へ > (⌥⌘→)")
         next_btn.setFixedHeight(40)
-        next_btn.setStyleSheet(
-            """
-            QPushButton {
-                background: rgba(0, 194, 168, 0.05);
-                border: 1px solid rgba(0, 194, 168, 0.3);
-                border-radius: 8px;
-                color: #00c2a8;
-                font-size: 11px;
-                font-weight: bold;
-                letter-spacing: 1px;
-            }
-            QPushButton:hover {
-                background: rgba(0, 194, 168, 0.1);
-                border-color: #00c2a8;
-            }
-        """
-        )
+        next_btn.setObjectName("editorNextProductBtn")
         next_btn.setCursor(QCursor(Qt.CursorShape.PointingHandCursor))
         next_btn.clicked.connect(self.next_product_requested.emit)
         layout.addWidget(next_btn)
@@ -1134,11 +1519,11 @@ class ImageEditorScreen(BaseScreen):
 
     def _on_bg_toggle_changed(self, state: int) -> None:
         """背景除去トグル変更."""
-        self._bg_removal_enabled = state == Qt.CheckState.Checked.value
+        self._params.bg_removal_enabled = state == Qt.CheckState.Checked.value
 
-        # ONにしたときにマスクがなければローディング表示
-        if self._bg_removal_enabled and not self._product_mask:
-            self._show_loading()
+        # ONにしたときにマスクがなければバックグラウンドで生成
+        if self._params.bg_removal_enabled and self._product_mask is None:
+            self._start_mask_generation()
 
         # センタリングと商品/背景コントラストの有効/無効を切り替え
         self._update_controls_enabled_state()
@@ -1147,7 +1532,7 @@ class ImageEditorScreen(BaseScreen):
 
     def _update_controls_enabled_state(self) -> None:
         """背景除去の状態に応じてコントロールの有効/無効を切り替え."""
-        bg_enabled = self._bg_removal_enabled
+        bg_enabled = self._params.bg_removal_enabled
 
         # 背景除去OFFの場合、以下を無効化
         # - 中央寄せトグル
@@ -1166,63 +1551,40 @@ class ImageEditorScreen(BaseScreen):
 
     def _on_center_toggle_changed(self, state: int) -> None:
         """中央寄せトグル変更."""
-        self._centering_enabled = state == Qt.CheckState.Checked.value
+        self._params.centering_enabled = state == Qt.CheckState.Checked.value
 
         # ズーム・位置パラメータをリセット
-        self._zoom_value = 50  # scale 1.0
-        self._pos_x_value = 50  # 中央
-        self._pos_y_value = 50  # 中央
+        self._params.zoom = 50  # scale 1.0
+        self._params.pos_x = 50  # 中央
+        self._params.pos_y = 50  # 中央
         self._zoom_slider.setValue(50)
         self._pos_x_slider.setValue(50)
         self._pos_y_slider.setValue(50)
-        self._zoom_value_label.setText("1.00x")
-        self._pos_x_value_label.setText("0")
-        self._pos_y_value_label.setText("0")
+        self._update_value_labels()
 
         self._schedule_preview_update()
 
-    def _on_edge_changed(self, value: int) -> None:
-        """エッジ加工スライダー変更."""
-        self._edge_value = value
-        self._edge_value_label.setText(str(value))
+    def _on_params_changed(self, _value: int = 0) -> None:
+        """スライダー確定時に全スライダーの値をまとめて反映."""
+        self._params.edge = self._edge_slider.value()
+        self._params.shadow = self._shadow_slider.value()
+        self._params.contrast_whole = self._contrast_whole_slider.value()
+        self._params.contrast_product = self._contrast_product_slider.value()
+        self._params.zoom = self._zoom_slider.value()
+        self._params.pos_x = self._pos_x_slider.value()
+        self._params.pos_y = self._pos_y_slider.value()
+        self._update_value_labels()
         self._schedule_preview_update()
 
-    def _on_shadow_changed(self, value: int) -> None:
-        """影濃度スライダー変更."""
-        self._shadow_value = value
-        self._shadow_value_label.setText(f"{value}%")
-        self._schedule_preview_update()
-
-    def _on_contrast_whole_changed(self, value: int) -> None:
-        """全体コントラストスライダー変更."""
-        self._contrast_whole = value
-        self._contrast_whole_label.setText(f"+{value}" if value >= 0 else str(value))
-        self._schedule_preview_update()
-
-    def _on_contrast_product_changed(self, value: int) -> None:
-        """商品コントラストスライダー変更."""
-        self._contrast_product = value
-        self._contrast_product_label.setText(f"+{value}" if value >= 0 else str(value))
-        self._schedule_preview_update()
-
-    def _on_zoom_changed(self, value: int) -> None:
-        """ズームスライダー変更."""
-        self._zoom_value = value
-        scale = slider_to_scale(value)
-        self._zoom_value_label.setText(f"{scale:.2f}x")
-        self._schedule_preview_update()
-
-    def _on_pos_x_changed(self, value: int) -> None:
-        """X位置スライダー変更."""
-        self._pos_x_value = value
-        self._pos_x_value_label.setText(str(value - 50))
-        self._schedule_preview_update()
-
-    def _on_pos_y_changed(self, value: int) -> None:
-        """Y位置スライダー変更."""
-        self._pos_y_value = value
-        self._pos_y_value_label.setText(str(value - 50))
-        self._schedule_preview_update()
+    def _update_value_labels(self) -> None:
+        """パラメータの値でスライダーの値ラベルを更新."""
+        self._edge_value_label.setText(str(self._params.edge))
+        self._shadow_value_label.setText(_format_percent(self._params.shadow))
+        self._contrast_whole_label.setText(_format_signed(self._params.contrast_whole))
+        self._contrast_product_label.setText(_format_signed(self._params.contrast_product))
+        self._zoom_value_label.setText(_format_zoom(self._params.zoom))
+        self._pos_x_value_label.setText(_format_offset(self._params.pos_x))
+        self._pos_y_value_label.setText(_format_offset(self._params.pos_y))
 
     def _schedule_preview_update(self) -> None:
         """プレビュー更新をスケジュール（デバウンス）."""
@@ -1231,12 +1593,12 @@ class ImageEditorScreen(BaseScreen):
 
     def _scroll_thumbnails_left(self) -> None:
         """サムネイルを左にスクロール."""
-        scrollbar = self._thumbnail_scroll.horizontalScrollBar()
+        scrollbar = self._thumbnail_view.horizontalScrollBar()
         scrollbar.setValue(scrollbar.value() - 200)
 
     def _scroll_thumbnails_right(self) -> None:
         """サムネイルを右にスクロール."""
-        scrollbar = self._thumbnail_scroll.horizontalScrollBar()
+        scrollbar = self._thumbnail_view.horizontalScrollBar()
         scrollbar.setValue(scrollbar.value() + 200)
 
     def _on_prev_image(self) -> None:
@@ -1290,26 +1652,12 @@ class ImageEditorScreen(BaseScreen):
 
     def _do_scroll_to_thumbnail(self, image_id: int) -> None:
         """実際のスクロール処理."""
-        if image_id not in self._thumbnail_items:
+        index = self._thumbnail_model.index_of(image_id)
+        if not index.isValid():
             return
 
-        thumbnail = self._thumbnail_items[image_id]
-        # サムネイルの位置を取得
-        thumb_pos = thumbnail.pos().x()
-        thumb_width = thumbnail.width()
-
-        # スクロールエリアの表示幅を取得
-        scroll_width = self._thumbnail_scroll.viewport().width()
-
-        # スクロールバーを取得して位置を設定
-        scrollbar = self._thumbnail_scroll.horizontalScrollBar()
-        current_scroll = scrollbar.value()
-
         # サムネイルが表示領域の外にある場合のみスクロール
-        if thumb_pos < current_scroll:
-            scrollbar.setValue(thumb_pos)
-        elif thumb_pos + thumb_width > current_scroll + scroll_width:
-            scrollbar.setValue(thumb_pos + thumb_width - scroll_width)
+        self._thumbnail_view.scrollTo(index, QListView.ScrollHint.EnsureVisible)
 
     def _on_thumbnail_clicked(self, image_id: int) -> None:
         """サムネイルクリック."""
@@ -1336,6 +1684,13 @@ class ImageEditorScreen(BaseScreen):
         self._current_image_id = image_id
         self._current_product_id = self._image_model.product_id
 
+        # スライダー初期化で発火するハンドラが前の画像でマスク生成しないよう先にクリア
+        self._original_image = None
+        self._product_mask = None
+        self._preview_image = None
+        self._preview_product_mask = None
+        self._preview_product_mask_array = None
+
         # 商品の全画像を取得（sortで並び替え）
         self._product_images = list(
             ProductImageModel.select()
@@ -1354,9 +1709,16 @@ class ImageEditorScreen(BaseScreen):
         # サムネイルストリップを更新
         self._refresh_thumbnail_strip()
 
+        # 別の画像に切り替わるので、最初のプレビューでビューにフィットさせる
+        self._canvas.request_fit()
+
         # 画像を読み込み
         self._load_image_files()
 
+        # 背景除去ONでマスクがなければバックグラウンドで生成
+        if self._params.bg_removal_enabled and self._product_mask is None:
+            self._start_mask_generation()
+
         # コントロールの有効/無効状態を更新
         self._update_controls_enabled_state()
 
@@ -1370,32 +1732,32 @@ class ImageEditorScreen(BaseScreen):
 
         # エッジ: 0-10 → 0-100
         edge_ui = self._image_model.edge_threshold * 10
-        self._edge_value = edge_ui
+        self._params.edge = edge_ui
         self._edge_slider.setValue(edge_ui)
 
         # 影: 0.0-1.0 → 0-100
         shadow_ui = int(self._image_model.shadow_threshold * 100)
-        self._shadow_value = shadow_ui
+        self._params.shadow = shadow_ui
         self._shadow_slider.setValue(shadow_ui)
 
         # コントラスト: そのまま
-        self._contrast_whole = self._image_model.whole_contrast
+        self._params.contrast_whole = self._image_model.whole_contrast
         self._contrast_whole_slider.setValue(self._image_model.whole_contrast)
-        self._contrast_product = self._image_model.product_contrast
+        self._params.contrast_product = self._image_model.product_contrast
         self._contrast_product_slider.setValue(self._image_model.product_contrast)
 
         # 背景除去
-        self._bg_removal_enabled = self._image_model.is_background_removed
+        self._params.bg_removal_enabled = self._image_model.is_background_removed
         self._bg_toggle.setChecked(self._image_model.is_background_removed)
 
         # 中央寄せ（マスクがない場合は無効化）
         has_mask = bool(self._image_model.product_mask_filepath)
         if has_mask:
-            self._centering_enabled = self._image_model.is_centered
+            self._params.centering_enabled = self._image_model.is_centered
             self._center_toggle.setChecked(self._image_model.is_centered)
             self._center_toggle.setEnabled(True)
         else:
-            self._centering_enabled = False
+            self._params.centering_enabled = False
             self._center_toggle.setChecked(False)
             self._center_toggle.setEnabled(False)
 
@@ -1404,9 +1766,8 @@ class ImageEditorScreen(BaseScreen):
             transform = TransformParams.from_json(self._image_model.transform_json)
 
             # ズームスライダー
-            self._zoom_value = scale_to_slider(transform.scale)
-            self._zoom_slider.setValue(self._zoom_value)
-            self._zoom_value_label.setText(f"{transform.scale:.2f}x")
+            self._params.zoom = scale_to_slider(transform.scale)
+            self._zoom_slider.setValue(self._params.zoom)
 
             # 位置スライダー（bboxからscaled_sizeを計算）
             if transform.bbox:
@@ -1415,31 +1776,28 @@ class ImageEditorScreen(BaseScreen):
                 scaled_w = int(bbox_w * transform.scale)
                 scaled_h = int(bbox_h * transform.scale)
 
-                self._pos_x_value = translate_to_slider(
+                self._params.pos_x = translate_to_slider(
                     transform.translate_x, scaled_w, transform.canvas_width
                 )
-                self._pos_y_value = translate_to_slider(
+                self._params.pos_y = translate_to_slider(
                     transform.translate_y, scaled_h, transform.canvas_height
                 )
             else:
-                self._pos_x_value = 50
-                self._pos_y_value = 50
+                self._params.pos_x = 50
+                self._params.pos_y = 50
 
-            self._pos_x_slider.setValue(self._pos_x_value)
-            self._pos_y_slider.setValue(self._pos_y_value)
-            self._pos_x_value_label.setText(str(self._pos_x_value - 50))
-            self._pos_y_value_label.setText(str(self._pos_y_value - 50))
+            self._pos_x_slider.setValue(self._params.pos_x)
+            self._pos_y_slider.setValue(self._params.pos_y)
         else:
             # デフォルト値（zoom 50 = scale 1.0）
-            self._zoom_value = 50
-            self._pos_x_value = 50
-            self._pos_y_value = 50
+            self._params.zoom = 50
+            self._params.pos_x = 50
+            self._params.pos_y = 50
             self._zoom_slider.setValue(50)
             self._pos_x_slider.setValue(50)
             self._pos_y_slider.setValue(50)
-            self._zoom_value_label.setText("1.00x")
-            self._pos_x_value_label.setText("0")
-            self._pos_y_value_label.setText("0")
+
+        self._update_value_labels()
 
     def _load_image_files(self) -> None:
         """画像ファイルを読み込む."""
@@ -1448,30 +1806,26 @@ class ImageEditorScreen(BaseScreen):
 
         # キャッシュをリセット
         self._original_image = None
+        self._original_size = None
         self._product_mask = None
-        self._bg_mask = None
         self._cached_bbox = None
+        self._preview_image = None
+        self._preview_product_mask = None
+        self._preview_product_mask_array = None
         self._clear_mask_cache()  # パラメータ別キャッシュもクリア
 
-        # 編集用画像（リサイズ版 - マスクとサイズ一致）
-        if self._image_model.filepath:
-            path = Path(self._image_model.filepath)
-            if path.exists():
-                self._original_image = Image.open(path)
-                if self._original_image.mode != "RGBA":
-                    self._original_image = self._original_image.convert("RGBA")
-
-        # 商品マスク
-        if self._image_model.product_mask_filepath:
-            path = Path(self._image_model.product_mask_filepath)
-            if path.exists():
-                self._product_mask = Image.open(path).convert("L")
-
-        # 背景マスク
-        if self._image_model.background_mask_filepath:
-            path = Path(self._image_model.background_mask_filepath)
-            if path.exists():
-                self._bg_mask = Image.open(path).convert("L")
+        # 編集用画像（リサイズ版 - マスクとサイズ一致）はプレビュー用の縮小版だけを読み込み、
+        # フル解像度は書き出し時に_get_original_imageで読み込む（マスク生成はワーカーが読み込む）
+        # 先読み済みならデコード結果を再利用する
+        files = self._editor_image_files(self._image_model)
+        data = self._preloader.get(self._image_model.id, files)
+        if data is None:
+            data = load_editor_image(files, self.PREVIEW_MAX_SIZE)
+            self._preloader.put(self._image_model.id, data)
+        self._preview_image = data.preview
+        self._original_size = data.image_size
+        self._product_mask = data.product_mask
+        self._preview_product_mask = data.preview_product_mask
 
         # bboxをDBから復元
         if (
@@ -1487,26 +1841,71 @@ class ImageEditorScreen(BaseScreen):
         else:
             self._cached_bbox = None
 
+        # プレビュー用の縮小版を作成
+        self._build_preview_sources()
+
+        # 前後の画像をバックグラウンドで先読み
+        self._preload_neighbor_images()
+
+    @staticmethod
+    def _editor_image_files(model: ProductImageModel) -> EditorImageFiles:
+        """画像モデルから読み込み対象のファイルパス一式を取得."""
+        return EditorImageFiles(
+            filepath=model.filepath,
+            product_mask_filepath=model.product_mask_filepath,
+        )
+
+    def _preload_neighbor_images(self) -> None:
+        """現在の画像の前後の画像を先読み."""
+        current_index = next(
+            (i for i, m in enumerate(self._product_images) if m.id == self._current_image_id),
+            None,
+        )
+        if current_index is None:
+            return
+
+        for index in (current_index + 1, current_index - 1):
+            if 0 <= index < len(self._product_images):
+                model = self._product_images[index]
+                self._preloader.preload(model.id, self._editor_image_files(model))
+
+    def _get_original_image(self) -> Image.Image | None:
+        """フル解像度の編集用画像を取得（初回のみ読み込む）."""
+        if self._original_image is None and self._image_model and self._image_model.filepath:
+            path = Path(self._image_model.filepath)
+            if path.exists():
+                image = Image.open(path)
+                image.load()  # ワーカーと共有するため遅延デコードを残さない
+                self._original_image = image if image.mode == "RGBA" else image.convert("RGBA")
+        return self._original_image
+
+    def _build_preview_sources(self) -> None:
+        """プレビュー用の縮小率とマスクの縮小版を作成.
+
+        マスクの縮小版は読み込み時（先読みワーカー）に作成済みならそれを使う。
+        """
+        if not self._preview_image or not self._original_size:
+            self._preview_product_mask = None
+            self._preview_product_mask_array = None
+            self._preview_scale = 1.0
+            return
+
+        self._preview_scale = self._preview_image.width / self._original_size[0]
+
+        if self._product_mask is not None:
+            if self._preview_product_mask is None:
+                self._preview_product_mask = resize_preview_mask(
+                    self._product_mask, self._preview_image.size
+                )
+            self._preview_product_mask_array = np.asarray(self._preview_product_mask)
+            self._precompute_refined_masks()
+        else:
+            self._preview_product_mask = None
+            self._preview_product_mask_array = None
+
     def _refresh_thumbnail_strip(self) -> None:
         """サムネイルストリップを更新."""
-        # 既存のサムネイルをクリア
-        for item in self._thumbnail_items.values():
-            item.deleteLater()
-        self._thumbnail_items.clear()
-
-        # 新しいサムネイルを追加
-        for img_model in self._product_images:
-            item = ThumbnailItem(
-                image_id=img_model.id,
-                filepath=img_model.thumbnail_filepath,
-                name=img_model.name,
-            )
-            item.clicked.connect(self._on_thumbnail_clicked)
-            item.reordered.connect(self._on_thumbnail_reordered)
-            item.set_selected(img_model.id == self._current_image_id)
-
-            self._thumbnail_layout.addWidget(item)
-            self._thumbnail_items[img_model.id] = item
+        self._thumbnail_model.set_images(self._product_images, self._current_image_id)
 
     def _on_thumbnail_reordered(self, source_id: int, target_id: int) -> None:
         """サムネイルの並び替え処理."""
@@ -1525,195 +1924,365 @@ class ImageEditorScreen(BaseScreen):
         item = self._product_images.pop(source_idx)
         self._product_images.insert(target_idx, item)
 
-        # 全画像のsortを更新
-        for i, model in enumerate(self._product_images):
-            model.sort = i + 1
-            model.save()
+        # 全画像のsortを1トランザクションで更新
+        with get_database().atomic():
+            for i, model in enumerate(self._product_images):
+                model.sort = i + 1
+                model.save()
 
         # UIを更新
         self._refresh_thumbnail_strip()
 
     def _select_image(self, image_id: int) -> None:
         """画像を選択."""
-        # 現在の画像を保存（切り替え前）
+        # 現在の画像を保存（切り替え前、DB更新は_save_parametersで1回にまとめる）
         self._save_final_image()
         self._save_parameters()
 
-        # 古い選択を解除
-        if self._current_image_id and self._current_image_id in self._thumbnail_items:
-            self._thumbnail_items[self._current_image_id].set_selected(False)
-
         # 新しい画像を読み込み
         self._load_image(image_id)
 
         # 新しい選択を設定
-        if image_id in self._thumbnail_items:
-            self._thumbnail_items[image_id].set_selected(True)
+        self._thumbnail_model.set_selected(image_id)
 
     def _update_preview(self) -> None:
-        """プレビュー画像を更新."""
-        if not self._image_model or not self._original_image:
-            return
+        """プレビュー画像の更新を開始.
 
-        # ベース画像
-        image = self._original_image.copy()
+        描画はPreviewRenderWorkerで行い、完了時に_on_preview_renderedで表示する。
+        描画中に届いたリクエストは実行中の描画をキャンセルして最新の1件だけを保留し、
+        描画スレッドが同時に1つだけになるようにする。
+        入力が前回の描画と同じ場合（トグルの往復やスライダーを元の値に戻した場合など）は何もしない。
+        """
+        if not self._image_model or not self._preview_image:
+            return
 
-        # 背景除去がONの場合
-        if self._bg_removal_enabled:
-            # マスクがなければ生成
-            if not self._product_mask:
-                self._show_loading()
-                if not self._perform_background_removal():
-                    self._hide_loading()
-                    return
+        source = PreviewSource(
+            image_id=self._image_model.id,
+            image=self._preview_image,
+            product_mask=self._preview_product_mask,
+            product_mask_array=self._preview_product_mask_array,
+            scale=self._preview_scale,
+            bbox=self._cached_bbox,
+            params=replace(self._params),
+            refined_mask_cache=self._refined_mask_cache,
+            stage_cache=self._stage_cache,
+        )
+        if source.renders_same_as(self._last_preview_source):
+            return
+        self._last_preview_source = source
 
-            # エッジパラメータ計算
-            erode = max(0, self._edge_value // 20)  # 0-100 → 0-5
-            feather = self._edge_value / 100.0  # 0-100 → 0.0-1.0
+        if self._preview_workers:
+            # 実行中の描画の完了（キャンセル）を待ってから最新の入力で描画する
+            for worker in self._preview_workers.values():
+                worker.requestInterruption()
+            self._pending_preview_source = source
+            return
 
-            # エッジ調整済みマスクを取得（キャッシュ利用）
-            refined_mask = self._get_refined_mask(erode, feather)
+        self._start_preview_render(source)
 
-            # マスクを適用して背景を透過
-            if refined_mask.size != image.size:
-                refined_mask = refined_mask.resize(image.size, Image.Resampling.LANCZOS)
-            image.putalpha(refined_mask)
+    def _start_preview_render(self, source: PreviewSource) -> None:
+        """プレビュー描画ワーカーを開始."""
+        self._preview_generation += 1
+        generation = self._preview_generation
+        worker = PreviewRenderWorker(generation, partial(self._render_preview, source))
+        worker.finished.connect(self._on_preview_rendered)
+        self._preview_workers[generation] = worker
+        worker.start()
 
-            # ズーム・位置・中央寄せの適用
-            zoom_multiplier = slider_to_scale(self._zoom_value)
+    def _render_preview(
+        self, source: PreviewSource, is_cancelled: Callable[[], bool]
+    ) -> QImage | None:
+        """プレビュー画像を描画（ワーカースレッドで実行）.
 
-            # 被写体サイズからtranslate計算（auto-scale考慮）
-            canvas_size = 1200
-            available_size = int(canvas_size * 0.9)  # margin_ratio=0.05
-            if self._cached_bbox:
-                bbox_w = self._cached_bbox[2] - self._cached_bbox[0]
-                bbox_h = self._cached_bbox[3] - self._cached_bbox[1]
-                auto_scale = min(available_size / bbox_w, available_size / bbox_h)
-                final_scale = auto_scale * zoom_multiplier
-                scaled_w = int(bbox_w * final_scale)
-                scaled_h = int(bbox_h * final_scale)
-            else:
-                scaled_w = scaled_h = int(600 * zoom_multiplier)
+        縮小版（最大PREVIEW_MAX_SIZE）で処理する。フル解像度は_generate_final_imageで生成。
 
-            translate_x = slider_to_translate(self._pos_x_value, scaled_w, canvas_size)
-            translate_y = slider_to_translate(self._pos_y_value, scaled_h, canvas_size)
+        Args:
+            source: 描画の入力
+            is_cancelled: キャンセル判定関数（各処理段階の間で確認）
 
-            image = self._centerer.center_image(
-                image,
-                bbox=self._cached_bbox,
-                translate_x=translate_x,
-                translate_y=translate_y,
-                auto_center=self._centering_enabled,
-                zoom_multiplier=zoom_multiplier,
+        Returns:
+            描画結果（キャンセルされた場合はNone）
+        """
+        params = source.params
+        image = source.image
+
+        # 背景除去がONの場合（マスクはワーカーで生成済みのものだけを使う）
+        if params.bg_removal_enabled and source.product_mask:
+            # 切り抜き・配置と影はトーン・影の濃さに依存しないため、配置パラメータごとにキャッシュ
+            layout_key = (
+                params.edge,
+                params.centering_enabled,
+                params.zoom,
+                params.pos_x,
+                params.pos_y,
+                source.bbox,
             )
-
-            # 影追加（キャッシュ利用）
-            shadow_opacity = int(self._shadow_value * 2.55)  # 0-100 → 0-255
-            if shadow_opacity > 0:
-                # センタリング後のアルファから影用マスクを取得
-                shadow_mask = image.getchannel("A")
-                shadow_bg = self._get_shadow_layer(
-                    shadow_opacity, image.size, shadow_mask
+            image = source.stage_cache.get_or_create(
+                ("layout", *layout_key), partial(self._layout_preview, source)
+            )
+            if is_cancelled():
+                return None
+
+            shadow = None
+            if params.shadow > 0:
+                shadow = source.stage_cache.get_or_create(
+                    ("shadow", *layout_key),
+                    partial(self._preview_composer.shadow_silhouette, image),
                 )
-                image = Image.alpha_composite(shadow_bg, image)
-            else:
-                # 影なしの場合は白背景に合成
-                white_bg = Image.new("RGBA", image.size, (255, 255, 255, 255))
-                image = Image.alpha_composite(white_bg, image)
+                if is_cancelled():
+                    return None
 
-        # 商品コントラスト調整（マスクがある場合のみ適用可能）
-        if (
-            self._bg_removal_enabled
-            and self._product_mask
-            and self._contrast_product != 0
-        ):
-            # センタリング適用時はセンタリング後の画像からマスクを取得
-            if self._centering_enabled:
-                centered_product_mask = image.getchannel("A")
-            else:
-                centered_product_mask = self._product_mask
+        whole_params = ToneParameters(
+            brightness=params.contrast_whole * 0.5,
+            contrast=1.0 + params.contrast_whole / 200.0,
+            gamma=1.0,
+        )
 
-            product_params = ToneParameters(
-                brightness=self._contrast_product * 0.5,
-                contrast=1.0 + self._contrast_product / 200.0,
-                gamma=1.0,
-            )
-            product_adjusted = self._tone_adjuster.adjust(image, product_params)
-            # マスクサイズを調整
-            if centered_product_mask.size != image.size:
-                centered_product_mask = centered_product_mask.resize(
-                    image.size, Image.Resampling.LANCZOS
+        if params.bg_removal_enabled and source.product_mask:
+            # 商品コントラスト調整（マスクがある場合のみ適用可能）
+            product_params = None
+            product_mask = None
+            if params.contrast_product != 0:
+                product_params = ToneParameters(
+                    brightness=params.contrast_product * 0.5,
+                    contrast=1.0 + params.contrast_product / 200.0,
+                    gamma=1.0,
                 )
-            image = Image.composite(product_adjusted, image, centered_product_mask)
+                # センタリング適用時は背景合成後のアルファ（全面不透明）をマスクとするため、
+                # 書き出しと同じく画像全体に商品トーンを適用する（product_mask=None）
+                if not params.centering_enabled:
+                    product_mask = source.product_mask_array
+
+            # 影追加・背景合成・商品/全体コントラストを1パスで適用し、配列から直接QImage化
+            shadow_opacity = int(params.shadow * 2.55)  # 0-100 → 0-255
+            composed = self._preview_composer.compose_array(
+                image, shadow_opacity, whole_params, product_params, product_mask, shadow
+            )
+            return _array_to_qimage(composed)
 
         # 全体のコントラスト
-        if self._contrast_whole != 0:
-            params = ToneParameters(
-                brightness=self._contrast_whole * 0.5,
-                contrast=1.0 + self._contrast_whole / 200.0,
-                gamma=1.0,
-            )
-            image = self._tone_adjuster.adjust(image, params)
+        elif params.contrast_whole != 0:
+            image = self._tone_adjuster.adjust(image, whole_params)
 
-        # プレビューに表示
-        self._display_preview(image)
+        return _pil_to_qimage(image)
 
-        # ローディングを非表示
-        self._hide_loading()
+    def _layout_preview(self, source: PreviewSource) -> Image.Image:
+        """エッジ調整済みマスクで切り抜き、ズーム・位置・中央寄せを適用する.
 
-    def _get_refined_mask(self, erode: int, feather: float) -> Image.Image:
-        """パラメータに対応するrefined_maskを取得（キャッシュ利用）.
+        Args:
+            source: 描画の入力
+
+        Returns:
+            切り抜き・配置済みのRGBA画像
+        """
+        params = source.params
+
+        # エッジ調整済みマスクを取得（事前計算済みのマスクを補間）
+        refined_mask = self._get_refined_mask(source, params.edge)
+
+        # マスクを適用して背景を透過
+        image = source.image.copy()
+        if refined_mask.size != image.size:
+            refined_mask = refined_mask.resize(image.size, Image.Resampling.LANCZOS)
+        image.putalpha(refined_mask)
+
+        # ズーム・位置・中央寄せの適用
+        zoom_multiplier = slider_to_scale(params.zoom)
+
+        # 被写体サイズからtranslate計算（auto-scale考慮）
+        canvas_size = 1200
+        available_size = int(canvas_size * 0.9)  # margin_ratio=0.05
+        if source.bbox:
+            bbox_w = source.bbox[2] - source.bbox[0]
+            bbox_h = source.bbox[3] - source.bbox[1]
+            auto_scale = min(available_size / bbox_w, available_size / bbox_h)
+            final_scale = auto_scale * zoom_multiplier
+            scaled_w = int(bbox_w * final_scale)
+            scaled_h = int(bbox_h * final_scale)
+        else:
+            scaled_w = scaled_h = int(600 * zoom_multiplier)
+
+        translate_x = slider_to_translate(params.pos_x, scaled_w, canvas_size)
+        translate_y = slider_to_translate(params.pos_y, scaled_h, canvas_size)
+
+        # キャンバス・bbox・移動量をプレビュー解像度に換算
+        canvas_scale = min(1.0, self.PREVIEW_MAX_SIZE / canvas_size)
+        preview_canvas = int(canvas_size * canvas_scale)
+        preview_bbox = (
+            tuple(int(v * source.scale) for v in source.bbox)
+            if source.bbox
+            else None
+        )
+
+        return self._centerer.center_image(
+            image,
+            canvas_size=(preview_canvas, preview_canvas),
+            bbox=preview_bbox,
+            translate_x=translate_x * canvas_scale,
+            translate_y=translate_y * canvas_scale,
+            auto_center=params.centering_enabled,
+            zoom_multiplier=zoom_multiplier,
+            # プレビューは縮小版なのでLANCZOSとの画質差は小さく、速度を優先する
+            resample=Image.Resampling.BILINEAR,
+        )
+
+    def _on_preview_rendered(self, generation: int, image: QImage | None) -> None:
+        """プレビュー描画完了時の処理（GUIスレッド）."""
+        self._release_preview_worker(generation)
+
+        # 保留中のリクエストがある場合は古い結果を破棄して描画し直す
+        if self._pending_preview_source is not None:
+            source = self._pending_preview_source
+            self._pending_preview_source = None
+            self._start_preview_render(source)
+            return
+        if generation != self._preview_generation:
+            return
+        if image is None:
+            # 最新の描画が中断・失敗した場合は、同じ入力でも次回は描画し直す
+            self._last_preview_source = None
+            return
+
+        # キャンバスに画像を設定（ズーム・パン対応）
+        self._canvas.set_image(QPixmap.fromImage(image))
+
+    def _release_preview_worker(self, generation: int) -> None:
+        """完了したプレビュー描画ワーカーの参照を破棄."""
+        worker = self._preview_workers.pop(generation, None)
+        if worker:
+            worker.wait()
+
+    def _get_refined_mask(self, source: PreviewSource, edge: int) -> Image.Image:
+        """エッジスライダー値に対応するrefined_maskを取得.
+
+        EDGE_MASK_STEP刻みのマスクだけをキャッシュし、間の値は前後のマスクを線形補間する。
 
         Args:
-            erode: 収縮回数
-            feather: フェザー半径
+            source: 描画の入力（マスクとキャッシュ）
+            edge: エッジスライダー値（0-100）
 
         Returns:
             調整済みマスク
         """
-        key = (erode, feather)
-        if key not in self._refined_mask_cache:
-            self._refined_mask_cache[key] = self._edge_refiner.refine_mask(
-                self._product_mask, erode, feather
-            )
-        return self._refined_mask_cache[key]
+        step = self.EDGE_MASK_STEP
+        lower = edge - edge % step
+        lower_mask = self._get_step_mask(
+            source.product_mask, source.scale, lower, source.refined_mask_cache
+        )
+        if lower == edge:
+            return lower_mask
+        upper_mask = self._get_step_mask(
+            source.product_mask, source.scale, lower + step, source.refined_mask_cache
+        )
+        return Image.blend(lower_mask, upper_mask, (edge - lower) / step)
 
-    def _get_shadow_layer(
-        self, opacity: int, size: tuple[int, int], mask: Image.Image
+    def _get_step_mask(
+        self,
+        mask: Image.Image,
+        scale: float,
+        edge: int,
+        cache: dict[int, Image.Image],
     ) -> Image.Image:
-        """影レイヤーを取得.
-
-        Note:
-            センタリング後のマスクは毎回異なるため、キャッシュせず毎回生成。
+        """刻み位置のエッジ調整済みマスクを取得（キャッシュ利用）.
 
         Args:
-            opacity: 影の不透明度
-            size: 出力サイズ
-            mask: 影生成用マスク
+            mask: プレビュー用の商品マスク
+            scale: 縮小率（縮小版 / 編集用画像）
+            edge: エッジスライダー値（EDGE_MASK_STEPの倍数）
+            cache: エッジ調整済みマスクのキャッシュ
 
         Returns:
-            影付き白背景
+            調整済みマスク
         """
-        return self._shadow_adder.generate_shadow(mask, size, opacity)
+        refined = cache.get(edge)
+        if refined is None:
+            # エッジパラメータ計算（ピクセル単位なので縮小率に合わせる）
+            erode = round(max(0, edge // 20) * scale)  # 0-100 → 0-5
+            feather = edge / 100.0 * scale  # 0-100 → 0.0-1.0
+            refined = self._edge_refiner.refine_mask(mask, erode, feather)
+            cache[edge] = refined
+        return refined
+
+    def _precompute_refined_masks(self) -> None:
+        """全刻みのエッジ調整済みマスクをバックグラウンドで事前計算.
+
+        マスクは画像ごとに変わらないため読み込み時にまとめて計算しておき、
+        スライダー操作時はキャッシュ参照と補間だけで済ませる。
+        現在のスライダー値に近い刻みから計算する。
+        """
+        if self._preview_product_mask is None:
+            return
 
-    def _perform_background_removal(self) -> bool:
-        """背景除去を実行し、マスクを生成・保存.
+        mask = self._preview_product_mask
+        scale = self._preview_scale
+        cache = self._refined_mask_cache
+        current = self._params.edge
+        edges = sorted(
+            range(0, 100 + self.EDGE_MASK_STEP, self.EDGE_MASK_STEP),
+            key=lambda edge: abs(edge - current),
+        )
 
-        Returns:
-            成功した場合True
+        def _task() -> None:
+            for edge in edges:
+                # 画像・マスクが切り替わったら中断（キャッシュは辞書ごと差し替えられる）
+                if cache is not self._refined_mask_cache:
+                    return
+                self._get_step_mask(mask, scale, edge, cache)
+
+        QThreadPool.globalInstance().start(_task)
+
+    def _start_mask_generation(self) -> None:
+        """背景除去マスクの生成をバックグラウンドで開始."""
+        if self._current_image_id is None or self._current_image_id in self._mask_workers:
+            return  # 未選択または生成中
+        if not self._preview_image or not self._image_model:
+            return  # 画像ファイルの読み込み前（読み込み後に改めて判定する）
+
+        self._show_loading()
+
+        # マスクの保存もワーカーで行う
+        worker = MaskGenerationWorker(
+            self._current_image_id,
+            self._image_model.filepath,
+            self._product_mask_filepath(self._image_model),
+        )
+        worker.finished.connect(self._on_mask_generated)
+        worker.error.connect(partial(self._on_mask_generation_error, self._current_image_id))
+        self._mask_workers[self._current_image_id] = worker
+        worker.start()
+
+    @staticmethod
+    def _product_mask_filepath(model: ProductImageModel) -> Path:
+        """商品マスクの保存先を取得."""
+        processed_dir = Path(model.product.product_dir_path) / "processed"
+        filename = Path(model.original_filepath).stem
+        return processed_dir / f"{filename}_product_mask.png"
+
+    def _on_mask_generated(self, image_id: int, product_mask: Image.Image) -> None:
+        """マスク生成完了時の処理（GUIスレッド）.
+
+        ワーカーが保存したマスクをDBに反映し、最初のプレビュー更新を行う。
+
+        Args:
+            image_id: 対象の画像ID
+            product_mask: 商品マスク
         """
-        if not self._original_image or not self._image_model:
-            return False
+        self._release_mask_worker(image_id)
 
-        # 1. マスク生成（generate_maskを使用）
-        self._product_mask = self._bg_remover.generate_mask(self._original_image)
-        self._bg_mask = ImageOps.invert(self._product_mask)
+        # 生成中に別の画像へ切り替わった場合は破棄
+        if image_id != self._current_image_id or not self._image_model:
+            return
+
+        self._product_mask = np.asarray(product_mask)
+        self._preview_product_mask = None
+        self._preview_product_mask_array = None
 
-        # 2. キャッシュクリア（新しいマスクが生成されたため）
+        # キャッシュクリア（新しいマスクが生成されたため）
         self._clear_mask_cache()
+        self._build_preview_sources()
 
-        # 3. センタリングパラメータを計算してDBに保存・キャッシュ
-        bbox = self._product_mask.getbbox()
+        # センタリングパラメータを計算してDBに保存・キャッシュ
+        bbox = _mask_bbox(self._product_mask)
         self._cached_bbox = bbox
         if bbox:
             self._image_model.center_content_x = bbox[0]
@@ -1721,30 +2290,53 @@ class ImageEditorScreen(BaseScreen):
             self._image_model.center_content_w = bbox[2] - bbox[0]
             self._image_model.center_content_h = bbox[3] - bbox[1]
 
-        # 4. マスクファイル保存
-        product_dir = Path(self._image_model.product.product_dir_path)
-        processed_dir = product_dir / "processed"
-        processed_dir.mkdir(parents=True, exist_ok=True)
+        # DB更新（マスクパスとパラメータのみ）
+        # 背景マスクは商品マスクの反転なので保存しない（旧形式のパスはクリア）
+        self._image_model.product_mask_filepath = str(
+            self._product_mask_filepath(self._image_model)
+        )
+        self._image_model.background_mask_filepath = None
+        self._image_model.is_background_removed = True
+        self._image_model.save()
 
-        filename = Path(self._image_model.original_filepath).stem
-        product_mask_path = processed_dir / f"{filename}_product_mask.png"
-        bg_mask_path = processed_dir / f"{filename}_bg_mask.png"
+        # 先読みキャッシュも生成したマスクで更新
+        self._preloader.put(
+            image_id,
+            EditorImageData(
+                self._editor_image_files(self._image_model),
+                self._preview_image,
+                self._original_size,
+                self._product_mask,
+                self._preview_product_mask,
+            ),
+        )
 
-        self._product_mask.save(product_mask_path)
-        self._bg_mask.save(bg_mask_path)
+        # マスクがそろったのでコントロールの有効/無効状態を更新
+        self._update_controls_enabled_state()
 
-        # 5. DB更新（マスクパスとパラメータのみ）
-        self._image_model.product_mask_filepath = str(product_mask_path)
-        self._image_model.background_mask_filepath = str(bg_mask_path)
-        self._image_model.is_background_removed = True
-        self._image_model.save()
+        self._hide_loading()
+        self._update_preview()
+
+    def _on_mask_generation_error(self, image_id: int, message: str) -> None:
+        """マスク生成エラー時の処理."""
+        self._release_mask_worker(image_id)
+        if image_id == self._current_image_id:
+            self._hide_loading()
 
-        return True
+    def _release_mask_worker(self, image_id: int) -> None:
+        """完了したマスク生成ワーカーの参照を破棄."""
+        worker = self._mask_workers.pop(image_id, None)
+        if worker:
+            # run()の終了を待ってから破棄（シグナル発火直後のため即座に戻る）
+            worker.wait()
 
     def _clear_mask_cache(self) -> None:
-        """マスク関連キャッシュをクリア."""
-        self._refined_mask_cache.clear()
-        self._shadow_layer_cache.clear()
+        """マスク関連キャッシュをクリア.
+
+        描画中のワーカーが古いマスクの結果を書き込まないよう、辞書ごと差し替える。
+        """
+        self._refined_mask_cache = {}
+        self._stage_cache = PreviewStageCache()
 
     def _apply_mask_to_image(self, image: Image.Image) -> Image.Image:
         """マスクを適用して背景を透過.
@@ -1755,11 +2347,11 @@ class ImageEditorScreen(BaseScreen):
         Returns:
             背景が透過されたRGBA画像
         """
-        if not self._product_mask:
+        if self._product_mask is None:
             return image
 
         # 画像サイズにマスクをリサイズ
-        mask = self._product_mask
+        mask = Image.fromarray(self._product_mask)
         if mask.size != image.size:
             mask = mask.resize(image.size, Image.Resampling.LANCZOS)
 
@@ -1768,54 +2360,39 @@ class ImageEditorScreen(BaseScreen):
         result.putalpha(mask)
         return result
 
-    def _display_preview(self, image: Image.Image) -> None:
-        """画像をプレビューラベルに表示."""
-        # PILイメージをQPixmapに変換
-        if image.mode == "RGBA":
-            data = image.tobytes("raw", "RGBA")
-            qimg = QImage(
-                data, image.width, image.height, QImage.Format.Format_RGBA8888
-            )
-        else:
-            image = image.convert("RGB")
-            data = image.tobytes("raw", "RGB")
-            qimg = QImage(data, image.width, image.height, QImage.Format.Format_RGB888)
-
-        pixmap = QPixmap.fromImage(qimg)
-
-        # キャンバスに画像を設定（ズーム・パン対応）
-        self._canvas.set_image(pixmap)
-
     def on_leave(self) -> None:
         """画面から離れる時に呼ばれる."""
-        # タイマーを停止
+        # タイマーを停止し、描画中のプレビューをキャンセル
         self._preview_timer.stop()
+        self._pending_preview_source = None
+        for worker in self._preview_workers.values():
+            worker.requestInterruption()
 
         if self._image_model:
-            # パラメータを保存
-            self._save_parameters()
-
             # 最終画像を保存（サムネイル更新も含む）
             self._save_final_image()
 
+            # パラメータとサムネイルパスをまとめてDBに保存
+            self._save_parameters()
+
     def _save_parameters(self) -> None:
         """パラメータをDBに保存."""
         if not self._image_model:
             return
 
         # UI値をモデル値に変換して保存
-        self._image_model.edge_threshold = self._edge_value // 10  # 0-100 → 0-10
+        self._image_model.edge_threshold = self._params.edge // 10  # 0-100 → 0-10
         self._image_model.shadow_threshold = (
-            self._shadow_value / 100.0
+            self._params.shadow / 100.0
         )  # 0-100 → 0.0-1.0
-        self._image_model.whole_contrast = self._contrast_whole
-        self._image_model.product_contrast = self._contrast_product
-        self._image_model.is_background_removed = self._bg_removal_enabled
-        self._image_model.is_centered = self._centering_enabled
+        self._image_model.whole_contrast = self._params.contrast_whole
+        self._image_model.product_contrast = self._params.contrast_product
+        self._image_model.is_background_removed = self._params.bg_removal_enabled
+        self._image_model.is_centered = self._params.centering_enabled
 
         # Transform パラメータを保存
-        if self._bg_removal_enabled:
-            zoom_multiplier = slider_to_scale(self._zoom_value)
+        if self._params.bg_removal_enabled:
+            zoom_multiplier = slider_to_scale(self._params.zoom)
 
             # translate計算（auto-scale考慮）
             canvas_size = 1200
@@ -1830,8 +2407,8 @@ class ImageEditorScreen(BaseScreen):
             else:
                 scaled_w = scaled_h = int(600 * zoom_multiplier)
 
-            translate_x = slider_to_translate(self._pos_x_value, scaled_w, canvas_size)
-            translate_y = slider_to_translate(self._pos_y_value, scaled_h, canvas_size)
+            translate_x = slider_to_translate(self._params.pos_x, scaled_w, canvas_size)
+            translate_y = slider_to_translate(self._params.pos_y, scaled_h, canvas_size)
 
             transform = TransformParams(
                 scale=zoom_multiplier,  # zoom_multiplierとして保存
@@ -1850,19 +2427,20 @@ class ImageEditorScreen(BaseScreen):
 
     def _generate_final_image(self) -> Image.Image | None:
         """全効果を適用した最終画像を生成."""
-        if not self._original_image:
+        original_image = self._get_original_image()
+        if not original_image:
             return None
 
         # ベース画像
-        image = self._original_image.copy()
+        image = original_image.copy()
 
         # 背景除去がONの場合
-        if self._bg_removal_enabled and self._product_mask:
+        if self._params.bg_removal_enabled and self._product_mask is not None:
             # マスクを適用して背景を透過
             image = self._apply_mask_to_image(image)
 
             # ズーム・位置・中央寄せの適用
-            zoom_multiplier = slider_to_scale(self._zoom_value)
+            zoom_multiplier = slider_to_scale(self._params.zoom)
 
             # 被写体サイズからtranslate計算（auto-scale考慮）
             canvas_size = 1200
@@ -1877,62 +2455,68 @@ class ImageEditorScreen(BaseScreen):
             else:
                 scaled_w = scaled_h = int(600 * zoom_multiplier)
 
-            translate_x = slider_to_translate(self._pos_x_value, scaled_w, canvas_size)
-            translate_y = slider_to_translate(self._pos_y_value, scaled_h, canvas_size)
+            translate_x = slider_to_translate(self._params.pos_x, scaled_w, canvas_size)
+            translate_y = slider_to_translate(self._params.pos_y, scaled_h, canvas_size)
 
             image = self._centerer.center_image(
                 image,
                 bbox=self._cached_bbox,
                 translate_x=translate_x,
                 translate_y=translate_y,
-                auto_center=self._centering_enabled,
+                auto_center=self._params.centering_enabled,
                 zoom_multiplier=zoom_multiplier,
             )
 
             # エッジ処理
-            erode = max(0, self._edge_value // 20)
-            feather = self._edge_value / 100.0
+            erode = max(0, self._params.edge // 20)
+            feather = self._params.edge / 100.0
             image = self._edge_refiner.refine(image, erode, feather)
 
             # 影追加
-            if self._shadow_value > 0:
-                shadow_opacity = int(self._shadow_value * 2.55)
+            if self._params.shadow > 0:
+                shadow_opacity = int(self._params.shadow * 2.55)
                 shadow_adder = PillowShadowAdder(shadow_opacity=shadow_opacity)
                 image = shadow_adder.add_shadow(image)
 
-            # 商品コントラスト調整
-            if self._product_mask and self._contrast_product != 0:
-                # センタリング適用時はセンタリング後の画像からマスクを取得
-                if self._centering_enabled:
-                    centered_product_mask = image.getchannel("A")
-                else:
-                    centered_product_mask = self._product_mask
+        whole_params = ToneParameters(
+            brightness=self._params.contrast_whole * 0.5,
+            contrast=1.0 + self._params.contrast_whole / 200.0,
+            gamma=1.0,
+        )
 
-                product_params = ToneParameters(
-                    brightness=self._contrast_product * 0.5,
-                    contrast=1.0 + self._contrast_product / 200.0,
-                    gamma=1.0,
-                )
-                product_adjusted = self._tone_adjuster.adjust(image, product_params)
-                if centered_product_mask.size != image.size:
-                    centered_product_mask = centered_product_mask.resize(
-                        image.size, Image.Resampling.LANCZOS
-                    )
-                image = Image.composite(product_adjusted, image, centered_product_mask)
+        # 商品コントラスト調整（全体のコントラストと合わせて1パスで適用）
+        if (
+            self._params.bg_removal_enabled
+            and self._product_mask is not None
+            and self._params.contrast_product != 0
+        ):
+            # センタリング適用時はセンタリング後の画像からマスクを取得
+            if self._params.centering_enabled:
+                centered_product_mask = image.getchannel("A")
+            else:
+                centered_product_mask = self._product_mask
 
-        # 全体のコントラスト
-        if self._contrast_whole != 0:
-            params = ToneParameters(
-                brightness=self._contrast_whole * 0.5,
-                contrast=1.0 + self._contrast_whole / 200.0,
+            product_params = ToneParameters(
+                brightness=self._params.contrast_product * 0.5,
+                contrast=1.0 + self._params.contrast_product / 200.0,
                 gamma=1.0,
             )
-            image = self._tone_adjuster.adjust(image, params)
+            image = self._tone_adjuster.adjust_masked(
+                image, centered_product_mask, product_params, whole_params
+            )
+
+        # 全体のコントラスト
+        elif self._params.contrast_whole != 0:
+            image = self._tone_adjuster.adjust(image, whole_params)
 
         return image
 
     def _save_final_image(self) -> None:
-        """最終画像をファイルに保存."""
+        """最終画像をファイルに保存.
+
+        サムネイルパスはモデルに設定するだけで、DBへの保存は続けて呼ぶ_save_parametersで
+        パラメータと合わせて1回のUPDATEで行う。
+        """
         if not self._image_model:
             return
 
@@ -1950,18 +2534,16 @@ class ImageEditorScreen(BaseScreen):
         final_path = processed_dir / f"{filename}_current.png"
 
         # 保存
-        final_image.save(final_path)
+        final_image.save(
+            final_path, "PNG", compress_level=ProductImageService.WORKING_PNG_COMPRESS_LEVEL
+        )
 
-        # サムネイル生成・DB更新
+        # サムネイル生成（DB更新は_save_parametersで行う）
         thumb_path = self._save_thumbnail_from_filepath(self._image_model)
         self._image_model.thumbnail_filepath = str(thumb_path)
-        self._image_model.save()
 
         # サムネイル表示更新
-        if self._image_model.id in self._thumbnail_items:
-            self._thumbnail_items[self._image_model.id].update_thumbnail(
-                str(thumb_path)
-            )
+        self._thumbnail_model.update_thumbnail(self._image_model.id, str(thumb_path))
 
     def _save_thumbnail_from_filepath(self, product_image: ProductImageModel) -> Path:
         """filepathの画像をリサイズしてサムネイル保存.
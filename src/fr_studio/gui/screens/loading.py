@@ -3,12 +3,13 @@
 プロジェクト作成時の進捗表示に使用する。
 """
 
+from datetime import datetime
+
 from PySide6.QtCore import Qt
 from PySide6.QtWidgets import (
     QLabel,
+    QPlainTextEdit,
     QProgressBar,
-    QScrollArea,
-    QTextEdit,
     QVBoxLayout,
     QWidget,
 )
@@ -22,6 +23,9 @@ class LoadingScreen(BaseScreen):
     進捗バーとログ表示を提供する。
     """
 
+    # ログの最大行数（古い行から破棄し、長い処理でも追加・再レイアウトのコストを一定に保つ）
+    MAX_LOG_LINES = 500
+
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._setup_ui()
@@ -81,12 +85,13 @@ class LoadingScreen(BaseScreen):
         log_label.setStyleSheet("color: #888; font-size: 12px;")
         container_layout.addWidget(log_label)
 
-        self._log = QTextEdit()
+        self._log = QPlainTextEdit()
         self._log.setReadOnly(True)
+        self._log.setMaximumBlockCount(self.MAX_LOG_LINES)
         self._log.setMaximumHeight(200)
         self._log.setStyleSheet(
             """
-            QTextEdit {
+            QPlainTextEdit {
                 background: #1a1a1a;
                 border: 1px solid #333;
                 border-radius: 4px;
@@ -121,10 +126,8 @@ class LoadingScreen(BaseScreen):
 
     def add_log(self, message: str) -> None:
         """ログを追加."""
-        from datetime import datetime
-
         timestamp = datetime.now().strftime("%H:%M:%S")
-        self._log.append(f"[{timestamp}] {message}")
+        self._log.appendPlainText(f"[{timestamp}] {message}")
         # 最下部にスクロール
         scrollbar = self._log.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
@@ -3,16 +3,22 @@
 商品一覧と画像グリッドを表示する。
 """
 
+import contextlib
 import subprocess
+from datetime import datetime
 from pathlib import Path
+from threading import Thread
 from typing import Any
 
-from PySide6.QtCore import Qt, Signal
+from peewee import JOIN, fn
+from PySide6.QtCore import Qt, QThreadPool, Signal
+from PySide6.QtGui import QImage
 from PySide6.QtWidgets import (
     QFrame,
     QGridLayout,
     QHBoxLayout,
     QLabel,
+    QLayout,
     QLineEdit,
     QMessageBox,
     QPushButton,
@@ -24,7 +30,9 @@ from PySide6.QtWidgets import (
 from ..components.cards.image_card import ImageCard
 from ..components.dialogs import UploadDialog
 from ..components.product_list_item import ProductListItem
+from ..db import get_database
 from ..db.models import ProductImageModel, ProductModel, ProjectModel
+from ..workers.thumbnail_loader import ThumbnailLoader, ThumbnailLoaderSignals
 from .base import BaseScreen
 
 
@@ -50,7 +58,17 @@ class ProjectDetailScreen(BaseScreen):
         self._selected_image_ids: set[int] = set()
         self._product_items: dict[int, ProductListItem] = {}
         self._image_cards: dict[int, ImageCard] = {}
+        # 商品IDごとの画像一覧（プロジェクト読み込み時に1クエリで取得し、商品切り替えで再利用）
+        self._images_by_product: dict[int, list[ProductImageModel]] = {}
         self._current_columns = 4
+        # サムネイルはグリッド専用のプールで読み込み、商品切り替え時に未実行分を破棄する
+        self._thumbnail_pool = QThreadPool(self)
+        self._thumbnail_signals = ThumbnailLoaderSignals(self)
+        self._thumbnail_signals.loaded.connect(self._on_thumbnail_loaded)
+        self._thumbnail_generation = 0
+        # 画像IDごとの表示中・読み込み中のサムネイル (ファイルパス, 更新日時)
+        self._thumbnail_keys: dict[int, tuple[str, datetime]] = {}
+        self._pending_thumbnail_keys: dict[int, tuple[str, datetime]] = {}
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -261,94 +279,158 @@ class ProjectDetailScreen(BaseScreen):
         # タイトル更新
         self._title_label.setText(self._project.name)
 
+        # 全商品の画像をまとめて取得
+        self._load_images()
+
         # 商品リスト更新
         self._refresh_product_list()
 
-        # 最初の商品を選択
-        products = list(self._project.products)
-        if products:
-            self._select_product(products[0].id)
-
-    def _refresh_product_list(self, filter_text: str = "") -> None:
-        """商品リストを更新."""
-        # 既存のウィジェットをクリア
-        while self._product_list_layout.count():
-            layout_item = self._product_list_layout.takeAt(0)
-            widget = layout_item.widget() if layout_item else None
-            if widget:
-                widget.deleteLater()
-
-        self._product_items.clear()
+        # 最初の商品を選択（商品リストはitem_id順）
+        first_product_id = next(iter(self._product_items), None)
+        if first_product_id is not None:
+            self._select_product(first_product_id)
 
+    def _load_images(self) -> None:
+        """プロジェクトの全画像を1クエリで取得し、商品IDごとにまとめる."""
+        self._images_by_product = {}
         if not self._project:
             return
 
-        # 商品を取得
-        query = ProductModel.select().where(ProductModel.project == self._project)
-        if filter_text:
-            query = query.where(
-                ProductModel.item_id.cast("text").contains(filter_text)
-                | ProductModel.caption.contains(filter_text)
-            )
-        query = query.order_by(ProductModel.item_id)
-
-        for product in query:
-            image_count = product.images.count()
-            list_item = ProductListItem(
-                product_id=product.id,
-                item_id=product.item_id,
-                caption=product.caption,
-                image_count=image_count,
+        query = (
+            ProductImageModel.select()
+            .join(ProductModel)
+            .where(ProductModel.project == self._project)
+            .order_by(ProductImageModel.name)
+        )
+        for image in query:
+            self._images_by_product.setdefault(image.product_id, []).append(image)
+
+    def _refresh_product_list(self, filter_text: str = "") -> None:
+        """商品リストを更新.
+
+        既存のアイテムは表示内容だけ更新して再利用し、
+        追加・削除された商品のウィジェットのみ作成・破棄する。
+        """
+        products = []
+        if self._project:
+            # 商品を画像数と合わせて1クエリで取得
+            query = (
+                ProductModel.select(
+                    ProductModel, fn.COUNT(ProductImageModel.id).alias("image_count")
+                )
+                .join(ProductImageModel, JOIN.LEFT_OUTER)
+                .where(ProductModel.project == self._project)
             )
-            list_item.clicked.connect(self._on_product_clicked)
+            if filter_text:
+                query = query.where(
+                    ProductModel.item_id.cast("text").contains(filter_text)
+                    | ProductModel.caption.contains(filter_text)
+                )
+            products = list(query.group_by(ProductModel.id).order_by(ProductModel.item_id))
+
+        self._take_layout_widgets(self._product_list_layout)
+        items = {}
+        for product in products:
+            list_item = self._product_items.pop(product.id, None)
+            if list_item is None:
+                list_item = ProductListItem(
+                    product_id=product.id,
+                    item_id=product.item_id,
+                    caption=product.caption,
+                    image_count=product.image_count,
+                )
+                list_item.clicked.connect(self._on_product_clicked)
+            else:
+                list_item.update_info(product.item_id, product.caption, product.image_count)
 
             # 現在選択中の商品をハイライト
-            if product.id == self._selected_product_id:
-                list_item.set_selected(True)
+            list_item.set_selected(product.id == self._selected_product_id)
 
             self._product_list_layout.addWidget(list_item)
-            self._product_items[product.id] = list_item
+            items[product.id] = list_item
 
-    def _refresh_image_grid(self) -> None:
-        """画像グリッドを更新."""
-        # 既存のウィジェットをクリア
-        while self._grid_layout.count():
-            layout_item = self._grid_layout.takeAt(0)
-            widget = layout_item.widget() if layout_item else None
-            if widget:
-                widget.deleteLater()
+        # 表示されなくなった商品のみ破棄
+        for list_item in self._product_items.values():
+            list_item.deleteLater()
+        self._product_items = items
 
-        self._image_cards.clear()
+    def _refresh_image_grid(self) -> None:
+        """画像グリッドを更新.
 
-        if not self._selected_product_id:
-            return
+        既存のカードは表示内容だけ更新して再利用し、追加・削除された画像のカードのみ
+        作成・破棄する。サムネイルは表示中のものと変わった場合だけ読み込み直す。
+        """
+        self._cancel_thumbnail_loads()
 
-        try:
-            product = ProductModel.get_by_id(self._selected_product_id)
-        except ProductModel.DoesNotExist:
-            return
+        images = self._images_by_product.get(self._selected_product_id, [])
 
-        # 画像を取得
-        images = list(product.images.order_by(ProductImageModel.name))
+        self._take_layout_widgets(self._grid_layout)
         col_count = self._calculate_columns()
-
+        cards = {}
         for i, image in enumerate(images):
             row = i // col_count
             col = i % col_count
 
             filepath = image.thumbnail_filepath or image.original_filepath
-            card = ImageCard(
-                image_id=image.id,
-                name=image.name,
-                filepath=filepath,
-                updated_time=image.updated_time,
-            )
-            card.clicked.connect(self._on_image_clicked)
-            card.edit_clicked.connect(self._on_image_edit_clicked)
-            card.delete_clicked.connect(self._on_image_delete_clicked)
+            card = self._image_cards.pop(image.id, None)
+            if card is None:
+                card = ImageCard(
+                    image_id=image.id,
+                    name=image.name,
+                    filepath=filepath,
+                    updated_time=image.updated_time,
+                    load_thumbnail=False,
+                )
+                card.clicked.connect(self._on_image_clicked)
+                card.edit_clicked.connect(self._on_image_edit_clicked)
+                card.delete_clicked.connect(self._on_image_delete_clicked)
+            else:
+                card.update_info(image.name, image.updated_time)
 
             self._grid_layout.addWidget(card, row, col)
-            self._image_cards[image.id] = card
+            cards[image.id] = card
+
+            # サムネイルはプレースホルダー（または前回の表示）のままバックグラウンドで読み込む
+            thumbnail_key = (filepath, image.updated_time)
+            if self._thumbnail_keys.get(image.id) != thumbnail_key:
+                self._pending_thumbnail_keys[image.id] = thumbnail_key
+                self._thumbnail_pool.start(
+                    ThumbnailLoader(
+                        self._thumbnail_signals,
+                        self._thumbnail_generation,
+                        image.id,
+                        filepath,
+                        card.thumbnail_size(),
+                    )
+                )
+
+        # 表示されなくなった画像のみ破棄
+        for image_id, card in self._image_cards.items():
+            self._thumbnail_keys.pop(image_id, None)
+            card.deleteLater()
+        self._image_cards = cards
+
+    @staticmethod
+    def _take_layout_widgets(layout: QLayout) -> None:
+        """レイアウトからウィジェットを破棄せずに取り外す（再配置用）."""
+        while layout.count():
+            layout.takeAt(0)
+
+    def _cancel_thumbnail_loads(self) -> None:
+        """未実行のサムネイル読み込みを破棄し、実行中の結果も無視する."""
+        self._thumbnail_pool.clear()
+        self._thumbnail_generation += 1
+        self._pending_thumbnail_keys.clear()
+
+    def _on_thumbnail_loaded(self, generation: int, image_id: int, image: QImage) -> None:
+        """サムネイル読み込み完了時の処理."""
+        if generation != self._thumbnail_generation:
+            return
+        card = self._image_cards.get(image_id)
+        thumbnail_key = self._pending_thumbnail_keys.pop(image_id, None)
+        if card is not None and thumbnail_key is not None:
+            card.set_thumbnail_image(image)
+            self._thumbnail_keys[image_id] = thumbnail_key
 
     def _select_product(self, product_id: int) -> None:
         """商品を選択."""
@@ -433,7 +515,6 @@ class ProjectDetailScreen(BaseScreen):
     def _delete_project(self) -> None:
         """プロジェクトを削除."""
         import shutil
-        from threading import Thread
 
         project_id = self._project.id
         project_dir = self._project.project_dir_path
@@ -474,30 +555,60 @@ class ProjectDetailScreen(BaseScreen):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            try:
-                image = ProductImageModel.get_by_id(image_id)
-                # ファイル削除
-                for path_attr in [
-                    "filepath",
-                    "original_filepath",
-                    "product_mask_filepath",
-                    "background_mask_filepath",
-                ]:
-                    filepath = getattr(image, path_attr)
-                    if filepath:
-                        path = Path(filepath)
-                        if path.exists():
-                            path.unlink()
-                # DB削除
-                image.delete_instance()
-
-                # 商品リストの画像数を更新
-                self._refresh_product_list(self._search_input.text().strip())
-
-                # グリッド更新
-                self._refresh_image_grid()
-            except ProductImageModel.DoesNotExist:
-                pass
+            self._delete_images([image_id])
+
+    def _delete_images(self, image_ids: list[int]) -> None:
+        """画像をファイルごと削除.
+
+        DB削除は1トランザクション・1クエリでまとめて行い、
+        ファイル削除はバックグラウンドで実行する（UIはDBの状態で即時更新）。
+
+        Args:
+            image_ids: 削除する画像IDのリスト
+        """
+        images = list(ProductImageModel.select().where(ProductImageModel.id.in_(image_ids)))
+        if not images:
+            return
+
+        filepaths = [
+            filepath
+            for image in images
+            for filepath in (
+                image.filepath,
+                image.original_filepath,
+                image.product_mask_filepath,
+                image.background_mask_filepath,
+            )
+            if filepath
+        ]
+
+        # DB削除
+        with get_database().atomic():
+            ProductImageModel.delete().where(
+                ProductImageModel.id.in_([image.id for image in images])
+            ).execute()
+
+        # 画像一覧のキャッシュからも削除
+        deleted_ids = {image.id for image in images}
+        for product_id, product_images in self._images_by_product.items():
+            self._images_by_product[product_id] = [
+                image for image in product_images if image.id not in deleted_ids
+            ]
+
+        # ファイル削除はバックグラウンドで実行
+        def delete_files_in_background() -> None:
+            for filepath in filepaths:
+                with contextlib.suppress(FileNotFoundError):
+                    Path(filepath).unlink()
+
+        thread = Thread(target=delete_files_in_background, daemon=True)
+        thread.start()
+
+        # 商品リストの画像数を更新
+        self._refresh_product_list(self._search_input.text().strip())
+
+        # グリッド更新
+        self._refresh_image_grid()
 
     def _calculate_columns(self) -> int:
         """利用可能な幅に応じて列数を計算."""
@@ -4,6 +4,8 @@ Google Drive APIの実装前のスタブ版。
 ローカルのtest_imagesフォルダから画像を取得する。
 """
 
+import os
+import shutil
 from pathlib import Path
 from typing import Protocol
 
@@ -31,7 +33,7 @@ class LocalImageDownloader:
     本番ではGoogle Drive APIに置き換える。
     """
 
-    SUPPORTED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
+    SUPPORTED_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png", ".webp"})
 
     def __init__(self, test_images_dir: Path | None = None) -> None:
         """初期化.
@@ -45,10 +47,42 @@ class LocalImageDownloader:
         else:
             self._test_images_dir = test_images_dir
 
+    @staticmethod
+    def _extension(name: str) -> str:
+        """ファイル名の拡張子を小文字で取得（拡張子がなければ空文字）."""
+        dot = name.rfind(".")
+        return name[dot:].lower() if dot > 0 else ""
+
+    def _scan_images(self, source_dir: Path) -> list[os.DirEntry[str]] | None:
+        """ディレクトリ内の対象画像ファイルを名前順で取得.
+
+        Pathを作らずにDirEntryの名前で拡張子を判定し、種別はscandirで得た情報で判定する
+        （通常ファイルなら追加のstatは発生しない）。
+
+        Args:
+            source_dir: 検索するディレクトリ
+
+        Returns:
+            画像ファイルのDirEntryリスト（ディレクトリがない場合はNone）
+        """
+        try:
+            with os.scandir(source_dir) as it:
+                entries = [
+                    entry
+                    for entry in it
+                    if self._extension(entry.name) in self.SUPPORTED_EXTENSIONS
+                    and entry.is_file()
+                ]
+        except FileNotFoundError:
+            return None
+        entries.sort(key=lambda entry: entry.name)
+        return entries
+
     def download_images(self, item_id: int, dest_dir: Path) -> list[Path]:
         """商品画像を取得する.
         
         ローカルのtest_images/{item_id}/から画像をコピーする。
+        元画像は読み取り専用の入力なので、同じファイルシステム上ならハードリンクで済ませる。
         
         Args:
             item_id: 商品ID
@@ -57,21 +91,25 @@ class LocalImageDownloader:
         Returns:
             コピーした画像ファイルパスのリスト
         """
-        import shutil
-
-        source_dir = self._test_images_dir / str(item_id)
-        if not source_dir.exists():
+        entries = self._scan_images(self._test_images_dir / str(item_id))
+        if entries is None:
             return []
 
         originals_dir = dest_dir / "originals"
         originals_dir.mkdir(parents=True, exist_ok=True)
 
         copied_files: list[Path] = []
-        for file_path in sorted(source_dir.iterdir()):
-            if file_path.suffix.lower() in self.SUPPORTED_EXTENSIONS:
-                dest_path = originals_dir / file_path.name
-                shutil.copy2(file_path, dest_path)
-                copied_files.append(dest_path)
+        for entry in entries:
+            dest_path = originals_dir / entry.name
+            dest_path.unlink(missing_ok=True)
+            try:
+                os.link(entry.path, dest_path)
+            except OSError:
+                # 別デバイス・リンク非対応の場合はコピーする
+                # copyfileはLinuxではsendfile、macOSではfcopyfileでカーネル内コピーする
+                # （copy2のcopystatによるメタデータ複製は不要）
+                shutil.copyfile(entry.path, dest_path)
+            copied_files.append(dest_path)
 
         return copied_files
 
@@ -91,12 +129,31 @@ class GoogleDriveDownloader:
         self._client = None
 
     def _get_client(self):
-        """Google Drive クライアントを取得（遅延初期化）."""
+        """Google Drive クライアントを取得（遅延初期化）.
+
+        DIContainerのシングルトンを使い、アップロードと接続・キャッシュを共有する。
+        """
         if self._client is None:
             from fr_studio.infrastructure.google_drive_client import GoogleDriveClient
-            self._client = GoogleDriveClient()
+
+            from ..di import inject
+
+            self._client = inject(GoogleDriveClient)
         return self._client
 
+    def prefetch_items(self, item_ids: list[int]) -> None:
+        """商品IDに対応するフォルダと画像一覧をまとめて取得しておく.
+
+        商品ごとのdownload_imagesでフォルダ検索・一覧取得の通信が発生しないよう、
+        処理開始前に一括で取得してクライアントに保持させる。
+
+        Args:
+            item_ids: 商品ID（SKU）のリスト
+        """
+        client = self._get_client()
+        folders = client.find_folders_by_names([str(item_id) for item_id in item_ids])
+        client.prefetch_image_lists(list(folders.values()))
+
     def download_images(self, item_id: int, dest_dir: Path) -> list[Path]:
         """商品画像をGoogle Driveからダウンロードする.
 
@@ -0,0 +1,192 @@
+"""編集用画像の先読みサービス.
+
+画像編集画面で次に選択されそうな画像（前後の画像）を
+バックグラウンドでデコードしてキャッシュする。
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Lock
+
+import numpy as np
+import numpy.typing as npt
+from PIL import Image
+from PySide6.QtCore import QThreadPool
+
+
+@dataclass(frozen=True)
+class EditorImageFiles:
+    """編集用画像のファイルパス一式（キャッシュキー）.
+
+    Attributes:
+        filepath: 編集用画像パス
+        product_mask_filepath: 商品マスク画像パス
+    """
+
+    filepath: str | None
+    product_mask_filepath: str | None
+
+
+@dataclass(frozen=True)
+class EditorImageData:
+    """デコード済みの編集用画像.
+
+    フル解像度の編集用画像は書き出し・マスク生成時にだけ必要なため保持せず、
+    プレビュー用の縮小版とフル解像度のサイズのみを持つ。
+    商品マスクもプレビュー用の縮小版を読み込み時に作成しておく。
+    背景マスクは商品マスクの反転なので読み込まない。
+
+    Attributes:
+        files: 読み込み元のファイルパス一式
+        preview: プレビュー用の縮小画像（RGBA）
+        image_size: 編集用画像のフル解像度サイズ
+        product_mask: 商品マスク（uint8配列 (H, W)）
+        preview_product_mask: プレビュー用に縮小した商品マスク（Lモード）
+    """
+
+    files: EditorImageFiles
+    preview: Image.Image | None
+    image_size: tuple[int, int] | None
+    product_mask: npt.NDArray[np.uint8] | None
+    preview_product_mask: Image.Image | None = None
+
+
+def load_preview_image(
+    filepath: str, max_size: int
+) -> tuple[Image.Image, tuple[int, int]]:
+    """画像をプレビュー用の縮小版としてデコードする.
+
+    JPEGはdraftでDCT縮小デコードし、フル解像度のデコードを避ける。
+
+    Args:
+        filepath: 画像ファイルパス
+        max_size: 縮小版の最大辺
+
+    Returns:
+        (縮小画像（RGBA）, フル解像度のサイズ)
+    """
+    image = Image.open(filepath)
+    full_size = image.size
+    if image.format == "JPEG":
+        image.draft("RGB", (max_size, max_size))
+    image.thumbnail((max_size, max_size), Image.Resampling.BILINEAR)
+    if image.mode != "RGBA":
+        image = image.convert("RGBA")
+    return image, full_size
+
+
+def resize_preview_mask(
+    mask: npt.NDArray[np.uint8], size: tuple[int, int]
+) -> Image.Image:
+    """フル解像度のマスクをプレビュー用のサイズに縮小する.
+
+    Args:
+        mask: マスク（uint8配列 (H, W)）
+        size: プレビュー画像のサイズ
+
+    Returns:
+        縮小したマスク（Lモード）
+    """
+    return Image.fromarray(mask).resize(size, Image.Resampling.BILINEAR)
+
+
+def load_editor_image(files: EditorImageFiles, preview_max_size: int) -> EditorImageData:
+    """編集用画像（縮小版）とマスクを読み込んでデコードする.
+
+    Args:
+        files: 読み込むファイルパス一式
+        preview_max_size: プレビュー用縮小版の最大辺
+
+    Returns:
+        デコード済みの画像データ（存在しないファイルはNone）
+    """
+    preview = None
+    image_size = None
+    if files.filepath and Path(files.filepath).exists():
+        preview, image_size = load_preview_image(files.filepath, preview_max_size)
+
+    product_mask = None
+    if files.product_mask_filepath and Path(files.product_mask_filepath).exists():
+        product_mask = np.asarray(Image.open(files.product_mask_filepath).convert("L"))
+
+    preview_product_mask = None
+    if preview is not None and product_mask is not None:
+        preview_product_mask = resize_preview_mask(product_mask, preview.size)
+
+    return EditorImageData(files, preview, image_size, product_mask, preview_product_mask)
+
+
+class ImagePreloader:
+    """編集用画像のLRUキャッシュと先読み.
+
+    先読みはQThreadPoolで実行し、ユーザーが画像を選ぶまでの間にデコードを済ませる。
+    キャッシュはファイルパス一式と一致する場合のみヒットする。
+    """
+
+    def __init__(self, preview_max_size: int, max_entries: int = 8) -> None:
+        """初期化.
+
+        Args:
+            preview_max_size: プレビュー用縮小版の最大辺
+            max_entries: キャッシュする画像の最大数
+        """
+        self._preview_max_size = preview_max_size
+        self._max_entries = max_entries
+        self._cache: OrderedDict[int, EditorImageData] = OrderedDict()
+        self._pending: set[int] = set()
+        self._lock = Lock()
+
+    def get(self, image_id: int, files: EditorImageFiles) -> EditorImageData | None:
+        """キャッシュから画像データを取得.
+
+        Args:
+            image_id: 画像ID
+            files: 期待するファイルパス一式
+
+        Returns:
+            キャッシュ済みの画像データ（ないか古い場合はNone）
+        """
+        with self._lock:
+            data = self._cache.get(image_id)
+            if data is None or data.files != files:
+                return None
+            self._cache.move_to_end(image_id)
+            return data
+
+    def put(self, image_id: int, data: EditorImageData) -> None:
+        """画像データをキャッシュに追加."""
+        with self._lock:
+            self._cache[image_id] = data
+            self._cache.move_to_end(image_id)
+            while len(self._cache) > self._max_entries:
+                self._cache.popitem(last=False)
+
+    def preload(self, image_id: int, files: EditorImageFiles) -> None:
+        """画像をバックグラウンドで読み込んでキャッシュする.
+
+        Args:
+            image_id: 画像ID
+            files: 読み込むファイルパス一式
+        """
+        with self._lock:
+            cached = self._cache.get(image_id)
+            if image_id in self._pending or (cached is not None and cached.files == files):
+                return
+            self._pending.add(image_id)
+
+        def _task() -> None:
+            try:
+                self.put(image_id, load_editor_image(files, self._preview_max_size))
+            except Exception:
+                pass  # 先読みの失敗は無視（選択時に同期読み込みする）
+            finally:
+                with self._lock:
+                    self._pending.discard(image_id)
+
+        QThreadPool.globalInstance().start(_task)
+
+    def clear(self) -> None:
+        """キャッシュをクリア."""
+        with self._lock:
+            self._cache.clear()
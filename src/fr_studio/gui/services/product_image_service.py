@@ -21,6 +21,12 @@ class ProductImageService:
     エクスポート時にマスクベースで最終画像を構築する。
     """
 
+    # 商品ごとに背景除去する画像の枚数（ファイル名昇順で先頭から）
+    BACKGROUND_REMOVAL_LIMIT = 3
+
+    # マスク等の作業用PNGの圧縮レベル（アプリ内でしか読まないため、サイズより保存速度を優先）
+    WORKING_PNG_COMPRESS_LEVEL = 1
+
     def __init__(
         self,
         remover: BiRefNetRemover,
@@ -164,53 +170,62 @@ class ProductImageService:
 
         return image
 
+    def generate_product_masks(self, images: list[Image.Image]) -> list[Image.Image]:
+        """複数画像の商品マスクを1回のバッチ推論で生成する.
+
+        Args:
+            images: リサイズ済み画像（RGB、保存時のデコード済み画像を再利用する）
+
+        Returns:
+            入力と同じ順の商品マスクのリスト
+        """
+        return self._remover.generate_masks(images)
+
     def create_product_image(
         self,
         product: ProductModel,
         image_path: Path,
         original_path: Path,
         sort_index: int = 1,
+        product_mask: Image.Image | None = None,
     ) -> int:
         """画像を処理してDBに登録する.
 
+        画像ごとのmkdirを避けるため、商品ディレクトリのprocessed/は呼び出し側で作成しておく。
+
         Args:
             product: 商品モデル
             image_path: リサイズ済み画像パス（source/）
             original_path: 元画像パス（originals/）
             sort_index: 並び順
+            product_mask: generate_product_masksで生成済みの商品マスク
+                （Noneなら背景除去対象の場合にここで生成）
 
         Returns:
             作成されたproduct_image_id
         """
-        # 画像読み込み
-        image = Image.open(image_path)
-        if image.mode != "RGB":
-            image = image.convert("RGB")
-
         filename = image_path.stem
         product_dir = Path(product.product_dir_path)
         processed_dir = product_dir / "processed"
-        processed_dir.mkdir(parents=True, exist_ok=True)
 
-        # ファイル名昇順で3つめまでを背景除去対象とする
+        # ファイル名昇順でBACKGROUND_REMOVAL_LIMIT枚目までを背景除去対象とする
         # sort_index は呼び出し側で昇順ソート後に1から付与される
-        should_remove_bg = sort_index <= 3
+        should_remove_bg = sort_index <= self.BACKGROUND_REMOVAL_LIMIT
 
         is_background_removed = False
         center_content_x = center_content_y = center_content_w = center_content_h = 0
         product_mask_path = None
-        background_mask_path = None
 
         if should_remove_bg:
-            # マスク生成
-            product_mask = self._remover.generate_mask(image)
+            # マスク生成（生成済みでなければ、このときだけ画像をデコードする）
+            if product_mask is None:
+                with Image.open(image_path) as image:
+                    product_mask = self._remover.generate_mask(image.convert("RGB"))
+            # 背景マスクは商品マスクの反転なので保存しない（1チャンネルの商品マスクのみ保存）
             product_mask_path = processed_dir / f"{filename}_product_mask.png"
-            product_mask.save(product_mask_path)
-
-            # 背景マスク
-            background_mask = ImageOps.invert(product_mask)
-            background_mask_path = processed_dir / f"{filename}_bg_mask.png"
-            background_mask.save(background_mask_path)
+            product_mask.save(
+                product_mask_path, "PNG", compress_level=self.WORKING_PNG_COMPRESS_LEVEL
+            )
 
             # bbox計算
             bbox = product_mask.getbbox()
@@ -233,9 +248,7 @@ class ProductImageService:
             original_filepath=str(original_path),
             filepath=str(image_path),
             product_mask_filepath=str(product_mask_path) if product_mask_path else None,
-            background_mask_filepath=(
-                str(background_mask_path) if background_mask_path else None
-            ),
+            background_mask_filepath=None,
             center_content_x=center_content_x,
             center_content_y=center_content_y,
             center_content_w=center_content_w,
@@ -287,6 +300,7 @@ class ProductImageService:
         """サムネイルを生成して保存.
 
         背景除去の有無に関わらず、現在のパラメータ（コントラスト等）を反映。
+        保存先のprocessed/は作成済みであること。
 
         Args:
             product_image: 商品画像モデル
@@ -299,7 +313,6 @@ class ProductImageService:
 
         # 保存
         processed_dir = Path(product_image.product.product_dir_path) / "processed"
-        processed_dir.mkdir(parents=True, exist_ok=True)
         filename = Path(product_image.original_filepath).stem
         thumb_path = processed_dir / f"{filename}_thumb.jpg"
         image.save(thumb_path, "JPEG", quality=80)
@@ -0,0 +1,115 @@
+"""サムネイルのディスクキャッシュ.
+
+グリッドやサムネイルストリップで元画像をフル解像度でデコードしないよう、
+表示サイズに縮小したサムネイルをWebPで保存して再利用する。
+"""
+
+import hashlib
+from functools import cache
+from pathlib import Path
+from uuid import uuid4
+
+from PIL import Image
+
+from ..db.database import get_data_dir
+
+THUMBNAIL_CACHE_QUALITY = 80
+
+# キャッシュディレクトリの合計サイズの上限（バイト）。超えた分は古いファイルから削除する
+THUMBNAIL_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+@cache
+def _thumbnail_cache_dir() -> Path:
+    """サムネイルキャッシュの保存ディレクトリを取得（初回のみ作成・容量の整理）."""
+    cache_dir = get_data_dir() / "thumbs"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    _prune_cache_dir(cache_dir, THUMBNAIL_CACHE_MAX_BYTES)
+    return cache_dir
+
+
+def _prune_cache_dir(cache_dir: Path, max_bytes: int) -> None:
+    """合計サイズが上限を超えないよう、作成の古いキャッシュファイルから削除する.
+
+    削除された画像やプロジェクトのサムネイルは書き込み時の置き換えでは消えないため、
+    起動後の初回アクセス時に容量で整理する。
+    """
+    files = []
+    for path in cache_dir.iterdir():
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        files.append((stat.st_mtime_ns, stat.st_size, path))
+
+    total = sum(size for _, size, _ in files)
+    for _, size, path in sorted(files, key=lambda item: item[0]):
+        if total <= max_bytes:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
+
+
+def _path_digest(filepath: str) -> str:
+    """元画像のパスに対応するキャッシュファイル名の接頭辞を取得."""
+    return hashlib.sha1(filepath.encode(), usedforsecurity=False).hexdigest()
+
+
+def _cache_path(filepath: str, mtime_ns: int, size: tuple[int, int]) -> Path:
+    """(パス, 更新時刻, サイズ)に対応するキャッシュファイルのパスを取得."""
+    name = f"{_path_digest(filepath)}_{mtime_ns}_{size[0]}x{size[1]}.webp"
+    return _thumbnail_cache_dir() / name
+
+
+def _remove_outdated(filepath: str, mtime_ns: int) -> None:
+    """同じ元画像の、現在と異なる更新時刻のキャッシュファイルを削除する."""
+    prefix = _path_digest(filepath)
+    current = f"{prefix}_{mtime_ns}_"
+    for path in _thumbnail_cache_dir().glob(f"{prefix}_*.webp"):
+        if not path.name.startswith(current):
+            path.unlink(missing_ok=True)
+
+
+def get_cached_thumbnail(filepath: str, size: tuple[int, int]) -> Path | None:
+    """キャッシュ済みのサムネイルのパスを取得（なければ作成する）.
+
+    キーに元画像の更新時刻を含めるため、ファイル更新時は作り直され、
+    古い更新時刻のキャッシュはそのとき削除される。
+    ワーカースレッドからも呼べるよう、Qtには依存しない。
+
+    Args:
+        filepath: 元画像のファイルパス
+        size: サムネイルの最大サイズ（物理ピクセル）
+
+    Returns:
+        サムネイル画像のパス（元画像を読み込めない場合はNone）
+    """
+    if not filepath:
+        return None
+    try:
+        mtime_ns = Path(filepath).stat().st_mtime_ns
+    except OSError:
+        return None
+
+    cache_path = _cache_path(filepath, mtime_ns, size)
+    if cache_path.exists():
+        return cache_path
+
+    try:
+        with Image.open(filepath) as source:
+            # JPEGはdraftでDCT縮小デコードし、フル解像度のデコードを避ける
+            source.draft("RGB", (size[0] * 2, size[1] * 2))
+            source.thumbnail(size, Image.Resampling.LANCZOS)
+            has_alpha = source.mode in ("RGBA", "LA", "PA") or "transparency" in source.info
+            image = source.convert("RGBA" if has_alpha else "RGB")
+
+        # 同じ画像を複数スレッドで同時に作成しても壊れないよう、一時ファイルから置き換える
+        temp_path = cache_path.with_name(f"{cache_path.stem}.{uuid4().hex}.tmp")
+        image.save(temp_path, "WEBP", quality=THUMBNAIL_CACHE_QUALITY)
+        temp_path.replace(cache_path)
+        # 編集で更新時刻が変わるたびに増えないよう、同じ画像の古いサムネイルを削除する
+        _remove_outdated(filepath, mtime_ns)
+    except OSError:
+        return None
+
+    return cache_path
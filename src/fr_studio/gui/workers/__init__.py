@@ -1,7 +1,18 @@
 """ワーカースレッドモジュール."""
 
 from .base import BaseWorker
+from .mask_generation import MaskGenerationWorker
+from .preview_render import PreviewRenderWorker
 from .project_creation import ProjectCreationWorker
+from .thumbnail_loader import ThumbnailLoader, ThumbnailLoaderSignals
 from .upload import UploadWorker
 
-__all__ = ["BaseWorker", "ProjectCreationWorker", "UploadWorker"]
+__all__ = [
+    "BaseWorker",
+    "MaskGenerationWorker",
+    "PreviewRenderWorker",
+    "ProjectCreationWorker",
+    "ThumbnailLoader",
+    "ThumbnailLoaderSignals",
+    "UploadWorker",
+]
@@ -0,0 +1,71 @@
+"""マスク生成ワーカー.
+
+画像編集画面で背景除去マスクを非同期で生成する。
+"""
+
+from pathlib import Path
+
+from PIL import Image
+from PySide6.QtCore import Signal
+
+from fr_studio.infrastructure.birefnet_remover import BiRefNetRemover
+
+from ..di.container import inject
+from ..services.product_image_service import ProductImageService
+from .base import BaseWorker
+
+
+class MaskGenerationWorker(BaseWorker):
+    """背景除去マスク生成ワーカー.
+
+    BiRefNetの推論は元画像のみに依存するため、画像ごとに1回だけ実行する。
+    スライダー操作のたびに再実行しないよう、GUIスレッドから切り離して処理する。
+    フル解像度画像のデコードとマスクPNGの保存もワーカー内で行う。
+    背景マスクは商品マスクの反転なので保存しない。
+
+    Signals:
+        finished: マスク生成完了 (image_id, product_mask)
+    """
+
+    finished = Signal(int, object)  # image_id, 商品マスク
+
+    def __init__(self, image_id: int, image_path: str, product_mask_path: Path) -> None:
+        """初期化.
+
+        Args:
+            image_id: 対象の画像ID
+            image_path: マスク生成元の画像パス
+            product_mask_path: 商品マスクの保存先
+        """
+        super().__init__()
+        self.image_id = image_id
+        self.image_path = image_path
+        self.product_mask_path = product_mask_path
+        self._remover = inject(BiRefNetRemover)
+
+    def run(self) -> None:
+        """マスク生成を実行."""
+        try:
+            if self.check_cancelled():
+                return
+
+            with Image.open(self.image_path) as image:
+                product_mask = self._remover.generate_mask(image)
+
+            if self.check_cancelled():
+                return
+
+            self.product_mask_path.parent.mkdir(parents=True, exist_ok=True)
+            product_mask.save(
+                self.product_mask_path,
+                "PNG",
+                compress_level=ProductImageService.WORKING_PNG_COMPRESS_LEVEL,
+            )
+
+            self.finished.emit(self.image_id, product_mask)
+
+        except Exception as e:
+            self.emit_error(f"背景除去エラー: {e}")
+            import traceback
+
+            traceback.print_exc()
@@ -0,0 +1,55 @@
+"""プレビュー描画ワーカー.
+
+画像編集画面のプレビュー生成（エッジ・センタリング・影・トーン）を
+GUIスレッドから切り離して実行する。
+"""
+
+from collections.abc import Callable
+
+from PySide6.QtCore import Signal
+from PySide6.QtGui import QImage
+
+from .base import BaseWorker
+
+# 描画関数: キャンセル判定関数を受け取り、描画結果（キャンセル時はNone）を返す
+PreviewRenderer = Callable[[Callable[[], bool]], QImage | None]
+
+
+class PreviewRenderWorker(BaseWorker):
+    """プレビュー描画ワーカー.
+
+    QPixmapはGUIスレッドでしか扱えないため、ワーカーはQImageまでを生成して返す。
+    キャンセル時も参照を破棄できるよう、結果なし（None）でfinishedを発火する。
+
+    Signals:
+        finished: 描画完了 (generation, QImage | None)
+    """
+
+    finished = Signal(int, object)  # 世代番号, QImage（キャンセル時はNone）
+
+    def __init__(self, generation: int, renderer: PreviewRenderer) -> None:
+        """初期化.
+
+        Args:
+            generation: 描画リクエストの世代番号（古い結果の破棄に使用）
+            renderer: 描画関数
+        """
+        super().__init__()
+        self.generation = generation
+        self._renderer = renderer
+
+    def run(self) -> None:
+        """描画を実行."""
+        image = None
+        try:
+            if not self.check_cancelled():
+                image = self._renderer(self.check_cancelled)
+        except Exception as e:
+            self.emit_error(f"プレビュー生成エラー: {e}")
+            import traceback
+
+            traceback.print_exc()
+        finally:
+            if self.check_cancelled():
+                image = None
+            self.finished.emit(self.generation, image)
@@ -3,6 +3,7 @@
 プロジェクト作成時の画像処理を非同期で実行する。
 """
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
 from PIL import Image, ImageOps
@@ -10,13 +11,16 @@ from PySide6.QtCore import Signal
 
 from fr_studio.infrastructure.google_sheets_client import GoogleSheetsClient, SheetItem
 
-from ..db.database import get_projects_dir
+from ..db.database import get_database, get_projects_dir
 from ..db.models import ProductImageModel, ProductModel, ProjectModel
 from ..di.container import inject
 from ..services.image_downloader import GoogleDriveDownloader
 from ..services.product_image_service import ProductImageService
 from .base import BaseWorker
 
+# 編集用リサイズ版の最大サイズ
+RESIZED_IMAGE_SIZE = (1600, 1600)
+
 
 class ProjectCreationWorker(BaseWorker):
     """プロジェクト作成ワーカー.
@@ -51,6 +55,9 @@ class ProjectCreationWorker(BaseWorker):
         self._downloader = inject(GoogleDriveDownloader)
         self._product_image_service = inject(ProductImageService)
 
+        # 作成済みのディレクトリ（同じディレクトリへのmkdirを繰り返さない）
+        self._created_dirs: set[Path] = set()
+
         # Spreadsheetから全商品を取得してキャッシュ
         self._sheet_items: dict[int, SheetItem] = {}
         try:
@@ -87,14 +94,34 @@ class ProjectCreationWorker(BaseWorker):
             if self.check_cancelled():
                 return
 
-            # 商品ごとに処理
-            total = len(effective_ids)
-            for i, item_id in enumerate(effective_ids):
-                if self.check_cancelled():
-                    return
-
-                percent = 5 + int((i / total) * 90)
-                self._process_product(project, item_id, percent)
+            # 商品フォルダの検索と画像一覧の取得を一括で済ませておく
+            # （スプレッドシートにない商品はスキップされるため対象外）
+            target_ids = [item_id for item_id in effective_ids if item_id in self._sheet_items]
+            self._downloader.prefetch_items(target_ids)
+
+            # ダウンロードは専用スレッドで商品順に先行させ、
+            # 前の商品の背景除去・保存中に次の商品の通信を済ませておく
+            download_executor = ThreadPoolExecutor(max_workers=1)
+            try:
+                downloads = {
+                    item_id: download_executor.submit(
+                        self._downloader.download_images,
+                        item_id,
+                        self._product_dir(project, item_id),
+                    )
+                    for item_id in target_ids
+                }
+
+                # 商品ごとに処理
+                total = len(effective_ids)
+                for i, item_id in enumerate(effective_ids):
+                    if self.check_cancelled():
+                        return
+
+                    percent = 5 + int((i / total) * 90)
+                    self._process_product(project, item_id, percent, downloads.get(item_id))
+            finally:
+                download_executor.shutdown(wait=True, cancel_futures=True)
 
             # 画像が1つも登録されなかった場合はプロジェクトを削除
             image_count = (
@@ -104,7 +131,9 @@ class ProjectCreationWorker(BaseWorker):
                 .count()
             )
             if image_count == 0:
-                project.delete_instance(recursive=True)
+                # 商品・画像の削除を1トランザクションにまとめる
+                with get_database().atomic():
+                    project.delete_instance(recursive=True)
                 self.emit_progress("対象商品がありません。終了します。", 100)
                 return
 
@@ -134,8 +163,23 @@ class ProjectCreationWorker(BaseWorker):
 
         return project
 
+    def _ensure_dir(self, path: Path) -> None:
+        """ディレクトリを作成する（このワーカーで作成済みなら何もしない）."""
+        if path not in self._created_dirs:
+            path.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(path)
+
+    @staticmethod
+    def _product_dir(project: ProjectModel, item_id: int) -> Path:
+        """商品ディレクトリのパス."""
+        return Path(project.project_dir_path) / str(item_id)
+
     def _process_product(
-        self, project: ProjectModel, item_id: int, percent: int
+        self,
+        project: ProjectModel,
+        item_id: int,
+        percent: int,
+        download: Future[list[Path]] | None,
     ) -> None:
         """商品を処理する.
 
@@ -143,18 +187,19 @@ class ProjectCreationWorker(BaseWorker):
             project: プロジェクトモデル
             item_id: 商品ID
             percent: 現在の進捗率
+            download: 先行して開始した画像ダウンロード（スプレッドシートにない商品はNone）
         """
         # Spreadsheetから商品名を取得
         sheet_item = self._sheet_items.get(item_id)
-        if not sheet_item:
+        if not sheet_item or download is None:
             self.emit_progress(f"商品 {item_id}: 存在しません。スキップ", percent)
             return
 
         caption = sheet_item.item_name
 
         # 商品ディレクトリ作成
-        product_dir = Path(project.project_dir_path) / str(item_id)
-        product_dir.mkdir(parents=True, exist_ok=True)
+        product_dir = self._product_dir(project, item_id)
+        self._ensure_dir(product_dir)
 
         # 商品レコード作成
         product = ProductModel.create(
@@ -164,9 +209,9 @@ class ProjectCreationWorker(BaseWorker):
             caption=caption,
         )
 
-        # 画像ダウンロード（originalsに保存）
+        # 画像ダウンロード（originalsに保存、先行ダウンロードの完了を待つ）
         self.emit_progress(f"商品 {item_id}: ダウンロード中...", percent)
-        image_paths = self._downloader.download_images(item_id, product_dir)
+        image_paths = download.result()
 
         if not image_paths:
             self.emit_progress(f"商品 {item_id}: 画像がありません。スキップ", percent)
@@ -174,24 +219,37 @@ class ProjectCreationWorker(BaseWorker):
 
         # リサイズ版作成（編集用）
         source_dir = product_dir / "source"
-        source_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_dir(source_dir)
+        # マスク・サムネイルの保存先（ProductImageServiceは画像ごとには作成しない）
+        self._ensure_dir(product_dir / "processed")
+
+        # リサイズ版のファイル名昇順で (original, resized) のペアを作成
+        # 背景除去対象の画像は保存時のデコード済み画像をそのままマスク生成に使う
+        limit = self._product_image_service.BACKGROUND_REMOVAL_LIMIT
+        sorted_pairs: list[tuple[Path, Path]] = []
+        mask_sources: list[Image.Image] = []
+        for original_path in sorted(image_paths, key=self._resized_filename):
+            resized_path, resized_image = self._create_resized_image(original_path, source_dir)
+            sorted_pairs.append((original_path, resized_path))
+            if len(mask_sources) < limit:
+                mask_sources.append(resized_image)
+        total_images = len(sorted_pairs)
 
-        # (original, resized) のペアを作成
-        image_pairs: list[tuple[Path, Path]] = []
-        for original_path in image_paths:
-            resized_path = self._create_resized_image(original_path, source_dir)
-            image_pairs.append((original_path, resized_path))
+        # 背景除去対象の画像はまとめて1回のバッチ推論でマスクを生成
+        self.emit_progress(f"商品 {item_id}: 背景除去中...", percent)
+        product_masks = self._product_image_service.generate_product_masks(mask_sources)
+        del mask_sources
 
-        # リサイズ版のファイル名昇順でソート
-        sorted_pairs = sorted(image_pairs, key=lambda pair: pair[1].name)
-        total_images = len(sorted_pairs)
         for sort_index, (original_path, resized_path) in enumerate(sorted_pairs, start=1):
             if self.check_cancelled():
                 return
             self.emit_progress(
                 f"商品 {item_id}: 画像処理中 ({sort_index}/{total_images})...", percent
             )
-            self._process_image(product, resized_path, original_path, sort_index)
+            product_mask = (
+                product_masks[sort_index - 1] if sort_index <= len(product_masks) else None
+            )
+            self._process_image(product, resized_path, original_path, sort_index, product_mask)
 
     def _process_image(
         self,
@@ -199,6 +257,7 @@ class ProjectCreationWorker(BaseWorker):
         resized_path: Path,
         original_path: Path,
         sort_index: int,
+        product_mask: Image.Image | None = None,
     ) -> None:
         """画像を処理する.
 
@@ -207,16 +266,25 @@ class ProjectCreationWorker(BaseWorker):
             resized_path: リサイズ済み画像パス（source/）
             original_path: 元画像パス（originals/）
             sort_index: 並び順（1から開始）
+            product_mask: バッチ推論で生成済みの商品マスク
         """
-        # ProductImageServiceを使用してマスク生成・DB登録
+        # ProductImageServiceを使用してマスク保存・DB登録
         self._product_image_service.create_product_image(
             product=product,
             image_path=resized_path,
             original_path=original_path,
             sort_index=sort_index,
+            product_mask=product_mask,
         )
 
-    def _create_resized_image(self, original_path: Path, dest_dir: Path) -> Path:
+    @staticmethod
+    def _resized_filename(original_path: Path) -> str:
+        """元画像に対応するリサイズ版のファイル名."""
+        return f"{original_path.stem}.jpg"
+
+    def _create_resized_image(
+        self, original_path: Path, dest_dir: Path
+    ) -> tuple[Path, Image.Image]:
         """元画像から編集用リサイズ版を作成.
 
         Args:
@@ -224,9 +292,14 @@ class ProjectCreationWorker(BaseWorker):
             dest_dir: 保存先ディレクトリ
 
         Returns:
-            リサイズ版のパス
+            (リサイズ版のパス, リサイズ済みのRGB画像)
         """
+        # Google Driveからはimage/*の任意の形式がダウンロードされるため、形式は限定しない
         image = Image.open(original_path)
+        # JPEGはdraftでDCT縮小・RGBでデコードし、リサイズで捨てる分のデコードを避ける
+        # （縮小後も要求サイズ以上になる倍率が選ばれるため出力サイズは変わらないが、
+        # 縮小の一部をDCTで行うぶん画素値はフル解像度からのLANCZOS縮小とわずかに異なる）
+        image.draft("RGB", RESIZED_IMAGE_SIZE)
         image = ImageOps.exif_transpose(image)
 
         # RGBに変換
@@ -234,10 +307,10 @@ class ProjectCreationWorker(BaseWorker):
             image = image.convert("RGB")
 
         # 1600x1600にリサイズ（アスペクト比維持）
-        image.thumbnail((1600, 1600), Image.Resampling.LANCZOS)
+        image.thumbnail(RESIZED_IMAGE_SIZE, Image.Resampling.LANCZOS)
 
         # JPG 70%で保存
-        dest_path = dest_dir / f"{original_path.stem}.jpg"
+        dest_path = dest_dir / self._resized_filename(original_path)
         image.save(dest_path, "JPEG", quality=70)
 
-        return dest_path
+        return dest_path, image
@@ -0,0 +1,63 @@
+"""サムネイル読み込みタスク.
+
+画像グリッドやサムネイルストリップのサムネイル作成・デコードをQThreadPoolで実行し、
+カードの生成や描画をファイル読み込みで待たせないようにする。
+"""
+
+from PySide6.QtCore import QObject, QRunnable, Signal
+from PySide6.QtGui import QImage
+
+from ..services.thumbnail_cache import get_cached_thumbnail
+
+
+class ThumbnailLoaderSignals(QObject):
+    """ThumbnailLoaderの完了通知.
+
+    QRunnableはシグナルを持てないため、画面ごとに1つ作成して各タスクで共有する。
+
+    Signals:
+        loaded: 読み込み完了 (generation, image_id, QImage)
+    """
+
+    loaded = Signal(int, int, QImage)  # 世代番号, 画像ID, サムネイル
+
+
+class ThumbnailLoader(QRunnable):
+    """サムネイル読み込みタスク.
+
+    QPixmapはGUIスレッドでしか扱えないため、QImageまでを読み込んで返す。
+    読み込めなかった場合は通知しない（カードはプレースホルダーのまま）。
+    """
+
+    def __init__(
+        self,
+        signals: ThumbnailLoaderSignals,
+        generation: int,
+        image_id: int,
+        filepath: str,
+        size: tuple[int, int],
+    ) -> None:
+        """初期化.
+
+        Args:
+            signals: 完了通知先
+            generation: 読み込みリクエストの世代番号（古い結果の破棄に使用）
+            image_id: 画像ID
+            filepath: 元画像のファイルパス
+            size: サムネイルの最大サイズ（物理ピクセル）
+        """
+        super().__init__()
+        self._signals = signals
+        self._generation = generation
+        self._image_id = image_id
+        self._filepath = filepath
+        self._size = size
+
+    def run(self) -> None:
+        """サムネイルを読み込む."""
+        thumb_path = get_cached_thumbnail(self._filepath, self._size)
+        if thumb_path is None:
+            return
+        image = QImage(str(thumb_path))
+        if not image.isNull():
+            self._signals.loaded.emit(self._generation, self._image_id, image)
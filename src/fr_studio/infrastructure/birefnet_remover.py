@@ -1,5 +1,8 @@
 """BiRefNetを使用した背景除去の実装."""
 
+import contextlib
+from threading import Lock
+
 import numpy as np
 import torch
 from PIL import Image
@@ -16,6 +19,8 @@ class BiRefNetRemover:
     高精度な背景除去を実行する。
 
     モデルは非同期でロードされ、推論時にロード完了を待機する。
+    アプリ全体で1つのインスタンス（ロード済みモデル）を共有し、
+    複数のワーカーからの推論はロックで直列化する。
     """
 
     MODEL_NAME = "ZhengPeng7/BiRefNet"
@@ -39,6 +44,11 @@ class BiRefNetRemover:
         self._model = None
         self._transform = None
         self._loader = AsyncModelLoader()
+        # 編集画面とプロジェクト作成のワーカーが同時に推論しても、
+        # 中間テンソルのメモリを重複して確保しないよう1件ずつ実行する
+        self._inference_lock = Lock()
+        # CUDA転送用のページ固定メモリ（推論ロック中のみ使用、バッチサイズが増えたら作り直す）
+        self._pinned_input: torch.Tensor | None = None
 
     def start_loading(self) -> None:
         """モデルのバックグラウンドロードを開始."""
@@ -53,12 +63,35 @@ class BiRefNetRemover:
         self._model.to(self._device)
         self._model.eval()
 
+        # 入力は常に1024x1024固定なので、cuDNNに最速の畳み込みアルゴリズムを選ばせる
+        if self._device == "cuda":
+            torch.backends.cudnn.benchmark = True
+
         self._transform = transforms.Compose([
             transforms.Resize((1024, 1024)),
             transforms.ToTensor(),
             transforms.Normalize([0.485, 0.456, 0.406], [0.229, 0.224, 0.225]),
         ])
 
+        if self._device == "cuda":
+            self._compile_model()
+
+    def _compile_model(self) -> None:
+        """CUDAではtorch.compileでカーネルを融合する（内部メソッド）.
+
+        入力サイズは1024x1024固定なので、バッチサイズごとに1回ずつしかコンパイルされない。
+        最初の推論でコンパイル待ちにならないよう、ロード中（バックグラウンド）に
+        1枚分の推論でコンパイルを済ませる。コンパイルできない環境では通常実行に戻す。
+        """
+        eager_model = self._model
+        try:
+            self._model = torch.compile(eager_model)
+            dummy = torch.zeros(1, 3, 1024, 1024, device=self._device)
+            with torch.inference_mode(), self._autocast():
+                self._model(dummy)
+        except Exception:
+            self._model = eager_model
+
     @property
     def model_state(self) -> ModelState:
         """モデルの状態を取得."""
@@ -90,9 +123,10 @@ class BiRefNetRemover:
         Args:
             device: 切り替え先のデバイス（"cuda", "mps", "cpu"）
         """
-        self._device = device
-        if self._model is not None:
-            self._model.to(device)
+        with self._inference_lock:
+            self._device = device
+            if self._model is not None:
+                self._model.to(device)
 
     @property
     def device(self) -> str:
@@ -110,6 +144,26 @@ class BiRefNetRemover:
         Returns:
             商品マスク（Lモード、白=商品、黒=背景）
 
+        Raises:
+            RuntimeError: モデルのロードに失敗した場合
+        """
+        return self.generate_masks([image])[0]
+
+    def generate_masks(
+        self, images: list[Image.Image], batch_size: int = 4
+    ) -> list[Image.Image]:
+        """複数画像の商品マスクをバッチ推論でまとめて生成する.
+
+        入力は1024x1024に揃えるため、batch_size枚ずつ1回の推論で処理する。
+        モデルがロード中の場合は、ロード完了まで待機する。
+
+        Args:
+            images: 入力画像のリスト（RGB or RGBA）
+            batch_size: 1回の推論でまとめる枚数
+
+        Returns:
+            入力と同じ順の商品マスクのリスト（Lモード、白=商品、黒=背景）
+
         Raises:
             RuntimeError: モデルのロードに失敗した場合
         """
@@ -119,21 +173,53 @@ class BiRefNetRemover:
         if self._model is None or self._transform is None:
             raise RuntimeError("モデルがロードされていません")
 
-        original_size = image.size
+        masks: list[Image.Image] = []
+        for start in range(0, len(images), batch_size):
+            batch = images[start : start + batch_size]
+            # 前処理はロック外で行い、他のワーカーの推論と並行させる
+            tensors = [
+                self._transform(image if image.mode == "RGB" else image.convert("RGB"))
+                for image in batch
+            ]
 
-        if image.mode != "RGB":
-            image = image.convert("RGB")
+            with self._inference_lock, torch.inference_mode(), self._autocast():
+                preds = self._model(self._to_device(tensors))[-1].sigmoid()
+                # 結果の受け取りまでロック内で行い、入力の転送完了前に
+                # 他のワーカーが共有のページ固定メモリを上書きしないようにする
+                preds = preds.float().cpu()
 
-        input_tensor = self._transform(image).unsqueeze(0).to(self._device)
+            for image, pred in zip(batch, preds.numpy(), strict=True):
+                mask = Image.fromarray((pred.squeeze() * 255).astype(np.uint8))
+                masks.append(mask.resize(image.size, Image.Resampling.BILINEAR))
 
-        with torch.no_grad():
-            preds = self._model(input_tensor)[-1].sigmoid()
+        return masks
 
-        mask = preds[0].squeeze().cpu().numpy()
-        mask = Image.fromarray((mask * 255).astype(np.uint8))
-        mask = mask.resize(original_size, Image.Resampling.BILINEAR)
+    def _to_device(self, tensors: list[torch.Tensor]) -> torch.Tensor:
+        """前処理済みのテンソルをバッチにまとめてデバイスへ転送する（推論ロック中に呼ぶ）.
 
-        return mask
+        CUDAでは使い回しのページ固定メモリにまとめてからDMAで転送し、
+        呼び出しごとのステージング用メモリの確保とページング領域からのコピーを避ける。
+        """
+        if self._device != "cuda":
+            return torch.stack(tensors).to(self._device)
+
+        shape = (len(tensors), *tensors[0].shape)
+        if self._pinned_input is None or self._pinned_input.shape[0] < shape[0]:
+            self._pinned_input = torch.empty(shape, pin_memory=True)
+        staging = self._pinned_input[: shape[0]]
+        torch.stack(tensors, out=staging)
+        # 非同期転送の完了は呼び出し側がロック内で結果を.cpu()で受け取ることで保証する
+        return staging.to(self._device, non_blocking=True)
+
+    def _autocast(self) -> contextlib.AbstractContextManager[object]:
+        """推論時の自動混合精度コンテキストを取得.
+
+        CUDAではFP16で推論してTensor Coreを使い、メモリ転送量を半減させる。
+        出力はsigmoidのマスクなので精度の影響はない。それ以外のデバイスはFP32のまま。
+        """
+        if self._device == "cuda":
+            return torch.autocast(device_type="cuda", dtype=torch.float16)
+        return contextlib.nullcontext()
 
     def remove_background(self, image: Image.Image) -> Image.Image:
         """背景を除去する.
@@ -149,9 +235,29 @@ class BiRefNetRemover:
         Raises:
             RuntimeError: モデルのロードに失敗した場合
         """
-        mask = self.generate_mask(image)
+        return self.remove_background_batch([image])[0]
+
+    def remove_background_batch(
+        self, images: list[Image.Image], batch_size: int = 4
+    ) -> list[Image.Image]:
+        """複数画像の背景をバッチ推論でまとめて除去する.
+
+        Args:
+            images: 入力画像のリスト（RGB or RGBA）
+            batch_size: 1回の推論でまとめる枚数
+
+        Returns:
+            入力と同じ順の、背景が透過されたRGBA画像のリスト
+
+        Raises:
+            RuntimeError: モデルのロードに失敗した場合
+        """
+        masks = self.generate_masks(images, batch_size)
 
-        rgba = image.convert("RGBA")
-        rgba.putalpha(mask)
+        results = []
+        for image, mask in zip(images, masks, strict=True):
+            rgba = image.convert("RGBA")
+            rgba.putalpha(mask)
+            results.append(rgba)
 
-        return rgba
+        return results
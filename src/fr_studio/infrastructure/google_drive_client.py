@@ -6,25 +6,68 @@
 
 from __future__ import annotations
 
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+from google.auth.transport.requests import AuthorizedSession
 from googleapiclient.discovery import build
-from googleapiclient.http import MediaIoBaseDownload
+from googleapiclient.http import HttpRequest
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from .google_auth import get_credentials
 
+# 画像ダウンロードの並列数（通信待ちが支配的なのでCPU数に依存しない）
+DOWNLOAD_WORKERS = 8
+
+# ファイル本体の取得URL（alt=mediaで1回のGETでダウンロードする）
+DRIVE_MEDIA_URL = "https://www.googleapis.com/drive/v3/files/{file_id}?alt=media"
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+DOWNLOAD_RETRIES = 5
+
+# フォルダ一括検索で1クエリにまとめるフォルダ名の数
+FOLDER_QUERY_BATCH_SIZE = 50
+
+# バッチリクエスト1回にまとめるリクエスト数（Drive APIの上限は100）
+BATCH_REQUEST_SIZE = 100
+
+
+def _escape_query_value(value: str) -> str:
+    """Drive APIのクエリ文字列リテラル用にエスケープ."""
+    return value.replace("\\", "\\\\").replace("'", "\\'")
+
 
 class GoogleDriveClient:
     """Google Drive API クライアント.
 
     商品画像のダウンロード・アップロードを行う。
+    DIコンテナでシングルトンとして複数のワーカースレッドから共有されるため、
+    APIサービス（httplib2はスレッドセーフでない）はスレッドごとに作成し、
+    キャッシュはロックで保護する。
     """
 
     def __init__(self) -> None:
         """クライアントを初期化."""
-        creds = get_credentials()
-        self._service = build("drive", "v3", credentials=creds)
+        self._creds = get_credentials()
+        self._thread_local = threading.local()
+        self._cache_lock = threading.Lock()
+        # フォルダ名 → フォルダID（IDは変わらないため見つかったものだけ保持する）
+        self._folder_cache: dict[str, str] = {}
+        # フォルダID → 先読みした画像一覧（内容は変わりうるため1回使ったら破棄する）
+        self._prefetched_images: dict[str, list[dict[str, Any]]] = {}
+
+    @property
+    def _service(self) -> Any:
+        """スレッドごとのDrive APIサービスを取得."""
+        service = getattr(self._thread_local, "service", None)
+        if service is None:
+            # ディスカバリー文書はライブラリ同梱のものを使い、ファイルキャッシュの探索を省く
+            service = build("drive", "v3", credentials=self._creds, cache_discovery=False)
+            self._thread_local.service = service
+        return service
 
     def download_images_by_item_id(
         self, item_id: int, destination_dir: Path
@@ -45,16 +88,19 @@ class GoogleDriveClient:
         if not folder_id:
             return []
 
-        files = self._list_images_in_folder(folder_id)
-        downloaded = []
-
-        for f in files:
-            # IMG_ で始まるファイルのみダウンロード
-            if f["name"].startswith("IMG_"):
-                path = self._download_file(f["id"], f["name"], destination_dir)
-                downloaded.append(path)
+        # IMG_ で始まるファイルのみダウンロード
+        files = [f for f in self._list_images_in_folder(folder_id) if f["name"].startswith("IMG_")]
+        if not files:
+            return []
 
-        return downloaded
+        # 各ファイルは独立したGETなので並列にダウンロードする（結果は一覧の順序を保つ）
+        destination_dir.mkdir(parents=True, exist_ok=True)
+        with ThreadPoolExecutor(max_workers=min(DOWNLOAD_WORKERS, len(files))) as executor:
+            return list(
+                executor.map(
+                    lambda f: self._download_file(f["id"], f["name"], destination_dir), files
+                )
+            )
 
     def count_images_by_item_id(self, item_id: int) -> int:
         """商品IDのフォルダ内の画像数を取得.
@@ -72,15 +118,97 @@ class GoogleDriveClient:
         files = self._list_images_in_folder(folder_id)
         return sum(1 for f in files if f["name"].startswith("IMG_"))
 
+    def find_folders_by_names(self, names: list[str]) -> dict[str, str]:
+        """複数のフォルダ名をまとめて検索してフォルダIDを取得.
+
+        FOLDER_QUERY_BATCH_SIZE件ずつname条件をORで結合し、
+        商品ごとの検索をクエリ数回の通信にまとめる。結果はキャッシュされ、
+        以降の_find_folder_by_nameは通信しない。
+
+        Args:
+            names: フォルダ名のリスト
+
+        Returns:
+            フォルダ名 → フォルダID（見つからなかった名前は含まない）
+        """
+        with self._cache_lock:
+            pending = [name for name in dict.fromkeys(names) if name not in self._folder_cache]
+        for start in range(0, len(pending), FOLDER_QUERY_BATCH_SIZE):
+            batch = pending[start : start + FOLDER_QUERY_BATCH_SIZE]
+            name_clause = " or ".join(f"name='{_escape_query_value(name)}'" for name in batch)
+            query = (
+                f"({name_clause}) and "
+                "mimeType='application/vnd.google-apps.folder' and "
+                "trashed=false"
+            )
+            page_token = None
+            while True:
+                results = (
+                    self._service.files()
+                    .list(
+                        q=query,
+                        fields="nextPageToken, files(id, name)",
+                        pageSize=1000,
+                        pageToken=page_token,
+                    )
+                    .execute(num_retries=5)
+                )
+                with self._cache_lock:
+                    for f in results.get("files", []):
+                        # 同名フォルダが複数ある場合は最初に見つかったものを使う
+                        self._folder_cache.setdefault(f["name"], f["id"])
+                page_token = results.get("nextPageToken")
+                if not page_token:
+                    break
+
+        with self._cache_lock:
+            return {
+                name: self._folder_cache[name] for name in names if name in self._folder_cache
+            }
+
+    def prefetch_image_lists(self, folder_ids: list[str]) -> None:
+        """複数フォルダの画像一覧をバッチリクエストでまとめて取得しておく.
+
+        BATCH_REQUEST_SIZE件ずつ1回のHTTP通信にまとめる。
+        取得した一覧は次の_list_images_in_folderで1回だけ使われる。
+        失敗したフォルダは先読みせず、通常どおり個別に取得させる。
+
+        Args:
+            folder_ids: フォルダIDのリスト
+        """
+
+        def on_response(request_id: str, response: dict[str, Any], exception: Exception) -> None:
+            if exception is None:
+                with self._cache_lock:
+                    self._prefetched_images[request_id] = response.get("files", [])
+
+        # 前回の先読みで使われなかった一覧は古い可能性があるため破棄する
+        with self._cache_lock:
+            self._prefetched_images.clear()
+        unique_ids = list(dict.fromkeys(folder_ids))
+        for start in range(0, len(unique_ids), BATCH_REQUEST_SIZE):
+            batch = self._service.new_batch_http_request(callback=on_response)
+            for folder_id in unique_ids[start : start + BATCH_REQUEST_SIZE]:
+                batch.add(self._image_list_request(folder_id), request_id=folder_id)
+            batch.execute()
+
     def _find_folder_by_name(self, name: str) -> str | None:
         """フォルダ名でフォルダIDを検索.
 
+        見つかったフォルダIDはキャッシュし、同じ商品IDの再検索で通信しない。
+        見つからなかった場合は後から作成される可能性があるためキャッシュしない。
+
         Args:
             name: フォルダ名
 
         Returns:
             フォルダID、見つからない場合は None
         """
+        with self._cache_lock:
+            folder_id = self._folder_cache.get(name)
+        if folder_id is not None:
+            return folder_id
+
         query = (
             f"name='{name}' and "
             "mimeType='application/vnd.google-apps.folder' and "
@@ -90,7 +218,13 @@ class GoogleDriveClient:
             self._service.files().list(q=query, fields="files(id, name)").execute()
         )
         files = results.get("files", [])
-        return files[0]["id"] if files else None
+        if not files:
+            return None
+
+        folder_id = files[0]["id"]
+        with self._cache_lock:
+            self._folder_cache[name] = folder_id
+        return folder_id
 
     def _list_images_in_folder(self, folder_id: str) -> list[dict[str, Any]]:
         """フォルダ内の画像ファイル一覧を取得.
@@ -101,21 +235,48 @@ class GoogleDriveClient:
         Returns:
             画像ファイルの情報リスト（id, name を含む）
         """
+        with self._cache_lock:
+            prefetched = self._prefetched_images.pop(folder_id, None)
+        if prefetched is not None:
+            return prefetched
+
+        results = self._image_list_request(folder_id).execute()
+        return results.get("files", [])
+
+    def _image_list_request(self, folder_id: str) -> HttpRequest:
+        """フォルダ内の画像ファイル一覧を取得するリクエストを作成."""
         query = (
             f"'{folder_id}' in parents and "
             "mimeType contains 'image/' and "
             "trashed=false"
         )
-        results = (
-            self._service.files()
-            .list(q=query, fields="files(id, name)", orderBy="name")
-            .execute()
-        )
-        return results.get("files", [])
+        return self._service.files().list(q=query, fields="files(id, name)", orderBy="name")
+
+    def _thread_session(self) -> AuthorizedSession:
+        """スレッドごとの認証済みHTTPセッションを取得.
+
+        並列ダウンロードでセッションを共有しないようスレッドごとに作成し、
+        接続はスレッド内で使い回す。
+        """
+        session = getattr(self._thread_local, "session", None)
+        if session is None:
+            session = AuthorizedSession(self._creds)
+            retry = Retry(
+                total=DOWNLOAD_RETRIES,
+                backoff_factor=1,
+                status_forcelist=(429, 500, 502, 503, 504),
+            )
+            session.mount("https://", HTTPAdapter(max_retries=retry))
+            self._thread_local.session = session
+        return session
 
     def _download_file(self, file_id: str, name: str, dest_dir: Path) -> Path:
         """ファイルをダウンロード.
 
+        MediaIoBaseDownloadのようにチャンクごとにRangeリクエストを繰り返さず、
+        1回のGETのレスポンスをそのままファイルへ書き出す。
+        ワーカースレッドから呼ばれるため、スレッドごとのセッションを使う。
+
         Args:
             file_id: ファイルID
             name: ファイル名
@@ -127,12 +288,12 @@ class GoogleDriveClient:
         dest_dir.mkdir(parents=True, exist_ok=True)
         dest_path = dest_dir / name
 
-        request = self._service.files().get_media(fileId=file_id)
-        with open(dest_path, "wb") as f:
-            downloader = MediaIoBaseDownload(f, request)
-            done = False
-            while not done:
-                _, done = downloader.next_chunk(num_retries=5)
+        url = DRIVE_MEDIA_URL.format(file_id=file_id)
+        with self._thread_session().get(url, stream=True, timeout=60) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            with open(dest_path, "wb") as f:
+                shutil.copyfileobj(response.raw, f, DOWNLOAD_CHUNK_SIZE)
 
         return dest_path
 
@@ -6,7 +6,10 @@
 
 from __future__ import annotations
 
+import math
 import os
+import time
+from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
@@ -19,15 +22,23 @@ from .google_auth import get_credentials
 load_dotenv()
 
 
-def _yen_str_to_int(yen_str: str) -> int:
-    """円表記の文字列を整数に変換."""
+def _yen_str_to_int(yen_str: str | float) -> int:
+    """円表記の文字列（または書式なしの数値）を整数に変換.
+
+    書式なしの数値は小数を含むことがあるため、切り捨てではなく
+    シートの円表示と同じく四捨五入（0から遠い方へ）で整数にする。
+    """
+    if not isinstance(yen_str, str):
+        return int(math.copysign(math.floor(abs(yen_str) + 0.5), yen_str))
     if not yen_str:
         return 0
     return int(yen_str.replace("¥", "").replace(",", "").replace(" ", ""))
 
 
-def _parse_optional_float(value: str) -> float | None:
+def _parse_optional_float(value: str | float) -> float | None:
     """オプションの浮動小数点数をパース."""
+    if not isinstance(value, str):
+        return float(value)
     if not value or value.strip() == "":
         return None
     try:
@@ -36,14 +47,77 @@ def _parse_optional_float(value: str) -> float | None:
         return None
 
 
-def _is_empty(value: str | None) -> bool:
-    """値が空かどうかを判定."""
-    if value is None:
-        return True
-    return len(value.replace(" ", "").replace("\u3000", "").replace("\t", "")) == 0
-
-
-@dataclass(frozen=True)
+def _is_empty(value: str | float | None) -> bool:
+    """値が空かどうかを判定（数値は0でも空ではない）."""
+    if isinstance(value, str):
+        return not value.strip(" \u3000\t")
+    return value is None
+
+
+def _int_or_zero(value: Any) -> int:
+    """整数に変換（空なら0）."""
+    return int(value) if value else 0
+
+
+def _str_or_empty(value: Any) -> str:
+    """文字列に変換（空なら空文字）."""
+    return "" if value is None or value == "" else str(value)
+
+
+def _value_or_none(value: Any) -> str | None:
+    """文字列として返す（空ならNone）."""
+    return None if value is None or value == "" else str(value)
+
+
+def _yen_or_zero(value: str) -> int:
+    """円表記を整数に変換（空なら0）."""
+    return _yen_str_to_int(value) if not _is_empty(value) else 0
+
+
+def _yen_or_none(value: str) -> int | None:
+    """円表記を整数に変換（空ならNone）."""
+    return _yen_str_to_int(value) if not _is_empty(value) else None
+
+
+# SheetItemのフィールドと列（A列から順）ごとの変換関数
+_COLUMN_PARSERS: tuple[tuple[str, Callable[[Any], Any]], ...] = (
+    ("item_id", _int_or_zero),
+    ("user_code", _str_or_empty),
+    ("item_name", _str_or_empty),
+    ("size", _value_or_none),
+    ("item_type", _str_or_empty),
+    ("sales_price_without_tax", _yen_or_zero),
+    ("sales_price_with_tax", _yen_or_zero),
+    ("minimum_sales_price_without_tax", _yen_or_none),
+    ("purchase_price_with_tax", _yen_or_none),
+    ("sales_status", _str_or_empty),
+    ("sold_date", _value_or_none),
+    ("paid_date", _value_or_none),
+    ("returned_date", _value_or_none),
+    ("profit_without_tax", _yen_or_zero),
+    ("profit_with_tax", _yen_or_zero),
+    ("note", _value_or_none),
+    ("purchase_date", _value_or_none),
+    ("shoulder_width", _parse_optional_float),
+    ("sleeve_length", _parse_optional_float),
+    ("body_width", _parse_optional_float),
+    ("dress_length", _parse_optional_float),
+    ("payment_method", _value_or_none),
+    ("waist", _parse_optional_float),
+    ("rise", _parse_optional_float),
+    ("inseam", _parse_optional_float),
+    ("cross_width", _parse_optional_float),
+    ("hem_width", _parse_optional_float),
+    ("total_length", _parse_optional_float),
+    ("hat_height", _parse_optional_float),
+    ("hat_circumference", _parse_optional_float),
+    ("brim", _parse_optional_float),
+    ("tag", _value_or_none),
+)
+_COLUMN_COUNT = len(_COLUMN_PARSERS)
+
+
+@dataclass(frozen=True, slots=True)
 class SheetItem:
     """スプレッドシートの商品データ.
 
@@ -93,56 +167,55 @@ class SheetItem:
         Returns:
             SheetItem インスタンス
         """
-        # 行の長さを補完（足りない場合は空文字で埋める）
-        while len(row) < 32:
-            row.append("")
-
-        return SheetItem(
-            item_id=int(row[0]) if row[0] else 0,
-            user_code=str(row[1]) if row[1] else "",
-            item_name=str(row[2]) if row[2] else "",
-            size=row[3] if row[3] else None,
-            item_type=str(row[4]) if row[4] else "",
-            sales_price_without_tax=(
-                _yen_str_to_int(row[5]) if not _is_empty(row[5]) else 0
-            ),
-            sales_price_with_tax=(
-                _yen_str_to_int(row[6]) if not _is_empty(row[6]) else 0
-            ),
-            minimum_sales_price_without_tax=(
-                _yen_str_to_int(row[7]) if not _is_empty(row[7]) else None
-            ),
-            purchase_price_with_tax=(
-                _yen_str_to_int(row[8]) if not _is_empty(row[8]) else None
-            ),
-            sales_status=str(row[9]) if row[9] else "",
-            sold_date=row[10] if row[10] else None,
-            paid_date=row[11] if row[11] else None,
-            returned_date=row[12] if row[12] else None,
-            profit_without_tax=(
-                _yen_str_to_int(row[13]) if not _is_empty(row[13]) else 0
-            ),
-            profit_with_tax=(
-                _yen_str_to_int(row[14]) if not _is_empty(row[14]) else 0
-            ),
-            note=row[15] if row[15] else None,
-            purchase_date=row[16] if row[16] else None,
-            shoulder_width=_parse_optional_float(row[17]),
-            sleeve_length=_parse_optional_float(row[18]),
-            body_width=_parse_optional_float(row[19]),
-            dress_length=_parse_optional_float(row[20]),
-            payment_method=row[21] if row[21] else None,
-            waist=_parse_optional_float(row[22]),
-            rise=_parse_optional_float(row[23]),
-            inseam=_parse_optional_float(row[24]),
-            cross_width=_parse_optional_float(row[25]),
-            hem_width=_parse_optional_float(row[26]),
-            total_length=_parse_optional_float(row[27]),
-            hat_height=_parse_optional_float(row[28]),
-            hat_circumference=_parse_optional_float(row[29]),
-            brim=_parse_optional_float(row[30]),
-            tag=row[31] if row[31] else None,
-        )
+        # 行の長さを補完（足りない場合は空文字で埋める、呼び出し元のリストは変更しない）
+        if len(row) < _COLUMN_COUNT:
+            row = [*row, *[""] * (_COLUMN_COUNT - len(row))]
+
+        return cls(**{
+            name: parse(value)
+            for (name, parse), value in zip(_COLUMN_PARSERS, row, strict=False)
+        })
+
+    @classmethod
+    def from_rows(cls, rows: list[list[Any]]) -> list[SheetItem]:
+        """複数行のデータからまとめて SheetItem を生成.
+
+        列ごとに変換関数をmapで一括適用し、行ごとの変換関数の呼び出しを減らす。
+        変換に失敗する行がある場合は行ごとに変換し、失敗した行はスキップする。
+
+        Args:
+            rows: スプレッドシートの行データのリスト
+
+        Returns:
+            SheetItem インスタンスのリスト（元の行順）
+        """
+        if not rows:
+            return []
+
+        padded = [
+            row[:_COLUMN_COUNT]
+            if len(row) >= _COLUMN_COUNT
+            else [*row, *[""] * (_COLUMN_COUNT - len(row))]
+            for row in rows
+        ]
+        try:
+            raw_columns = zip(*padded, strict=True)
+            columns = [
+                list(map(parse, column))
+                for (_, parse), column in zip(_COLUMN_PARSERS, raw_columns, strict=True)
+            ]
+        except (ValueError, IndexError):
+            items = []
+            for row in padded:
+                try:
+                    items.append(cls.from_row(row))
+                except (ValueError, IndexError):
+                    # パースに失敗した行はスキップ
+                    continue
+            return items
+
+        # _COLUMN_PARSERS はフィールド順なので位置引数で生成できる
+        return [cls(*values) for values in zip(*columns, strict=True)]
 
 
 class GoogleSheetsClient:
@@ -154,6 +227,12 @@ class GoogleSheetsClient:
     # 環境変数のキー
     ENV_SPREADSHEET_ID = "FRGEEK_SPREADSHEET_ID"
 
+    # 商品データの範囲（1-10行目はヘッダー）
+    ITEMS_RANGE = "商品!A11:AF"
+
+    # 取得した商品データを再利用する秒数
+    CACHE_TTL_SECONDS = 60.0
+
     def __init__(self, spreadsheet_id: str | None = None) -> None:
         """クライアントを初期化.
 
@@ -172,36 +251,60 @@ class GoogleSheetsClient:
                 f"Set {self.ENV_SPREADSHEET_ID} environment variable or pass it to constructor."
             )
 
+        # (取得時刻, 全商品データ, 商品ID → 商品データ)
+        self._cache: tuple[float, list[SheetItem], dict[int, SheetItem]] | None = None
+
     def get_all_items(self) -> list[SheetItem]:
         """全商品データを取得.
 
         商品シートの11行目以降のデータを取得する。
         （1-10行目はヘッダー）
+        CACHE_TTL_SECONDS以内の再取得はAPIを呼ばずにキャッシュを返す。
 
         Returns:
             商品データのリスト
         """
-        range_name = "商品!A11:AF"
+        return list(self._cached_items()[0])
 
+    def invalidate_cache(self) -> None:
+        """キャッシュを破棄し、次回の取得でスプレッドシートを読み直す."""
+        self._cache = None
+
+    def _cached_items(self) -> tuple[list[SheetItem], dict[int, SheetItem]]:
+        """キャッシュ済みの全商品データと商品IDの索引を取得（期限切れなら取得し直す）."""
+        cache = self._cache
+        if cache is not None and time.monotonic() - cache[0] < self.CACHE_TTL_SECONDS:
+            return cache[1], cache[2]
+
+        items = self._fetch_all_items()
+        by_id: dict[int, SheetItem] = {}
+        for item in items:
+            by_id.setdefault(item.item_id, item)  # 重複IDは先頭の行を優先
+        self._cache = (time.monotonic(), items, by_id)
+        return items, by_id
+
+    def _fetch_all_items(self) -> list[SheetItem]:
+        """スプレッドシートから全商品データを取得."""
+        # 数値は書式なし（¥やカンマなし）で受け取り、円表記のパースを省く
+        # 日付は書式付きの文字列のまま受け取る
+        # 他のシート・範囲が必要になっても1回の通信で取得できるようbatchGetを使う
         result = (
             self._service.spreadsheets()
             .values()
-            .get(spreadsheetId=self._spreadsheet_id, range=range_name)
+            .batchGet(
+                spreadsheetId=self._spreadsheet_id,
+                ranges=[self.ITEMS_RANGE],
+                valueRenderOption="UNFORMATTED_VALUE",
+                dateTimeRenderOption="FORMATTED_STRING",
+                fields="valueRanges(values)",
+            )
             .execute()
         )
 
-        rows = result.get("values", [])
-        items = []
-
-        for row in rows:
-            if row and row[0]:  # item_id がある行のみ
-                try:
-                    items.append(SheetItem.from_row(row))
-                except (ValueError, IndexError):
-                    # パースに失敗した行はスキップ
-                    continue
-
-        return items
+        value_ranges = result.get("valueRanges", [])
+        rows = value_ranges[0].get("values", []) if value_ranges else []
+        # item_id がある行のみ
+        return SheetItem.from_rows([row for row in rows if row and row[0]])
 
     def get_item_by_id(self, item_id: int) -> SheetItem | None:
         """商品IDで商品データを取得.
@@ -212,12 +315,7 @@ class GoogleSheetsClient:
         Returns:
             商品データ、見つからない場合は None
         """
-        # 全件取得して検索（小規模データを想定）
-        items = self.get_all_items()
-        for item in items:
-            if item.item_id == item_id:
-                return item
-        return None
+        return self._cached_items()[1].get(item_id)
 
     def get_items_by_ids(self, item_ids: list[int]) -> list[SheetItem]:
         """複数の商品IDで商品データを取得.
@@ -229,5 +327,5 @@ class GoogleSheetsClient:
             商品データのリスト（順序は保証されない）
         """
         id_set = set(item_ids)
-        items = self.get_all_items()
+        items = self._cached_items()[0]
         return [item for item in items if item.item_id in id_set]
@@ -0,0 +1,306 @@
+"""LoRAアダプタを使ったテキスト生成の共通処理.
+
+StableLMTextGeneratorとSwallowGeneratorで共通の、モデルのロード・CUDA向けの最適化・
+プロンプトのトークン化・バッチ化・デコード設定をまとめる。
+"""
+
+import importlib.util
+import logging
+from abc import ABC, abstractmethod
+from collections.abc import Callable
+from threading import Lock
+from typing import Any, Literal
+
+import torch
+from transformers import AutoModelForCausalLM, AutoTokenizer, BitsAndBytesConfig
+
+from fr_studio.application.text_generator import GeneratedText, ProductInfo
+
+logger = logging.getLogger(__name__)
+
+# プロンプトテンプレート（商品情報の前後の固定部分）
+TITLE_TEMPLATE = ("以下の商品情報から、商品タイトルを生成してください。\n\n", "\n\n商品タイトル:")
+DESCRIPTION_TEMPLATE = ("以下の商品情報から、商品説明を生成してください。\n\n", "\n\n商品説明:")
+
+Quantization = Literal["none", "int8", "nf4"]
+
+# 静的KVキャッシュ使用時にプロンプト長をそろえる単位（トークン数）。
+# キャッシュとCUDA Graphはプロンプト長ごとに作り直されるため、長さを段階にまとめる
+PROMPT_BUCKET_SIZE = 64
+
+# ロード済みモデルとトークナイザー（ロード条件ごと）。インスタンス間で共有して再ロードを避ける
+_model_cache: dict[tuple[object, ...], tuple[Any, Any]] = {}
+_model_cache_lock = Lock()
+
+
+def quantization_config(quantization: Quantization) -> BitsAndBytesConfig | None:
+    """重みのみ量子化の設定を作成する（bitsandbytesが必要、CUDAのみ）.
+
+    Args:
+        quantization: 量子化方式（"none"なら量子化しない）
+
+    Returns:
+        量子化設定（量子化しない場合はNone）
+    """
+    if quantization == "int8":
+        return BitsAndBytesConfig(load_in_8bit=True)
+    if quantization == "nf4":
+        return BitsAndBytesConfig(
+            load_in_4bit=True,
+            bnb_4bit_quant_type="nf4",
+            bnb_4bit_compute_dtype=torch.float16,
+        )
+    return None
+
+
+def cached_model(
+    key: tuple[object, ...], load: Callable[[], tuple[Any, Any]]
+) -> tuple[Any, Any]:
+    """ロード条件が同じモデルとトークナイザーを共有する.
+
+    PeftModelはベースモデルにLoRA層を直接差し込み、統合時は重みも書き換えるため、
+    ベースモデルではなくアダプタ適用後のモデルをロード条件ごとに共有する。
+
+    Args:
+        key: ロード条件（ベースモデル・アダプタ・デバイス・各種オプション）
+        load: キャッシュにない場合に (モデル, トークナイザー) をロードする関数
+
+    Returns:
+        (モデル, トークナイザー)
+    """
+    with _model_cache_lock:
+        cached = _model_cache.get(key)
+        if cached is None:
+            cached = load()
+            _model_cache[key] = cached
+        return cached
+
+
+def clear_model_cache() -> None:
+    """共有しているロード済みモデルを破棄する."""
+    with _model_cache_lock:
+        _model_cache.clear()
+
+
+def load_tokenizer(model_name: str, **kwargs: Any) -> Any:
+    """トークナイザーをロードする（Rust実装の高速版を優先）.
+
+    日本語テキストはPython実装のSentencePieceだとエンコードが遅いため高速版を使い、
+    高速版に変換できないモデルのみPython実装にフォールバックする。
+
+    Args:
+        model_name: モデル名
+        **kwargs: from_pretrainedに渡す追加の引数
+
+    Returns:
+        トークナイザー
+    """
+    try:
+        return AutoTokenizer.from_pretrained(model_name, use_fast=True, **kwargs)
+    except (ValueError, OSError):
+        return AutoTokenizer.from_pretrained(model_name, use_fast=False, **kwargs)
+
+
+def load_causal_lm(model_name: str, device_type: str, **kwargs: Any) -> Any:
+    """融合カーネルのアテンション実装を指定してモデルをロードする.
+
+    CUDA（Ampere以降）でflash-attnがインストールされていればFlashAttention-2、
+    それ以外はPyTorchのSDPAを使い、eager実装の行列積・softmaxの分割実行を避ける。
+    モデルがFlashAttention-2に対応していない場合はSDPAでロードし直す。
+
+    Args:
+        model_name: モデル名
+        device_type: ロード先のデバイス種別（"cuda"/"mps"/"cpu"）
+        **kwargs: from_pretrainedに渡す追加の引数
+
+    Returns:
+        ロードしたモデル
+    """
+    attn_implementation = "sdpa"
+    if (
+        device_type == "cuda"
+        and importlib.util.find_spec("flash_attn") is not None
+        and torch.cuda.get_device_capability()[0] >= 8
+    ):
+        attn_implementation = "flash_attention_2"
+
+    try:
+        return AutoModelForCausalLM.from_pretrained(
+            model_name, attn_implementation=attn_implementation, **kwargs
+        )
+    except ValueError:
+        # FlashAttention-2に非対応のモデルのみSDPAでロードし直す（それ以外のエラーはそのまま送出）
+        if attn_implementation != "flash_attention_2":
+            raise
+        logger.info("FlashAttention-2 is not supported by %s; using SDPA", model_name)
+        return AutoModelForCausalLM.from_pretrained(
+            model_name, attn_implementation="sdpa", **kwargs
+        )
+
+
+def supports_static_cache(model: Any) -> bool:
+    """モデルのクラスが静的KVキャッシュでのgenerateに対応しているか.
+
+    trust_remote_codeで読み込んだ独自クラスなど、対応を宣言していないモデルに
+    cache_implementation="static"を指定するとgenerateがValueErrorになる。
+
+    Args:
+        model: ロードしたモデル（PeftModelの場合は内部のモデルを調べる）
+
+    Returns:
+        対応していればTrue
+    """
+    if hasattr(model, "get_base_model"):
+        model = model.get_base_model()
+    # transformersのバージョンにより宣言する属性名が異なる
+    return bool(
+        getattr(model, "_can_compile_fullgraph", False)
+        or getattr(model, "_supports_static_cache", False)
+    )
+
+
+class LoRATextGenerator(ABC):
+    """LoRAアダプタを使ったテキスト生成の基底クラス.
+
+    サブクラスは_load_model、_build_input_text、generateを実装する。
+    """
+
+    def __init__(
+        self,
+        max_new_tokens: int,
+        merge_lora: bool,
+        compile_model: bool,
+        quantization: Quantization,
+        deterministic: bool,
+    ) -> None:
+        """初期化.
+
+        Args:
+            max_new_tokens: 生成する最大トークン数
+            merge_lora: LoRAの重みをベースモデルに統合するか
+            compile_model: CUDAでモデルのforwardをtorch.compileするか
+            quantization: CUDAでの重みの量子化方式
+            deterministic: サンプリングせず貪欲法で生成するか
+        """
+        self.max_new_tokens = max_new_tokens
+        self.merge_lora = merge_lora
+        self.compile_model = compile_model
+        self.quantization = quantization
+        self.deterministic = deterministic
+
+        self._model: Any = None
+        self._tokenizer: Any = None
+        self._device: torch.device | str = ""
+        self._pad_token_id: int | None = None
+
+    @abstractmethod
+    def _load_model(self) -> None:
+        """モデル・トークナイザー・デバイス・パディングIDを遅延ロードする."""
+
+    @abstractmethod
+    def _build_input_text(self, product_info: ProductInfo) -> str:
+        """商品情報から入力テキストを構築する."""
+
+    @abstractmethod
+    def generate(self, product_info: ProductInfo) -> GeneratedText:
+        """タイトルと説明を両方生成する."""
+
+    def _optimize_for_cuda(self) -> None:
+        """CUDA向けに静的KVキャッシュとtorch.compileを設定する.
+
+        動的キャッシュはステップごとに形状が変わるためグラフ化できず、
+        トークンごとの多数の小さなカーネル起動がCPU側の律速になる。
+        静的キャッシュにしたうえでforwardをreduce-overheadでコンパイルすると、
+        デコードの1ステップがCUDA Graphの再生になる。
+        コンパイルとグラフのキャプチャは初回生成時に行われるため、warmupで事前に済ませられる。
+        静的キャッシュに対応していないモデルは動的キャッシュのまま使い、コンパイルもしない
+        （形状が毎ステップ変わり、再コンパイルが繰り返されるため）。
+        """
+        assert self._model is not None
+
+        if not supports_static_cache(self._model):
+            logger.info("Static KV cache is not supported by this model; using dynamic cache")
+            return
+
+        self._model.generation_config.cache_implementation = "static"
+        if self.compile_model:
+            # LoRAを統合していない場合（PeftModel）、generateは内部のモデルのgenerateに委譲され
+            # 内部のモデルのforwardが呼ばれるため、そちらをコンパイルする
+            target = (
+                self._model.get_base_model()
+                if hasattr(self._model, "get_base_model")
+                else self._model
+            )
+            target.forward = torch.compile(target.forward, mode="reduce-overhead", fullgraph=False)
+
+    def warmup(self) -> None:
+        """モデルのロードと1回分の生成を事前に行う.
+
+        モデルのロードやtorch.compile・CUDA Graphのキャプチャは初回生成時に行われ、
+        最初のリクエストが大きく遅れるため、起動時にバックグラウンドで呼び出しておく。
+        generateと同じバッチ構成で生成するが、コンパイルされるのは最初の長さの段階
+        （PROMPT_BUCKET_SIZEトークンまで）のみで、それより長いプロンプトは
+        段階ごとに初回の生成時にコンパイルされる。
+        """
+        self.generate(ProductInfo(product_name="ウォームアップ"))
+
+    def _encode_prompt(self, template: tuple[str, str], input_text: str) -> torch.Tensor:
+        """テンプレートと商品情報からプロンプトのトークンIDを作る.
+
+        テンプレートと商品情報を別々にトークン化して連結すると、境界でのトークンの分かれ方
+        （SentencePieceの先頭の"▁"やBPEでの改行の分割）が変わり、LoRAの学習時の入力と
+        一致しなくなるため、プロンプト全体を1つの文字列としてトークン化する。
+
+        Args:
+            template: (商品情報の前の文, 商品情報の後の文)
+            input_text: 商品情報のテキスト
+
+        Returns:
+            プロンプトのトークンID (1, L)
+        """
+        assert self._tokenizer is not None
+        prefix, suffix = template
+        prompt = f"{prefix}{input_text}{suffix}"
+        input_ids = self._tokenizer(prompt, return_tensors="pt").input_ids
+        if torch.device(self._device).type == "cuda":
+            # ページロックしたメモリから非同期に転送し、generateの準備処理と重ねる
+            return input_ids.pin_memory().to(self._device, non_blocking=True)
+        return input_ids.to(self._device)
+
+    def _left_pad(self, prompts: list[torch.Tensor]) -> tuple[torch.Tensor, torch.Tensor]:
+        """長さの異なるプロンプトを左詰めでパディングしてバッチにする.
+
+        生成は末尾に続けて行われるため、パディングは左側に入れる。
+        静的KVキャッシュ使用時は、商品ごとにプロンプト長が変わるたびにキャッシュの
+        再確保と再コンパイルが起きないよう、長さをPROMPT_BUCKET_SIZEの倍数に切り上げる。
+
+        Args:
+            prompts: プロンプトのトークンID (1, L) のリスト
+
+        Returns:
+            (input_ids, attention_mask) それぞれ (N, パディング後の長さ)
+        """
+        assert self._pad_token_id is not None
+        length = max(ids.shape[1] for ids in prompts)
+        if self._model.generation_config.cache_implementation == "static":
+            length = -(-length // PROMPT_BUCKET_SIZE) * PROMPT_BUCKET_SIZE
+        input_ids = torch.full(
+            (len(prompts), length),
+            self._pad_token_id,
+            dtype=prompts[0].dtype,
+            device=prompts[0].device,
+        )
+        attention_mask = torch.zeros_like(input_ids)
+        for row, ids in enumerate(prompts):
+            input_ids[row, length - ids.shape[1] :] = ids[0]
+            attention_mask[row, length - ids.shape[1] :] = 1
+        return input_ids, attention_mask
+
+    def _sampling_options(self) -> dict[str, Any]:
+        """generateに渡すデコード方法の設定を取得する.
+
+        貪欲法では語彙全体のsoftmax・top-pのソート・サンプリングを毎トークン行わずに済む。
+        """
+        if self.deterministic:
+            return {"do_sample": False, "num_beams": 1, "temperature": None, "top_p": None}
+        return {"do_sample": True, "temperature": 0.7, "top_p": 0.9}
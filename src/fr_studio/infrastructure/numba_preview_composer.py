@@ -0,0 +1,217 @@
+"""numbaを使用したプレビュー合成の実装."""
+
+import numpy as np
+import numpy.typing as npt
+from numba import njit, prange
+from PIL import Image, ImageFilter
+
+from fr_studio.application.tone_adjuster import ToneParameters
+from fr_studio.infrastructure.numpy_tone_adjuster import (
+    NumpyToneAdjuster,
+    as_mask_array,
+    kernel_lock,
+    masked_tone_value,
+)
+
+
+def _readonly_zeros(shape: tuple[int, int]) -> npt.NDArray[np.uint8]:
+    """読み取り専用のゼロ配列を作成する.
+
+    PIL画像からnp.asarrayで得た配列と同じ読み取り専用の型にそろえ、
+    numbaが影・マスクの有無ごとに別の型で再コンパイルしないようにする。
+    """
+    array = np.zeros(shape, dtype=np.uint8)
+    array.flags.writeable = False
+    return array
+
+
+_NO_SHADOW = _readonly_zeros((1, 1))
+_NO_MASK = _readonly_zeros((0, 0))
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _compose_kernel(
+    src: npt.NDArray[np.uint8],
+    shadow: npt.NDArray[np.uint8],
+    shadow_opacity: float,
+    shadow_color: npt.NDArray[np.float64],
+    background_color: npt.NDArray[np.float64],
+    mask: npt.NDArray[np.uint8],
+    inside_lut: npt.NDArray[np.uint8],
+    outside_lut: npt.NDArray[np.uint8],
+    product: npt.NDArray[np.float64],
+    whole: npt.NDArray[np.float64],
+    out: npt.NDArray[np.uint8],
+) -> None:
+    """影付き背景への合成とトーン調整を1パスで行う.
+
+    Args:
+        src: 商品画像 (H, W, 4)、アルファで背景を透過
+        shadow: ぼかし済みの影シルエット (H, W)
+        shadow_opacity: 影の不透明度 (0-255、0なら影なし)
+        shadow_color: 影の色 (3,)
+        background_color: 背景色 (3,)
+        mask: 商品トーンのマスク (H, W)、空配列なら全面に商品トーンを適用
+        inside_lut: マスク255用LUT（商品トーン→全体トーンを合成済み）
+        outside_lut: マスク0用LUT（全体トーンのみ）
+        product: 商品領域のトーンパラメータ (contrast, brightness, gamma)
+        whole: 全体のトーンパラメータ (contrast, brightness, gamma)
+        out: 出力RGBA配列 (H, W, 4)
+    """
+    height, width, _ = src.shape
+    has_mask = mask.shape[0] == height
+    for y in prange(height):
+        for x in range(width):
+            alpha = src[y, x, 3] / 255.0
+            shade = shadow[y, x] * shadow_opacity / 65025.0 if shadow_opacity > 0 else 0.0
+            m = mask[y, x] if has_mask else 255
+            for c in range(3):
+                bg = background_color[c] * (1.0 - shade) + shadow_color[c] * shade
+                value = src[y, x, c] * alpha + bg * (1.0 - alpha)
+                value8 = min(255, max(0, int(value + 0.5)))
+                out[y, x, c] = masked_tone_value(
+                    value8, m, inside_lut, outside_lut, product, whole
+                )
+            out[y, x, 3] = 255
+
+
+class NumbaPreviewComposer:
+    """影の追加・背景への合成・トーン調整を1パスで行う.
+
+    PillowShadowAdder + Image.alpha_composite + NumpyToneAdjusterの組み合わせと同等の処理を、
+    フルサイズのRGBA中間画像を作らずに行う。影のぼかしは1チャンネルのみで計算する。
+    """
+
+    def __init__(
+        self,
+        tone_adjuster: NumpyToneAdjuster,
+        offset_ratio: float = 0.03,
+        blur_ratio: float = 0.03,
+        shadow_color: tuple[int, int, int] = (0, 0, 0),
+        background_color: tuple[int, int, int] = (255, 255, 255),
+    ) -> None:
+        """初期化.
+
+        Args:
+            tone_adjuster: LUT作成に使用するトーン調整
+            offset_ratio: 影の縦方向オフセット（画像高さに対する比率）
+            blur_ratio: ガウシアンぼかし半径（画像高さに対する比率）
+            shadow_color: 影の色（RGB）
+            background_color: 背景色（RGB）
+        """
+        self._tone_adjuster = tone_adjuster
+        self.offset_ratio = offset_ratio
+        self.blur_ratio = blur_ratio
+        self.shadow_color = shadow_color
+        self.background_color = background_color
+
+    def compose(
+        self,
+        image: Image.Image,
+        shadow_opacity: int,
+        whole_params: ToneParameters,
+        product_params: ToneParameters | None = None,
+        product_mask: Image.Image | npt.NDArray[np.uint8] | None = None,
+        shadow: npt.NDArray[np.uint8] | None = None,
+    ) -> Image.Image:
+        """影付き背景に合成してトーン調整を適用する.
+
+        引数はcompose_arrayと同じ。
+
+        Returns:
+            合成・トーン調整後の画像（RGBA、不透明）
+        """
+        result = self.compose_array(
+            image, shadow_opacity, whole_params, product_params, product_mask, shadow
+        )
+        height, width = result.shape[:2]
+        return Image.frombuffer("RGBA", (width, height), result, "raw", "RGBA", 0, 1)
+
+    def compose_array(
+        self,
+        image: Image.Image,
+        shadow_opacity: int,
+        whole_params: ToneParameters,
+        product_params: ToneParameters | None = None,
+        product_mask: Image.Image | npt.NDArray[np.uint8] | None = None,
+        shadow: npt.NDArray[np.uint8] | None = None,
+    ) -> npt.NDArray[np.uint8]:
+        """影付き背景に合成してトーン調整を適用し、結果を配列のまま返す.
+
+        表示用に別の形式へ変換する場合に、PIL画像を経由するコピーを避けられる。
+
+        Args:
+            image: 背景除去済みのRGBA画像
+            shadow_opacity: 影の不透明度（0-255、0なら背景色のみ）
+            whole_params: 全体のトーン調整パラメータ
+            product_params: 商品領域のトーン調整パラメータ（Noneなら適用しない）
+            product_mask: 商品領域のマスク（Lモードまたはuint8配列 (H, W)、
+                Noneなら全面に商品トーンを適用）
+            shadow: shadow_silhouetteで作成済みの影（Noneならここで作成）
+
+        Returns:
+            合成・トーン調整後のRGBA配列 (H, W, 4)、アルファは全面255
+        """
+        if image.mode != "RGBA":
+            image = image.convert("RGBA")
+
+        src = np.asarray(image)
+        height, width = src.shape[:2]
+
+        if shadow_opacity <= 0:
+            shadow = _NO_SHADOW
+        elif shadow is None:
+            shadow = self.shadow_silhouette(image)
+
+        if product_params is None:
+            product_params = ToneParameters()
+            product_mask = None
+
+        mask = _NO_MASK if product_mask is None else as_mask_array(product_mask, image.size)
+
+        inside_lut, outside_lut = self._tone_adjuster.build_masked_luts(
+            product_params, whole_params
+        )
+        result = np.empty((height, width, 4), dtype=np.uint8)
+
+        with kernel_lock:
+            _compose_kernel(
+                src,
+                shadow,
+                float(shadow_opacity),
+                np.array(self.shadow_color, dtype=np.float64),
+                np.array(self.background_color, dtype=np.float64),
+                mask,
+                inside_lut,
+                outside_lut,
+                self._tone_adjuster.params_array(product_params),
+                self._tone_adjuster.params_array(whole_params),
+                result,
+            )
+
+        return result
+
+    def shadow_silhouette(self, image: Image.Image) -> npt.NDArray[np.uint8]:
+        """影のシルエット（下方向にオフセットしてぼかしたアルファ）を作成する.
+
+        影の濃さ・トーンに依存しないため、同じ画像ならcomposeに渡して使い回せる。
+
+        Args:
+            image: 背景除去済みのRGBA画像
+
+        Returns:
+            ぼかし済みの影シルエット (H, W)
+        """
+        alpha = image.getchannel("A")
+        height = alpha.height
+        offset_y = int(height * self.offset_ratio)
+        blur_radius = int(height * self.blur_ratio)
+
+        shifted = Image.new("L", alpha.size, 0)
+        shifted.paste(alpha, (0, offset_y))
+        return np.asarray(shifted.filter(ImageFilter.GaussianBlur(radius=blur_radius)))
+
+    def warmup(self) -> None:
+        """JITカーネルを事前にコンパイルする."""
+        image = Image.new("RGBA", (1, 1))
+        self.compose(image, 1, ToneParameters(), ToneParameters(), Image.new("L", (1, 1)))
@@ -5,10 +5,66 @@ from typing import Any
 
 import numpy as np
 import numpy.typing as npt
+from numba import njit, prange
 from PIL import Image
 
+from fr_studio.infrastructure.numpy_tone_adjuster import kernel_lock
 
-@dataclass(frozen=True)
+# _feature_sums_kernelの出力のインデックス
+_COUNT, _LUM_SUM, _LUM_SQ, _DARK, _MID, _BRIGHT, _SAT_SUM, _SAT_SQ = range(8)
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _feature_sums_kernel(src: npt.NDArray[np.uint8]) -> npt.NDArray[np.float64]:
+    """特徴量の計算に必要な画素数・合計・二乗和を1パスで集計する.
+
+    輝度（ITU-R BT.601）: Y = 0.299*R + 0.587*G + 0.114*B
+    彩度: S = (max - min) / max * 255（HSV彩度、max=0なら0）
+
+    Args:
+        src: 入力画像 (H, W, 3) または (H, W, 4)。4チャンネルならアルファ0の画素を除外する
+
+    Returns:
+        [画素数, 輝度の合計, 輝度の二乗和, 暗部(<50)の画素数, 中間部(50〜150)の画素数,
+         明部(>=150)の画素数, 彩度の合計, 彩度の二乗和]
+    """
+    height, width, channels = src.shape
+    has_alpha = channels == 4
+    # 行ごとの部分和を集計してから合計する（並列でも結果が実行ごとに変わらない）
+    rows = np.zeros((height, 8), dtype=np.float64)
+    for y in prange(height):
+        for x in range(width):
+            if has_alpha and src[y, x, 3] == 0:
+                continue
+            r = float(src[y, x, 0])
+            g = float(src[y, x, 1])
+            b = float(src[y, x, 2])
+            lum = 0.299 * r + 0.587 * g + 0.114 * b
+            max_val = max(r, g, b)
+            sat = (max_val - min(r, g, b)) / max_val * 255.0 if max_val > 0 else 0.0
+
+            rows[y, 0] += 1.0
+            rows[y, 1] += lum
+            rows[y, 2] += lum * lum
+            if lum < 50.0:
+                rows[y, 3] += 1.0
+            elif lum < 150.0:
+                rows[y, 4] += 1.0
+            else:
+                rows[y, 5] += 1.0
+            rows[y, 6] += sat
+            rows[y, 7] += sat * sat
+    return rows.sum(axis=0)
+
+
+def _mean_std(total: float, square_total: float, count: float) -> tuple[float, float]:
+    """合計と二乗和から平均と標準偏差（母標準偏差、np.stdと同じ）を計算する."""
+    mean = total / count
+    variance = max(square_total / count - mean * mean, 0.0)
+    return mean, variance**0.5
+
+
+@dataclass(frozen=True, slots=True)
 class ImageFeatures:
     """画像特徴量.
 
@@ -44,7 +100,10 @@ class ImageFeatures:
 
 
 class NumpyFeatureExtractor:
-    """NumPyを使用した画像特徴量抽出."""
+    """NumPyを使用した画像特徴量抽出.
+
+    輝度・彩度の画素ごとの配列は作らず、numbaカーネルで必要な集計値を1パスで計算する。
+    """
 
     def extract(self, image: Image.Image) -> ImageFeatures:
         """画像から特徴量を抽出する.
@@ -55,21 +114,16 @@ class NumpyFeatureExtractor:
         Returns:
             抽出された特徴量
         """
-        if image.mode == "RGBA":
-            rgb = np.array(image)[:, :, :3]
-            alpha = np.array(image)[:, :, 3]
-            mask = alpha > 0
-        else:
-            rgb = np.array(image.convert("RGB"))
-            mask = np.ones(rgb.shape[:2], dtype=bool)
-
-        luminance = self._calculate_luminance(rgb)
-        saturation = self._calculate_saturation(rgb)
+        # RGBA・RGB画像はconvertでコピーせずにそのまま配列化する
+        if image.mode not in ("RGBA", "RGB"):
+            image = image.convert("RGB")
+        src = np.asarray(image)
 
-        masked_luminance = luminance[mask]
-        masked_saturation = saturation[mask]
+        with kernel_lock:
+            sums = _feature_sums_kernel(src)
 
-        if len(masked_luminance) == 0:
+        total_pixels = sums[_COUNT]
+        if total_pixels == 0:
             return ImageFeatures(
                 luminance_mean=0.0,
                 luminance_std=0.0,
@@ -80,49 +134,19 @@ class NumpyFeatureExtractor:
                 saturation_std=0.0,
             )
 
-        total_pixels = len(masked_luminance)
-        dark_count = np.sum(masked_luminance < 50)
-        mid_count = np.sum((masked_luminance >= 50) & (masked_luminance < 150))
-        bright_count = np.sum(masked_luminance >= 150)
-
-        return ImageFeatures(
-            luminance_mean=float(np.mean(masked_luminance)),
-            luminance_std=float(np.std(masked_luminance)),
-            dark_ratio=float(dark_count / total_pixels),
-            mid_ratio=float(mid_count / total_pixels),
-            bright_ratio=float(bright_count / total_pixels),
-            saturation_mean=float(np.mean(masked_saturation)),
-            saturation_std=float(np.std(masked_saturation)),
+        luminance_mean, luminance_std = _mean_std(
+            sums[_LUM_SUM], sums[_LUM_SQ], total_pixels
         )
-
-    def _calculate_luminance(
-        self, rgb: npt.NDArray[np.uint8]
-    ) -> npt.NDArray[np.floating[Any]]:
-        """輝度を計算する（ITU-R BT.601）.
-
-        Y = 0.299*R + 0.587*G + 0.114*B
-        """
-        result: npt.NDArray[np.floating[Any]] = (
-            0.299 * rgb[:, :, 0] + 0.587 * rgb[:, :, 1] + 0.114 * rgb[:, :, 2]
+        saturation_mean, saturation_std = _mean_std(
+            sums[_SAT_SUM], sums[_SAT_SQ], total_pixels
         )
-        return result
 
-    def _calculate_saturation(
-        self, rgb: npt.NDArray[np.uint8]
-    ) -> npt.NDArray[np.floating[Any]]:
-        """彩度を計算する.
-
-        S = (max - min) / max（HSV彩度）
-        """
-        rgb_float = rgb.astype(np.float32)
-        max_val = np.max(rgb_float, axis=2)
-        min_val = np.min(rgb_float, axis=2)
-
-        saturation = np.zeros_like(max_val)
-        nonzero_mask = max_val > 0
-        saturation[nonzero_mask] = (
-            (max_val[nonzero_mask] - min_val[nonzero_mask]) / max_val[nonzero_mask]
+        return ImageFeatures(
+            luminance_mean=float(luminance_mean),
+            luminance_std=float(luminance_std),
+            dark_ratio=float(sums[_DARK] / total_pixels),
+            mid_ratio=float(sums[_MID] / total_pixels),
+            bright_ratio=float(sums[_BRIGHT] / total_pixels),
+            saturation_mean=float(saturation_mean),
+            saturation_std=float(saturation_std),
         )
-
-        result: npt.NDArray[np.floating[Any]] = saturation * 255
-        return result
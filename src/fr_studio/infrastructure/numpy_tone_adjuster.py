@@ -1,18 +1,135 @@
 """NumPyを使用したトーン調整の実装."""
 
+from functools import lru_cache
+from threading import Lock
 from typing import Any
 
 import numpy as np
 import numpy.typing as npt
+from numba import njit, prange
 from PIL import Image
 
 from fr_studio.application.tone_adjuster import ToneParameters
 
+# numbaの並列カーネルはスレッドレイヤーによって同時呼び出しできないため、
+# このモジュールのカーネルを使う処理はすべてこのロックで直列化する
+kernel_lock = Lock()
+
+# LUTをキャッシュするパラメータの組み合わせ数（スライダー操作で前後の値を行き来する分）
+LUT_CACHE_SIZE = 256
+
+
+def as_mask_array(
+    mask: Image.Image | npt.NDArray[np.uint8], size: tuple[int, int]
+) -> npt.NDArray[np.uint8]:
+    """マスクをカーネルに渡すuint8配列 (H, W) に変換する.
+
+    配列で渡された場合はサイズが一致すればそのまま返すため、
+    同じマスクを繰り返し使う呼び出し側は事前に変換しておくと毎回の変換を省ける。
+
+    Args:
+        mask: マスク（Lモード画像またはuint8配列 (H, W)）
+        size: 対象画像のサイズ (width, height)
+
+    Returns:
+        マスク配列 (H, W)
+    """
+    if isinstance(mask, np.ndarray):
+        if mask.shape == (size[1], size[0]):
+            return mask
+        mask = Image.fromarray(mask)
+    if mask.mode != "L":
+        mask = mask.convert("L")
+    if mask.size != size:
+        mask = mask.resize(size, Image.Resampling.LANCZOS)
+    return np.asarray(mask)
+
+
+@njit(inline="always")
+def tone_value(value: float, contrast: float, brightness: float, gamma: float) -> float:
+    """トーン式 y = ((x * c + b) / 255)^γ * 255 を1値に適用する."""
+    normalized = (value * contrast + brightness) / 255.0
+    if normalized < 0.0:
+        normalized = 0.0
+    elif normalized > 1.0:
+        normalized = 1.0
+    if gamma != 1.0:
+        normalized = normalized**gamma
+    return normalized * 255.0
+
+
+@njit(inline="always")
+def masked_tone_value(
+    value: int,
+    mask: int,
+    inside_lut: npt.NDArray[np.uint8],
+    outside_lut: npt.NDArray[np.uint8],
+    product: npt.NDArray[np.float64],
+    whole: npt.NDArray[np.float64],
+) -> np.uint8:
+    """マスク領域トーン・合成・全体トーンを1値に適用する.
+
+    マスクが0/255の場合はLUT参照のみで処理し、境界（中間値）だけ浮動小数で計算する。
+
+    Args:
+        value: 入力値 (0-255)
+        mask: マスク値 (0-255)、255=商品トーンを全適用
+        inside_lut: マスク255用LUT（商品トーン→全体トーンを合成済み）
+        outside_lut: マスク0用LUT（全体トーンのみ）
+        product: 商品領域のトーンパラメータ (contrast, brightness, gamma)
+        whole: 全体のトーンパラメータ (contrast, brightness, gamma)
+
+    Returns:
+        調整後の値
+    """
+    if mask == 0:
+        return outside_lut[value]
+    if mask == 255:
+        return inside_lut[value]
+    weight = mask / 255.0
+    adjusted = tone_value(float(value), product[0], product[1], product[2])
+    blended = value + (adjusted - value) * weight
+    return np.uint8(tone_value(blended, whole[0], whole[1], whole[2]))
+
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _masked_tone_kernel(
+    src: npt.NDArray[np.uint8],
+    mask: npt.NDArray[np.uint8],
+    inside_lut: npt.NDArray[np.uint8],
+    outside_lut: npt.NDArray[np.uint8],
+    product: npt.NDArray[np.float64],
+    whole: npt.NDArray[np.float64],
+    out: npt.NDArray[np.uint8],
+) -> None:
+    """マスク領域トーン・合成・全体トーンを1パスで適用する.
+
+    Args:
+        src: 入力RGBA配列 (H, W, 4)
+        mask: 商品マスク (H, W)、255=商品トーンを全適用
+        inside_lut: マスク255の画素用LUT（商品トーン→全体トーンを合成済み）
+        outside_lut: マスク0の画素用LUT（全体トーンのみ）
+        product: 商品領域のトーンパラメータ (contrast, brightness, gamma)
+        whole: 全体のトーンパラメータ (contrast, brightness, gamma)
+        out: 出力RGBA配列 (H, W, 4)
+    """
+    height, width, _ = src.shape
+    for y in prange(height):
+        for x in range(width):
+            m = mask[y, x]
+            for c in range(3):
+                out[y, x, c] = masked_tone_value(
+                    src[y, x, c], m, inside_lut, outside_lut, product, whole
+                )
+            out[y, x, 3] = src[y, x, 3]
+
 
 class NumpyToneAdjuster:
     """NumPyを使用したトーン調整.
 
     トーン式: y = ((x * c + b) / 255)^γ * 255
+
+    トーン式は入力値0-255の1次元関数なので、256要素のuint8 LUTを作って参照で適用する。
     """
 
     def adjust(self, image: Image.Image, params: ToneParameters) -> Image.Image:
@@ -28,36 +145,151 @@ class NumpyToneAdjuster:
         if image.mode != "RGBA":
             image = image.convert("RGBA")
 
-        arr = np.array(image, dtype=np.float32)
-
-        rgb = arr[:, :, :3]
-        alpha = arr[:, :, 3:4]
+        # PILのarray interface経由で読み取り専用ビューを取得（コピーなし）
+        src = np.asarray(image)
+        height, width = src.shape[:2]
 
-        adjusted = self._apply_tone_curve(rgb, params)
+        # 出力バッファに直接書き込み、アルファは元の値をそのままコピー
+        lut = self._build_lut(params)
+        result = np.empty((height, width, 4), dtype=np.uint8)
+        np.take(lut, src[:, :, :3], out=result[:, :, :3])
+        result[:, :, 3] = src[:, :, 3]
 
-        result = np.concatenate([adjusted, alpha], axis=2)
-        result = np.clip(result, 0, 255).astype(np.uint8)
-
-        return Image.fromarray(result, mode="RGBA")
+        return Image.frombuffer("RGBA", (width, height), result, "raw", "RGBA", 0, 1)
 
+    @staticmethod
     def _apply_tone_curve(
-        self, rgb: npt.NDArray[np.floating[Any]], params: ToneParameters
+        rgb: npt.NDArray[np.floating[Any]], params: ToneParameters
     ) -> npt.NDArray[np.floating[Any]]:
-        """トーン式を適用する.
+        """トーン式を適用する（in-placeで書き換える）.
 
         y = ((x * c + b) / 255)^γ * 255
 
         Args:
-            rgb: RGB配列 (H, W, 3)
+            rgb: 入力値の配列（RGB配列 (H, W, 3) またはLUT用の0-255配列）
+            params: トーン調整パラメータ
+
+        Returns:
+            調整後のRGB配列（引数と同じ配列）
+        """
+        np.multiply(rgb, params.contrast, out=rgb)
+        np.add(rgb, params.brightness, out=rgb)
+        np.divide(rgb, 255.0, out=rgb)
+        np.clip(rgb, 0, 1, out=rgb)
+
+        if params.gamma != 1.0:
+            np.power(rgb, params.gamma, out=rgb)
+
+        np.multiply(rgb, 255.0, out=rgb)
+        return rgb
+
+    def _build_lut(self, params: ToneParameters) -> npt.NDArray[np.uint8]:
+        """トーン式を0-255の全入力値に適用したLUTを取得する.
+
+        同じパラメータのLUTは1回だけ作成して使い回す。
+
+        Args:
             params: トーン調整パラメータ
 
         Returns:
-            調整後のRGB配列
+            256要素のuint8配列（読み取り専用）
+        """
+        return _tone_lut(params)
+
+    def build_masked_luts(
+        self, product_params: ToneParameters, whole_params: ToneParameters
+    ) -> tuple[npt.NDArray[np.uint8], npt.NDArray[np.uint8]]:
+        """masked_tone_value用のLUTを作成する.
+
+        Args:
+            product_params: マスク領域のトーン調整パラメータ
+            whole_params: 全体のトーン調整パラメータ
+
+        Returns:
+            (マスク255用LUT, マスク0用LUT)
         """
-        normalized = (rgb * params.contrast + params.brightness) / 255.0
-        normalized = np.clip(normalized, 0, 1)
+        # スライダー値ごとに1回だけLUTを作り、商品領域用は全体トーンと合成しておく
+        return _masked_luts(product_params, whole_params)
+
+    def adjust_masked(
+        self,
+        image: Image.Image,
+        mask: Image.Image | npt.NDArray[np.uint8],
+        product_params: ToneParameters,
+        whole_params: ToneParameters,
+    ) -> Image.Image:
+        """マスク領域のトーン調整と全体のトーン調整をまとめて適用する.
+
+        adjustでマスク領域を調整してcompositeし、さらに全体をadjustするのと同等の処理を
+        中間画像を作らずに1パスで行う。
+
+        Args:
+            image: 入力画像（RGBA）
+            mask: 商品マスク（Lモードまたはuint8配列 (H, W)、白=商品）
+            product_params: マスク領域のトーン調整パラメータ
+            whole_params: 全体のトーン調整パラメータ
+
+        Returns:
+            トーン調整後のRGBA画像
+        """
+        if image.mode != "RGBA":
+            image = image.convert("RGBA")
+
+        src = np.asarray(image)
+        height, width = src.shape[:2]
+        result = np.empty((height, width, 4), dtype=np.uint8)
+
+        inside_lut, outside_lut = self.build_masked_luts(product_params, whole_params)
+
+        with kernel_lock:
+            _masked_tone_kernel(
+                src,
+                as_mask_array(mask, image.size),
+                inside_lut,
+                outside_lut,
+                self.params_array(product_params),
+                self.params_array(whole_params),
+                result,
+            )
+
+        return Image.frombuffer("RGBA", (width, height), result, "raw", "RGBA", 0, 1)
+
+    def warmup(self) -> None:
+        """JITカーネルを事前にコンパイルする.
+
+        初回のスライダー操作でコンパイル待ちが発生しないよう、画面初期化時に呼ぶ。
+        """
+        image = Image.new("RGBA", (1, 1))
+        mask = Image.new("L", (1, 1))
+        self.adjust_masked(image, mask, ToneParameters(), ToneParameters())
+
+    @staticmethod
+    def params_array(params: ToneParameters) -> npt.NDArray[np.float64]:
+        """カーネルに渡すため (contrast, brightness, gamma) の配列に変換する."""
+        return np.array([params.contrast, params.brightness, params.gamma], dtype=np.float64)
+
+
+@lru_cache(maxsize=LUT_CACHE_SIZE)
+def _tone_lut(params: ToneParameters) -> npt.NDArray[np.uint8]:
+    """トーン式のLUTを作成する（パラメータごとにキャッシュ）.
+
+    キャッシュを共有するため読み取り専用にする。numbaカーネルに渡すLUTの型も
+    常に読み取り専用にそろい、再コンパイルは発生しない。
+    """
+    values = np.arange(256, dtype=np.float32)
+    NumpyToneAdjuster._apply_tone_curve(values, params)
+    np.clip(values, 0, 255, out=values)
+    lut = values.astype(np.uint8)
+    lut.flags.writeable = False
+    return lut
 
-        gamma_corrected = np.power(normalized, params.gamma)
 
-        result: npt.NDArray[np.floating[Any]] = gamma_corrected * 255.0
-        return result
+@lru_cache(maxsize=LUT_CACHE_SIZE)
+def _masked_luts(
+    product_params: ToneParameters, whole_params: ToneParameters
+) -> tuple[npt.NDArray[np.uint8], npt.NDArray[np.uint8]]:
+    """masked_tone_value用の (マスク255用LUT, マスク0用LUT) を作成する（キャッシュ付き）."""
+    outside_lut = _tone_lut(whole_params)
+    inside_lut = outside_lut[_tone_lut(product_params)]
+    inside_lut.flags.writeable = False
+    return inside_lut, outside_lut
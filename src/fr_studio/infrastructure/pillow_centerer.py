@@ -2,6 +2,9 @@
 
 from PIL import Image
 
+# resizeの前段で整数倍縮小を行う閾値（3以上ならLANCZOSのみの結果とほぼ区別できない）
+RESIZE_REDUCING_GAP = 3.0
+
 
 class PillowCenterer:
     """Pillowを使用した画像中央配置.
@@ -21,6 +24,7 @@ class PillowCenterer:
         translate_y: float = 0.0,
         auto_center: bool = True,
         zoom_multiplier: float = 1.0,
+        resample: Image.Resampling = Image.Resampling.LANCZOS,
     ) -> Image.Image:
         """画像を中央配置する.
 
@@ -34,6 +38,7 @@ class PillowCenterer:
             translate_y: Y方向移動量（ピクセル、プラスで下）
             auto_center: Trueなら中央配置、Falseなら元位置を基準に配置
             zoom_multiplier: auto-scaleに対する倍率（1.0=変化なし）
+            resample: 被写体のリサンプリング方法（プレビューなど速度優先ならBILINEAR）
 
         Returns:
             指定サイズのキャンバスに配置されたRGBA画像
@@ -63,7 +68,10 @@ class PillowCenterer:
 
         new_width = int(content_width * scale)
         new_height = int(content_height * scale)
-        scaled_content = content.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        # 大きく縮小する場合は整数倍の縮小（reduce）を先に行い、フィルタの計算量を抑える
+        scaled_content = content.resize(
+            (new_width, new_height), resample, reducing_gap=RESIZE_REDUCING_GAP
+        )
 
         # ベース位置計算
         if auto_center:
@@ -93,6 +101,6 @@ class PillowCenterer:
         Returns:
             (left, upper, right, lower) のタプル、または内容がない場合はNone
         """
-        alpha = image.getchannel("A")
-        bbox: tuple[int, int, int, int] | None = alpha.getbbox()
+        # RGBAのgetbboxはアルファのみで判定するため、アルファを別画像に取り出す必要はない
+        bbox: tuple[int, int, int, int] | None = image.getbbox()
         return bbox
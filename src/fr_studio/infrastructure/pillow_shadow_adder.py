@@ -1,5 +1,7 @@
 """Pillowを使用した床影追加の実装."""
 
+import numpy as np
+import numpy.typing as npt
 from PIL import Image, ImageFilter
 
 
@@ -41,39 +43,15 @@ class PillowShadowAdder:
         if image.mode != "RGBA":
             image = image.convert("RGBA")
 
-        width, height = image.size
+        src = np.asarray(image)
+        background = self._shadow_background(image.getchannel("A"), self.shadow_opacity)
 
-        # パラメータ計算
-        offset_y = int(height * self.offset_ratio)
-        blur_radius = int(height * self.blur_ratio)
-
-        # 1. アルファチャンネルからシルエットマスクを取得
-        alpha = image.split()[3]
-
-        # 2. 影用レイヤーを作成（黒で塗りつぶし）
-        shadow = Image.new("RGBA", image.size, (0, 0, 0, 0))
-        shadow_fill = Image.new(
-            "RGBA",
-            image.size,
-            (*self.shadow_color, self.shadow_opacity),
-        )
-        shadow.paste(shadow_fill, mask=alpha)
-
-        # 3. 影を下方向にオフセット
-        shadow_offset = Image.new("RGBA", image.size, (0, 0, 0, 0))
-        shadow_offset.paste(shadow, (0, offset_y))
-
-        # 4. ガウシアンぼかしを適用
-        shadow_blurred = shadow_offset.filter(
-            ImageFilter.GaussianBlur(radius=blur_radius)
-        )
-
-        # 5. 合成: 白背景 → 影 → 商品
-        result = Image.new("RGBA", image.size, (*self.background_color, 255))
-        result = Image.alpha_composite(result, shadow_blurred)
-        result = Image.alpha_composite(result, image)
+        # 影付き背景に商品をアルファで合成（背景は不透明なので結果も不透明）
+        alpha = src[:, :, 3:4].astype(np.float32)
+        alpha *= 1.0 / 255.0
+        background += (src[:, :, :3] - background) * alpha
 
-        return result
+        return _to_opaque_image(background)
 
     def generate_shadow(
         self,
@@ -101,32 +79,48 @@ class PillowShadowAdder:
         if mask.size != size:
             mask = mask.resize(size, Image.Resampling.LANCZOS)
 
-        width, height = size
+        return _to_opaque_image(self._shadow_background(mask, opacity))
 
-        # パラメータ計算
+    def _shadow_background(
+        self, silhouette: Image.Image, opacity: int
+    ) -> npt.NDArray[np.float32]:
+        """影付き背景のRGBを計算する.
+
+        影レイヤー（RGBA）を作って背景にalpha_compositeする代わりに、
+        シルエットを1チャンネルのままオフセット・ぼかしして影の濃さとして使う。
+
+        Args:
+            silhouette: 影の元になるシルエット（Lモード、白=商品）
+            opacity: 影の不透明度（0-255）
+
+        Returns:
+            影付き背景のRGB配列 (H, W, 3)、値は0-255
+        """
+        height = silhouette.height
         offset_y = int(height * self.offset_ratio)
         blur_radius = int(height * self.blur_ratio)
 
-        # 1. 影用レイヤーを作成
-        shadow = Image.new("RGBA", size, (0, 0, 0, 0))
-        shadow_fill = Image.new(
-            "RGBA",
-            size,
-            (*self.shadow_color, opacity),
-        )
-        shadow.paste(shadow_fill, mask=mask)
-
-        # 2. 影を下方向にオフセット
-        shadow_offset = Image.new("RGBA", size, (0, 0, 0, 0))
-        shadow_offset.paste(shadow, (0, offset_y))
-
-        # 3. ガウシアンぼかしを適用
-        shadow_blurred = shadow_offset.filter(
-            ImageFilter.GaussianBlur(radius=blur_radius)
-        )
-
-        # 4. 白背景に影を合成
-        result = Image.new("RGBA", size, (*self.background_color, 255))
-        result = Image.alpha_composite(result, shadow_blurred)
-
-        return result
+        # 1. シルエットを下方向にオフセット
+        shifted = Image.new("L", silhouette.size, 0)
+        shifted.paste(silhouette, (0, offset_y))
+
+        # 2. ガウシアンぼかしを適用（1チャンネルのみ）
+        blurred = shifted.filter(ImageFilter.GaussianBlur(radius=blur_radius))
+
+        # 3. 影の濃さで背景色と影の色を混ぜる
+        shade = np.asarray(blurred, dtype=np.float32)[:, :, np.newaxis]
+        shade *= opacity / 65025.0
+        background_color = np.array(self.background_color, dtype=np.float32)
+        shadow_color = np.array(self.shadow_color, dtype=np.float32)
+        return background_color + (shadow_color - background_color) * shade
+
+
+def _to_opaque_image(rgb: npt.NDArray[np.float32]) -> Image.Image:
+    """0-255のRGB配列を不透明なRGBA画像に変換する."""
+    height, width = rgb.shape[:2]
+    result = np.empty((height, width, 4), dtype=np.uint8)
+    np.add(rgb, 0.5, out=rgb)
+    np.clip(rgb, 0, 255, out=rgb)
+    result[:, :, :3] = rgb
+    result[:, :, 3] = 255
+    return Image.frombuffer("RGBA", (width, height), result, "raw", "RGBA", 0, 1)
@@ -1,6 +1,7 @@
 """ピクセル分析による背景分類の実装."""
 
-import colorsys
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from PIL import Image
@@ -11,6 +12,14 @@ from fr_studio.application.background_classifier import (
 )
 
 
+def _u8_threshold(threshold: float) -> int:
+    """0〜1の閾値を、uint8の値で同じ判定になる整数に変換する.
+
+    value / 255 >= threshold と value >= 戻り値 が、全てのuint8値で一致する。
+    """
+    return int(np.searchsorted(np.arange(256) / 255.0, threshold))
+
+
 class PixelBackgroundClassifier:
     """HSV色空間でのピクセル分析による背景分類.
 
@@ -46,13 +55,15 @@ class PixelBackgroundClassifier:
         Returns:
             分類結果
         """
-        image = image.convert("RGB")
-        arr = np.asarray(image) / 255.0  # 0〜1に正規化
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        # 画像全体はuint8のまま扱い、float64への変換でメモリ転送量を増やさない
+        arr = np.asarray(image)
 
         # 暗いピクセル（商品）を除外するマスク
         brightness = arr.max(axis=2)
-        fg_mask = brightness < self.foreground_brightness_threshold
-        bg_pixels = arr[~fg_mask]
+        bg_mask = brightness >= _u8_threshold(self.foreground_brightness_threshold)
+        bg_pixels = arr[bg_mask]
 
         if bg_pixels.size == 0:
             # 判定不能な場合はnon_white_bg扱い
@@ -62,15 +73,15 @@ class PixelBackgroundClassifier:
                 raw_output="no_background_pixels",
             )
 
-        # RGB -> HSV変換
-        rgb = bg_pixels.reshape(-1, 3)
-        hsv = np.array([colorsys.rgb_to_hsv(*px) for px in rgb])
-        s = hsv[:, 1]  # 彩度
-        v = hsv[:, 2]  # 明度
+        # RGB -> HSVの彩度・明度（colorsys.rgb_to_hsvと同じ定義）
+        # 明度はuint8のまま比較し、彩度のみ背景ピクセル分をfloat32で計算する
+        v = brightness[bg_mask]  # 明度
+        min_val = bg_pixels.min(axis=1)
+        s = (v - min_val).astype(np.float32) / np.maximum(v, 1)  # 彩度（v=0なら0）
 
         # 白とみなすピクセル: 高明度 かつ 低彩度
-        white_pixels = (v >= self.min_brightness) & (s <= self.max_saturation)
-        white_ratio = white_pixels.mean()
+        white_pixels = (v >= _u8_threshold(self.min_brightness)) & (s <= self.max_saturation)
+        white_ratio = float(white_pixels.mean())
 
         is_white = white_ratio >= self.white_ratio_threshold
         background_type = (
@@ -82,3 +93,21 @@ class PixelBackgroundClassifier:
             confidence=white_ratio,
             raw_output=f"white_ratio={white_ratio:.3f}",
         )
+
+    def classify_many(self, images: list[Image.Image]) -> list[BackgroundClassification]:
+        """複数画像の背景をまとめて分類する.
+
+        NumPyの演算中はGILが解放されるため、スレッドで並列に分類する。
+
+        Args:
+            images: 入力画像のリスト（RGB or RGBA）
+
+        Returns:
+            入力と同じ順の分類結果のリスト
+        """
+        if len(images) <= 1:
+            return [self.classify(image) for image in images]
+
+        workers = min(len(images), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.classify, images))
@@ -1,13 +1,25 @@
 """StableLM + LoRAを使用したテキスト生成の実装."""
 
+import logging
 import time
 from pathlib import Path
 
 import torch
 from peft import PeftModel
-from transformers import AutoModelForCausalLM, AutoTokenizer
 
 from fr_studio.application.text_generator import GeneratedText, ProductInfo
+from fr_studio.infrastructure.lora_text_generator import (
+    DESCRIPTION_TEMPLATE,
+    TITLE_TEMPLATE,
+    LoRATextGenerator,
+    Quantization,
+    cached_model,
+    load_causal_lm,
+    load_tokenizer,
+    quantization_config,
+)
+
+logger = logging.getLogger(__name__)
 
 
 # 日本語ラベル（prepare_text_data.pyと同じ）
@@ -30,7 +42,7 @@ COLUMN_LABELS = {
 }
 
 
-class StableLMTextGenerator:
+class StableLMTextGenerator(LoRATextGenerator):
     """StableLM + LoRAを使用したテキスト生成.
 
     学習済みLoRAアダプタを使用して商品タイトル・説明を生成する。
@@ -42,19 +54,23 @@ class StableLMTextGenerator:
         self,
         lora_path: str | Path = "models/stablelm_lora",
         max_new_tokens: int = 100,
+        merge_lora: bool = True,
+        compile_model: bool = True,
+        quantization: Quantization = "none",
+        deterministic: bool = False,
     ) -> None:
         """初期化.
 
         Args:
             lora_path: LoRAアダプタのパス
             max_new_tokens: 生成する最大トークン数
+            merge_lora: LoRAの重みをベースモデルに統合するか（推論時の追加の行列積をなくす）
+            compile_model: CUDAでモデルのforwardをtorch.compileするか
+            quantization: CUDAでの重みの量子化方式（"int8"/"nf4"、LoRAの統合とは併用しない）
+            deterministic: サンプリングせず貪欲法で生成するか（同じ入力なら同じ出力になる）
         """
+        super().__init__(max_new_tokens, merge_lora, compile_model, quantization, deterministic)
         self.lora_path = Path(lora_path)
-        self.max_new_tokens = max_new_tokens
-
-        self._model = None
-        self._tokenizer = None
-        self._device = ""
 
     def _load_model(self) -> None:
         """モデルを遅延ロードする."""
@@ -72,80 +88,95 @@ class StableLMTextGenerator:
             self._device = "cpu"
             torch_dtype = torch.float32
 
-        print(f"Loading base model: {self.BASE_MODEL}")
-        print(f"Device: {self._device}")
-
-        self._tokenizer = AutoTokenizer.from_pretrained(
-            self.BASE_MODEL, trust_remote_code=True
+        key = (
+            self.BASE_MODEL,
+            str(self.lora_path.resolve()),
+            self._device,
+            self.merge_lora,
+            self.compile_model,
+            self.quantization,
+        )
+        self._model, self._tokenizer = cached_model(
+            key, lambda: self._load_pretrained(torch_dtype)
         )
+        self._pad_token_id = self._tokenizer.eos_token_id
 
-        base_model = AutoModelForCausalLM.from_pretrained(
+    def _load_pretrained(self, torch_dtype: torch.dtype) -> tuple[PeftModel, object]:
+        """ベースモデルとLoRAアダプタをロードする.
+
+        Args:
+            torch_dtype: モデルの重みのデータ型
+
+        Returns:
+            (モデル, トークナイザー)
+        """
+        logger.info("Loading base model: %s (device: %s)", self.BASE_MODEL, self._device)
+
+        tokenizer = load_tokenizer(self.BASE_MODEL, trust_remote_code=True)
+
+        quantization = quantization_config(self.quantization) if self._device == "cuda" else None
+        base_model = load_causal_lm(
             self.BASE_MODEL,
+            self._device,
             torch_dtype=torch_dtype,
             trust_remote_code=True,
+            quantization_config=quantization,
+            # 量子化した重みはbitsandbytesが配置するため、ロード時にデバイスを指定する
+            device_map=self._device if quantization is not None else None,
         )
 
-        print(f"Loading LoRA adapter: {self.lora_path}")
+        logger.info("Loading LoRA adapter: %s", self.lora_path)
         self._model = PeftModel.from_pretrained(base_model, str(self.lora_path))
-        self._model.to(self._device)
+        if quantization is None:
+            if self.merge_lora:
+                # 推論専用でアダプタを切り替えないため、A·Bをベースの重みに統合しておく
+                self._model = self._model.merge_and_unload()
+            self._model.to(self._device)
         self._model.eval()
 
+        if self._device == "cuda":
+            self._optimize_for_cuda()
+
+        return self._model, tokenizer
+
     def _build_input_text(self, product_info: ProductInfo) -> str:
         """商品情報から入力テキストを構築する."""
-        lines = []
-        fields = [
-            ("product_name", product_info.product_name),
-            ("price", product_info.price),
-            ("shoulder_width", product_info.shoulder_width),
-            ("sleeve_length", product_info.sleeve_length),
-            ("chest_width", product_info.chest_width),
-            ("body_length", product_info.body_length),
-            ("waist", product_info.waist),
-            ("rise", product_info.rise),
-            ("inseam", product_info.inseam),
-            ("thigh_width", product_info.thigh_width),
-            ("hem_width", product_info.hem_width),
-            ("total_length", product_info.total_length),
-            ("hat_height", product_info.hat_height),
-            ("hat_circumference", product_info.hat_circumference),
-            ("brim", product_info.brim),
-        ]
-
-        for key, value in fields:
-            if value:
-                label = COLUMN_LABELS.get(key, key)
-                lines.append(f"{label}: {value}")
-
-        return "\n".join(lines)
-
-    def _generate(self, prompt: str, max_new_tokens: int | None = None) -> str:
-        """プロンプトからテキストを生成する."""
-        self._load_model()
+        values = ((label, getattr(product_info, key)) for key, label in COLUMN_LABELS.items())
+        return "\n".join(f"{label}: {value}" for label, value in values if value)
+
+    def _generate(
+        self, prompts: list[torch.Tensor], max_new_tokens: int | None = None
+    ) -> list[str]:
+        """プロンプトのトークンIDからテキストを生成する.
+
+        複数のプロンプトは1回のgenerateでバッチとして生成する。
+        """
         assert self._model is not None
         assert self._tokenizer is not None
 
         tokens = max_new_tokens if max_new_tokens is not None else self.max_new_tokens
-        inputs = self._tokenizer(prompt, return_tensors="pt").to(self._device)
+        input_ids, attention_mask = self._left_pad(prompts)
 
-        start_time = time.time()
-        with torch.no_grad():
+        # 計測は生成ごとの時刻取得・出力を避けるため、DEBUGログが有効な場合のみ行う
+        timed = logger.isEnabledFor(logging.DEBUG)
+        start_time = time.perf_counter() if timed else 0.0
+        with torch.inference_mode():
             outputs = self._model.generate(
-                **inputs,
+                input_ids=input_ids,
+                attention_mask=attention_mask,
                 max_new_tokens=tokens,
-                do_sample=True,
-                temperature=0.7,
-                top_p=0.9,
-                pad_token_id=self._tokenizer.eos_token_id,
-                use_cache=False,
+                **self._sampling_options(),
+                pad_token_id=self._pad_token_id,
+                use_cache=True,  # KVキャッシュで生成済みトークンの再計算を避ける
             )
-        elapsed = time.time() - start_time
-        print(f"Inference time: {elapsed:.2f}s")
+        if timed:
+            logger.debug("Inference time: %.2fs", time.perf_counter() - start_time)
 
         # 入力部分を除いて出力をデコード
-        generated_ids = outputs[0][inputs["input_ids"].shape[1] :]
-        result = self._tokenizer.decode(generated_ids, skip_special_tokens=True)
-
-        return result.strip()
+        results = self._tokenizer.batch_decode(
+            outputs[:, input_ids.shape[1] :], skip_special_tokens=True
+        )
+        return [result.strip() for result in results]
 
     def generate_title(
         self, product_info: ProductInfo, max_new_tokens: int | None = 30
@@ -159,14 +190,9 @@ class StableLMTextGenerator:
         Returns:
             生成されたタイトル
         """
-        input_text = self._build_input_text(product_info)
-        prompt = f"""以下の商品情報から、商品タイトルを生成してください。
-
-{input_text}
-
-商品タイトル:"""
-
-        return self._generate(prompt, max_new_tokens)
+        self._load_model()
+        input_ids = self._encode_prompt(TITLE_TEMPLATE, self._build_input_text(product_info))
+        return self._generate([input_ids], max_new_tokens)[0]
 
     def generate_description(
         self, product_info: ProductInfo, max_new_tokens: int | None = 100
@@ -180,14 +206,10 @@ class StableLMTextGenerator:
         Returns:
             生成された説明
         """
+        self._load_model()
         input_text = self._build_input_text(product_info)
-        prompt = f"""以下の商品情報から、商品説明を生成してください。
-
-{input_text}
-
-商品説明:"""
-
-        return self._generate(prompt, max_new_tokens)
+        input_ids = self._encode_prompt(DESCRIPTION_TEMPLATE, input_text)
+        return self._generate([input_ids], max_new_tokens)[0]
 
     def generate(
         self, product_info: ProductInfo, max_new_tokens: int | None = None
@@ -201,7 +223,16 @@ class StableLMTextGenerator:
         Returns:
             生成されたテキスト
         """
-        title = self.generate_title(product_info, max_new_tokens)
-        description = self.generate_description(product_info, max_new_tokens)
+        self._load_model()
+
+        # タイトルと説明のプロンプトを1バッチにまとめ、プリフィルとデコードを1回で済ませる
+        input_text = self._build_input_text(product_info)
+        title, description = self._generate(
+            [
+                self._encode_prompt(TITLE_TEMPLATE, input_text),
+                self._encode_prompt(DESCRIPTION_TEMPLATE, input_text),
+            ],
+            max_new_tokens,
+        )
 
         return GeneratedText(title=title, description=description)
@@ -4,9 +4,19 @@ from pathlib import Path
 
 import torch
 from peft import PeftModel
-from transformers import AutoModelForCausalLM, AutoTokenizer
+from transformers import PreTrainedModel
 
 from fr_studio.application.text_generator import GeneratedText, ProductInfo
+from fr_studio.infrastructure.lora_text_generator import (
+    DESCRIPTION_TEMPLATE,
+    TITLE_TEMPLATE,
+    LoRATextGenerator,
+    Quantization,
+    cached_model,
+    load_causal_lm,
+    load_tokenizer,
+    quantization_config,
+)
 
 
 COLUMN_LABELS = {
@@ -29,7 +39,7 @@ COLUMN_LABELS = {
 }
 
 
-class SwallowGenerator:
+class SwallowGenerator(LoRATextGenerator):
     """Swallow-7B + LoRAを使用したテキスト生成.
 
     ファインチューニング済みLoRAアダプタを使用して
@@ -41,6 +51,10 @@ class SwallowGenerator:
         adapter_path: str | Path = "models/swallow_lora",
         base_model_name: str = "tokyotech-llm/Swallow-7b-instruct-hf",
         max_new_tokens: int = 256,
+        merge_lora: bool = True,
+        compile_model: bool = True,
+        quantization: Quantization = "none",
+        deterministic: bool = False,
     ) -> None:
         """初期化.
 
@@ -48,13 +62,14 @@ class SwallowGenerator:
             adapter_path: LoRAアダプタのパス
             base_model_name: ベースモデル名
             max_new_tokens: 生成する最大トークン数
+            merge_lora: LoRAの重みをベースモデルに統合するか（推論時の追加の行列積をなくす）
+            compile_model: CUDAでモデルのforwardをtorch.compileするか
+            quantization: CUDAでの重みの量子化方式（"int8"/"nf4"、LoRAの統合とは併用しない）
+            deterministic: サンプリングせず貪欲法で生成するか（同じ入力なら同じ出力になる）
         """
+        super().__init__(max_new_tokens, merge_lora, compile_model, quantization, deterministic)
         self.adapter_path = Path(adapter_path)
         self.base_model_name = base_model_name
-        self.max_new_tokens = max_new_tokens
-
-        self._model: PeftModel | None = None
-        self._tokenizer: AutoTokenizer | None = None
 
     def _load_model(self) -> None:
         """モデルを遅延ロードする."""
@@ -62,30 +77,68 @@ class SwallowGenerator:
             return
 
         # デバイス設定
-        if torch.backends.mps.is_available():
-            device_map = "mps"
-            torch_dtype = torch.float16
-        elif torch.cuda.is_available():
+        if torch.cuda.is_available():
             device_map = "auto"
             torch_dtype = torch.float16
+        elif torch.backends.mps.is_available():
+            device_map = "mps"
+            torch_dtype = torch.float16
         else:
             device_map = "cpu"
             torch_dtype = torch.float32
 
-        self._tokenizer = AutoTokenizer.from_pretrained(self.base_model_name)
-        if self._tokenizer.pad_token is None:
-            self._tokenizer.pad_token = self._tokenizer.eos_token
+        key = (
+            self.base_model_name,
+            str(self.adapter_path.resolve()),
+            device_map,
+            self.merge_lora,
+            self.compile_model,
+            self.quantization,
+        )
+        self._model, self._tokenizer = cached_model(
+            key, lambda: self._load_pretrained(device_map, torch_dtype)
+        )
+        self._device = next(self._model.parameters()).device
+        self._pad_token_id = self._tokenizer.pad_token_id
 
-        base_model = AutoModelForCausalLM.from_pretrained(
+    def _load_pretrained(
+        self, device_map: str, torch_dtype: torch.dtype
+    ) -> tuple[PreTrainedModel | PeftModel, object]:
+        """ベースモデルとLoRAアダプタをロードする.
+
+        Args:
+            device_map: モデルの配置先
+            torch_dtype: モデルの重みのデータ型
+
+        Returns:
+            (モデル, トークナイザー)
+        """
+        tokenizer = load_tokenizer(self.base_model_name)
+        if tokenizer.pad_token is None:
+            tokenizer.pad_token = tokenizer.eos_token
+
+        quantization = quantization_config(self.quantization) if device_map == "auto" else None
+        base_model = load_causal_lm(
             self.base_model_name,
+            "cuda" if device_map == "auto" else device_map,
             device_map=device_map,
             torch_dtype=torch_dtype,
             trust_remote_code=True,
+            quantization_config=quantization,
         )
 
         self._model = PeftModel.from_pretrained(base_model, str(self.adapter_path))
+        # 量子化した重みには統合できないため、量子化時はアダプタのまま使う
+        if self.merge_lora and quantization is None:
+            # 推論専用でアダプタを切り替えないため、A·Bをベースの重みに統合しておく
+            self._model = self._model.merge_and_unload()
         self._model.eval()
 
+        if device_map == "auto":
+            self._optimize_for_cuda()
+
+        return self._model, tokenizer
+
     def _build_input_text(self, product_info: ProductInfo) -> str:
         """商品情報から入力テキストを構築する.
 
@@ -95,46 +148,42 @@ class SwallowGenerator:
         Returns:
             フォーマット済み入力テキスト
         """
-        lines = []
-        for field_name, label in COLUMN_LABELS.items():
-            value = getattr(product_info, field_name, "").strip()
-            if value:
-                lines.append(f"{label}: {value}")
-        return "\n".join(lines)
-
-    def _generate(self, prompt: str) -> str:
+        values = (
+            (label, (getattr(product_info, field_name, "") or "").strip())
+            for field_name, label in COLUMN_LABELS.items()
+        )
+        return "\n".join(f"{label}: {value}" for label, value in values if value)
+
+    def _generate(self, prompts: list[torch.Tensor]) -> list[str]:
         """テキストを生成する.
 
+        複数のプロンプトは1回のgenerateでバッチとして生成する。
+
         Args:
-            prompt: 入力プロンプト
+            prompts: プロンプトのトークンID (1, L) のリスト
 
         Returns:
-            生成されたテキスト
+            プロンプトごとの生成されたテキスト
         """
-        self._load_model()
         assert self._model is not None
         assert self._tokenizer is not None
 
-        inputs = self._tokenizer(prompt, return_tensors="pt")
-
-        # デバイスに移動
-        device = next(self._model.parameters()).device
-        inputs = {k: v.to(device) for k, v in inputs.items()}
+        input_ids, attention_mask = self._left_pad(prompts)
 
-        with torch.no_grad():
+        with torch.inference_mode():
             outputs = self._model.generate(
-                **inputs,
+                input_ids=input_ids,
+                attention_mask=attention_mask,
                 max_new_tokens=self.max_new_tokens,
-                do_sample=True,
-                temperature=0.7,
-                top_p=0.9,
-                pad_token_id=self._tokenizer.pad_token_id,
+                **self._sampling_options(),
+                pad_token_id=self._pad_token_id,
             )
 
-        generated: str = self._tokenizer.decode(outputs[0], skip_special_tokens=True)
-        response = generated[len(prompt) :].strip()
-
-        return response
+        # 入力部分を除いて出力をデコード
+        generated: list[str] = self._tokenizer.batch_decode(
+            outputs[:, input_ids.shape[1] :], skip_special_tokens=True
+        )
+        return [text.strip() for text in generated]
 
     def generate_title(self, product_info: ProductInfo) -> str:
         """商品タイトルを生成する.
@@ -145,14 +194,9 @@ class SwallowGenerator:
         Returns:
             生成されたタイトル
         """
-        input_text = self._build_input_text(product_info)
-        prompt = f"""以下の商品情報から、商品タイトルを生成してください。
-
-{input_text}
-
-商品タイトル:"""
-
-        return self._generate(prompt)
+        self._load_model()
+        input_ids = self._encode_prompt(TITLE_TEMPLATE, self._build_input_text(product_info))
+        return self._generate([input_ids])[0]
 
     def generate_description(self, product_info: ProductInfo) -> str:
         """商品説明を生成する.
@@ -163,14 +207,10 @@ class SwallowGenerator:
         Returns:
             生成された説明
         """
+        self._load_model()
         input_text = self._build_input_text(product_info)
-        prompt = f"""以下の商品情報から、商品説明を生成してください。
-
-{input_text}
-
-商品説明:"""
-
-        return self._generate(prompt)
+        input_ids = self._encode_prompt(DESCRIPTION_TEMPLATE, input_text)
+        return self._generate([input_ids])[0]
 
     def generate(self, product_info: ProductInfo) -> GeneratedText:
         """タイトルと説明を両方生成する.
@@ -181,7 +221,15 @@ class SwallowGenerator:
         Returns:
             生成されたテキスト
         """
-        title = self.generate_title(product_info)
-        description = self.generate_description(product_info)
+        self._load_model()
+
+        # タイトルと説明のプロンプトを1バッチにまとめ、プリフィルとデコードを1回で済ませる
+        input_text = self._build_input_text(product_info)
+        title, description = self._generate(
+            [
+                self._encode_prompt(TITLE_TEMPLATE, input_text),
+                self._encode_prompt(DESCRIPTION_TEMPLATE, input_text),
+            ]
+        )
 
         return GeneratedText(title=title, description=description)